@@ -1,10 +1,17 @@
 """Generate test cases from OpenAPI schemas."""
 
 import re
-from itertools import product
+from itertools import combinations, product
 
 from .schema import primary_type, resolve_schema
 
+DEFAULT_COMBINATION_STRENGTH = 2
+DEFAULT_MAX_COMBINATIONS = 10
+
+# Object combination settings, set once per session by the plugin
+_combination_strength = DEFAULT_COMBINATION_STRENGTH
+_max_combinations = DEFAULT_MAX_COMBINATIONS
+
 _INVALID_FORMAT_VALUES = {
     "email": [
         "user name@domain.com",
@@ -68,6 +75,235 @@ def generate_invalid_enum_value(schema):
         return "invalid_value"
 
 
+def configure_combinations(
+    strength=DEFAULT_COMBINATION_STRENGTH,
+    max_combinations=DEFAULT_MAX_COMBINATIONS,
+):
+    """Set how object property values are combined into test objects.
+
+    Args:
+        strength: Covering-array strength t; every combination of values
+            of any t properties appears in at least one generated object
+        max_combinations: Maximum number of combined objects generated
+            per object schema
+
+    Raises:
+        ValueError: If either setting is less than 1
+    """
+    global _combination_strength, _max_combinations
+
+    if strength < 1:
+        raise ValueError(f"Strength must be at least 1, got {strength}")
+    if max_combinations < 1:
+        raise ValueError(
+            f"Maximum combinations must be at least 1, got {max_combinations}"
+        )
+    _combination_strength = strength
+    _max_combinations = max_combinations
+
+
+def covering_array(sizes, strength=2, budget=None):
+    """Build a t-wise covering array over value indices, greedily.
+
+    Every combination of values of any *strength* parameters appears in
+    at least one row, using far fewer rows than the full product. Rows are
+    added one at a time, each seeded with the first still-uncovered tuple
+    and completed by picking, parameter by parameter, the value that
+    covers the most new tuples (lowest index on ties), so the result is
+    deterministic and the first row is all zeros.
+
+    Args:
+        sizes: Number of values of each parameter
+        strength: Interaction strength t (capped at the number of
+            parameters)
+        budget: Maximum number of rows; the rows that cover the most
+            tuples come first, so a truncated array still covers as much
+            as possible. None means no limit.
+
+    Returns:
+        list: Rows as tuples of value indices, one index per parameter
+    """
+    k = len(sizes)
+    if k == 0:
+        return [()]
+    if not all(sizes):
+        return []
+    strength = min(strength, k)
+
+    param_sets = list(combinations(range(k), strength))
+    sets_with = [[ps for ps in param_sets if p in ps] for p in range(k)]
+    # Only the tuples covered so far are stored, so memory grows with the
+    # rows built rather than with the number of tuples. Seeds are
+    # generated lazily in sorted order, skipping covered tuples.
+    covered = set()
+    seeds = (
+        (ps, values)
+        for ps in param_sets
+        for values in product(*(range(sizes[p]) for p in ps))
+    )
+
+    rows = []
+    while budget is None or len(rows) < budget:
+        seed = next((s for s in seeds if s not in covered), None)
+        if seed is None:
+            break
+        seed_params, seed_values = seed
+
+        row = [None] * k
+        for p, v in zip(seed_params, seed_values):
+            row[p] = v
+
+        for p in range(k):
+            if row[p] is not None:
+                continue
+            best_value, best_gain = 0, -1
+            for v in range(sizes[p]):
+                row[p] = v
+                gain = 0
+                for ps in sets_with[p]:
+                    values = tuple(row[q] for q in ps)
+                    if None not in values and (ps, values) not in covered:
+                        gain += 1
+                if gain > best_gain:
+                    best_value, best_gain = v, gain
+            row[p] = best_value
+
+        for ps in param_sets:
+            covered.add((ps, tuple(row[q] for q in ps)))
+        rows.append(tuple(row))
+
+    return rows
+
+
+def make_case_record(
+    value, origin="generated", rule=None, path=None, intent=None
+):
+    """Create a test case record.
+
+    Args:
+        value: The request value to send
+        origin: 'example' or 'generated'
+        rule: Negative-case rule the value breaks (one of ``CASE_RULES``),
+            or None for a value the API should accept
+        path: Dot-separated path of the offending value within *value*
+            ("" for the value itself), or None when *rule* is None
+        intent: "boundary" for a value that sits on a declared edge of
+            its schema (see ``BOUNDARY_KEYWORDS``) or contains one, else
+            None
+
+    Returns:
+        dict: Record with ``value``, ``origin``, ``expected`` ("accept" or
+            "reject"), ``path``, ``rule`` and ``intent`` keys
+    """
+    return {
+        "value": value,
+        "origin": origin,
+        "expected": "reject" if rule else "accept",
+        "path": path,
+        "rule": rule,
+        "intent": intent,
+    }
+
+
+# Negative-case rules, in order of precedence when a value breaks several
+CASE_RULES = ("invalid_enum", "invalid_format")
+
+
+def _leaf_rule(schema, value):
+    """Return the rule a generated scalar breaks, or None."""
+    if "enum" in schema:
+        if not isinstance(value, (dict, list)) and value not in schema["enum"]:
+            return "invalid_enum"
+    if primary_type(schema.get("type")) == "string" and isinstance(value, str):
+        invalid_values = _INVALID_FORMAT_VALUES.get(schema.get("format"))
+        if invalid_values and value in invalid_values:
+            return "invalid_format"
+    return None
+
+
+# Schema keywords whose edges generated values are tagged as boundaries on
+BOUNDARY_KEYWORDS = (
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "minLength",
+    "maxLength",
+    "minItems",
+    "maxItems",
+)
+
+
+def _declared(schema, keyword):
+    """Return whether *schema* sets the numeric constraint *keyword*."""
+    value = schema.get(keyword)
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _leaf_boundaries(schema, values):
+    """Return the generated scalars that sit on a declared edge.
+
+    Numbers are on an edge when they are the lowest or highest value
+    generated under a declared minimum or maximum (exclusive or not);
+    strings when their length is a declared minLength or maxLength.
+    """
+    boundaries = []
+    numbers = [
+        v
+        for v in values
+        if isinstance(v, (int, float)) and not isinstance(v, bool)
+    ]
+    if numbers:
+        if _declared(schema, "minimum") or _declared(
+            schema, "exclusiveMinimum"
+        ):
+            boundaries.append(min(numbers))
+        if _declared(schema, "maximum") or _declared(
+            schema, "exclusiveMaximum"
+        ):
+            boundaries.append(max(numbers))
+    for keyword in ("minLength", "maxLength"):
+        if _declared(schema, keyword):
+            boundaries.extend(
+                v
+                for v in values
+                if isinstance(v, str) and len(v) == schema[keyword]
+            )
+    return boundaries
+
+
+def _join_path(step, path):
+    """Prefix a child *path* with the property name or ``[i]`` *step*."""
+    if not path:
+        return step
+    return f"{step}{path}" if path.startswith("[") else f"{step}.{path}"
+
+
+def _compose_record(value, children, intent=None):
+    """Build the record for a composite value from its children.
+
+    Args:
+        value: The composite (object or array) value
+        children: List of (step, record) pairs, where step is a property
+            name or ``[i]``
+        intent: Intent of the composite value itself, if any
+
+    Returns:
+        dict: Generated case record carrying the highest-precedence rule
+            found among the children, or a boundary intent if the value
+            or one of its children is a boundary
+    """
+    for rule in CASE_RULES:
+        for step, child in children:
+            if child["rule"] == rule:
+                return make_case_record(
+                    value, rule=rule, path=_join_path(step, child["path"])
+                )
+    if any(child["intent"] == "boundary" for _, child in children):
+        intent = "boundary"
+    return make_case_record(value, intent=intent)
+
+
 def generate_string_test_cases(schema, valid_only=False):
     """Generate string test cases from schema.
 
@@ -443,12 +679,18 @@ def generate_array_test_cases(schema, field_name="field", spec=None):
     Returns:
         tuple: (list of test arrays, optional warning message)
     """
+    records, warning = _generate_array_records(schema, field_name, spec)
+    return [record["value"] for record in records], warning
+
+
+def _generate_array_records(schema, field_name="field", spec=None):
+    """Record-producing body of ``generate_array_test_cases``."""
     items_schema = schema.get("items", {})
     min_items = schema.get("minItems", 0)
     max_items = schema.get("maxItems", 3)
 
     # Generate test cases for the item type
-    item_test_cases, warning = generate_test_cases_for_schema(
+    item_records, warning = generate_test_case_records(
         items_schema, f"{field_name}[]", spec
     )
 
@@ -459,18 +701,32 @@ def generate_array_test_cases(schema, field_name="field", spec=None):
         arrays.append([])
 
     # Single item array if allowed
-    if min_items <= 1 <= max_items and item_test_cases:
-        arrays.append([item_test_cases[0]])
+    if min_items <= 1 <= max_items and item_records:
+        arrays.append([item_records[0]])
 
     # Min items array
-    if min_items > 0 and item_test_cases:
-        arrays.append(item_test_cases[:min_items])
+    if min_items > 0 and item_records:
+        arrays.append(item_records[:min_items])
 
     # Max items array
-    if item_test_cases:
-        arrays.append(item_test_cases[:max_items])
-
-    return arrays, warning
+    if item_records:
+        arrays.append(item_records[:max_items])
+
+    # Lengths on a declared minItems/maxItems edge
+    edges = {
+        schema[keyword]
+        for keyword in ("minItems", "maxItems")
+        if _declared(schema, keyword)
+    }
+    records = [
+        _compose_record(
+            [item["value"] for item in items],
+            [(f"[{i}]", item) for i, item in enumerate(items)],
+            intent="boundary" if len(items) in edges else None,
+        )
+        for items in arrays
+    ]
+    return records, warning
 
 
 def generate_object_test_cases(schema, field_name="field", spec=None):
@@ -484,6 +740,12 @@ def generate_object_test_cases(schema, field_name="field", spec=None):
     Returns:
         tuple: (list of test objects, list of warnings)
     """
+    records, warnings = _generate_object_records(schema, field_name, spec)
+    return [record["value"] for record in records], warnings
+
+
+def _generate_object_records(schema, field_name="field", spec=None):
+    """Record-producing body of ``generate_object_test_cases``."""
     properties = schema.get("properties", {})
     required_props = set(schema.get("required", []))
 
@@ -491,35 +753,32 @@ def generate_object_test_cases(schema, field_name="field", spec=None):
 
     # Collect test cases for each property (valid values only, to avoid
     # generating request bodies that the server will reject with 400/422)
-    prop_values = {}
+    prop_records = {}
     for prop_name, prop_schema in properties.items():
-        prop_test_cases, warning = generate_test_cases_for_schema(
+        records, warning = generate_test_case_records(
             prop_schema, f"{field_name}.{prop_name}", spec, valid_only=True
         )
         if warning:
             warnings.append(warning)
         # Ensure we have at least one value
-        prop_values[prop_name] = prop_test_cases or [None]
-
-    # Create a bounded Cartesian product of property values to produce
-    # multiple objects. Limit the total generated objects to avoid explosion.
-    MAX_COMBINATIONS = 10
-    keys = list(prop_values.keys())
-    # Build iterables in a deterministic order
-    iterables = [prop_values[k] for k in keys]
-
-    combos = []
-    for combo in product(*iterables):
-        obj = {}
-        for k, v in zip(keys, combo):
-            obj[k] = v
-        combos.append(obj)
-        if len(combos) >= MAX_COMBINATIONS:
-            break
+        prop_records[prop_name] = records or [make_case_record(None)]
+
+    # Combine property values with a bounded t-wise covering array, so
+    # that every pair (by default) of property values is sent at least
+    # once instead of only varying the last properties of a product
+    keys = list(prop_records.keys())
+    rows = covering_array(
+        [len(prop_records[k]) for k in keys],
+        strength=_combination_strength,
+        budget=_max_combinations,
+    )
+    combos = [
+        [(k, prop_records[k][i]) for k, i in zip(keys, row)] for row in rows
+    ]
 
     # If no combos generated, fall back to one empty object
     if not combos:
-        combos = [{}]
+        combos = [[]]
 
     # Append one format-invalid object per REQUIRED format-constrained property.
     # Required fields must always be present and are the most likely to be
@@ -532,11 +791,18 @@ def generate_object_test_cases(schema, field_name="field", spec=None):
         resolved = resolve_schema(spec, prop_schema)
         fmt = resolved.get("format")
         if fmt and fmt in _INVALID_FORMAT_VALUES:
-            invalid_obj = dict(base)
-            invalid_obj[prop_name] = _INVALID_FORMAT_VALUES[fmt][0]
-            combos.append(invalid_obj)
+            invalid = make_case_record(
+                _INVALID_FORMAT_VALUES[fmt][0], rule="invalid_format", path=""
+            )
+            combos.append(
+                [(k, invalid if k == prop_name else child) for k, child in base]
+            )
 
-    return combos, warnings
+    records = [
+        _compose_record({k: child["value"] for k, child in combo}, combo)
+        for combo in combos
+    ]
+    return records, warnings
 
 
 def generate_test_cases_for_schema(
@@ -554,24 +820,68 @@ def generate_test_cases_for_schema(
         tuple: (list of test values, optional warning message or
         list of warnings)
     """
+    records, warnings = generate_test_case_records(
+        schema, field_name, spec, valid_only
+    )
+    return [record["value"] for record in records], warnings
+
+
+def generate_test_case_records(
+    schema, field_name="field", spec=None, valid_only=False
+):
+    """Generate test case records for any schema type.
+
+    Produces the same values, in the same order, as
+    ``generate_test_cases_for_schema``, but each one is wrapped in a record
+    (see ``make_case_record``) that says whether it is meant to be rejected
+    and which rule it breaks at which path, or whether it sits on a
+    declared edge of the schema. Negative and boundary cases are tagged as
+    they are generated, so nothing has to re-walk them against the schema.
+
+    Args:
+        schema: OpenAPI schema
+        field_name: Name of the field (for error messages)
+        spec: Full OpenAPI spec dict for $ref resolution
+        valid_only: If True, omit invalid/negative test values
+
+    Returns:
+        tuple: (list of case records, optional warning message or
+        list of warnings)
+    """
     schema = resolve_schema(spec, schema)
     schema_type = primary_type(schema.get("type", "string")) or "string"
 
+    if schema_type == "array":
+        return _generate_array_records(schema, field_name, spec)
+    if schema_type == "object":
+        return _generate_object_records(schema, field_name, spec)
+
+    warning = None
     if schema_type == "string":
-        return generate_string_test_cases(schema, valid_only=valid_only), None
+        values = generate_string_test_cases(schema, valid_only=valid_only)
     elif schema_type == "integer":
-        return generate_integer_test_cases(
+        values, warning = generate_integer_test_cases(
             schema, field_name, valid_only=valid_only
         )
     elif schema_type == "number":
-        return generate_number_test_cases(
+        values, warning = generate_number_test_cases(
             schema, field_name, valid_only=valid_only
         )
     elif schema_type == "boolean":
-        return generate_boolean_test_cases(schema), None
-    elif schema_type == "array":
-        return generate_array_test_cases(schema, field_name, spec)
-    elif schema_type == "object":
-        return generate_object_test_cases(schema, field_name, spec)
+        values = generate_boolean_test_cases(schema)
     else:
-        return ["test-value"], None
+        values = ["test-value"]
+
+    boundaries = _leaf_boundaries(schema, values)
+    records = []
+    for value in values:
+        rule = _leaf_rule(schema, value)
+        records.append(
+            make_case_record(
+                value,
+                rule=rule,
+                path="" if rule else None,
+                intent="boundary" if value in boundaries else None,
+            )
+        )
+    return records, warning
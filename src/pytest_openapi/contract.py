@@ -1,25 +1,100 @@
 """OpenAPI contract testing - execute tests against live endpoints."""
 
+import hashlib
+import io
 import json
 import re
+import threading
+import time
+from contextlib import contextmanager
 
 import requests
 
 from .case_generator import (
     _INVALID_FORMAT_VALUES,
+    CASE_RULES,
     generate_test_cases_for_schema,
+    make_case_record,
 )
+from .latency import (
+    RESAMPLE_METHODS,
+    get_latency_report_markdown,
+    latency_budget_error,
+    latency_budget_ms,
+)
+from .records import bound_record
+from .response import CachedResponse
 from .schema import primary_type, resolve_schema
+from .session import connection_timer, get_session
+from .streaming import (
+    make_chunk_validator,
+    read_stream,
+    stream_format,
+    stream_item_schema,
+)
+from .validator import get_validator
 
 # Global list to store test reports
 test_reports = []
 
+# Per-thread state; lets concurrent checks capture their own records
+_context = threading.local()
+
+
+@contextmanager
+def captured_test_results():
+    """Collect records logged by the current thread into a private list.
+
+    While active, ``log_test_result`` appends to the yielded list instead
+    of the global ``test_reports``. This lets checks run concurrently in
+    worker threads and have their records replayed later, in test order.
+
+    Yields:
+        list: The records logged by this thread while the context is open
+    """
+    previous = getattr(_context, "records", None)
+    records = []
+    _context.records = records
+    try:
+        yield records
+    finally:
+        _context.records = previous
+
+
+def read_streaming_response(response, on_chunk=None):
+    """Consume a streaming response and complete its request timing.
+
+    The body is read incrementally (see ``streaming.read_stream``). The
+    timing kept for the current thread gains the time to the first event,
+    the largest gap between events and the event count, and its total
+    time and size cover the whole stream.
+
+    Args:
+        response: requests.Response with a streaming content-type
+        on_chunk: Optional per-item callback, see ``streaming.read_stream``
+
+    Returns:
+        dict: Stream result from ``streaming.read_stream``
+    """
+    timing = getattr(_context, "timing", None)
+    started = getattr(_context, "request_started", None)
+    result = read_stream(response, started=started, on_chunk=on_chunk)
+    if timing is not None:
+        timing["total_ms"] = round(result["total_ms"], 3)
+        timing["size_bytes"] = result["bytes"]
+        timing["events"] = result["events"]
+        for key in ("first_event_ms", "max_gap_ms"):
+            if result[key] is not None:
+                timing[key] = round(result[key], 3)
+    return result
+
 
 def collect_streaming_response(response):
     """Collect and parse streaming response content into a structured
     form.
 
-    Reads the buffered response text and parses SSE or NDJSON chunks.
+    Reads SSE events or NDJSON lines as they arrive, stopping at a
+    ``[DONE]`` event or at the configured byte and event caps.
 
     Args:
         response: requests.Response object with a streaming content-type
@@ -27,48 +102,19 @@ def collect_streaming_response(response):
     Returns:
         list or str: List of parsed chunks for SSE/NDJSON, raw text otherwise
     """
-    content_type = response.headers.get("Content-Type", "").lower()
-    text = response.text
-
-    if "text/event-stream" in content_type:
-        chunks = []
-        for line in text.splitlines():
-            line = line.strip()
-            if line.startswith("data:"):
-                data = line[5:].strip()
-                if not data:
-                    continue
-                if data == "[DONE]":
-                    chunks.append("[DONE]")
-                else:
-                    try:
-                        chunks.append(json.loads(data))
-                    except (json.JSONDecodeError, ValueError):
-                        chunks.append(data)
-        return chunks if chunks else text
-
-    if (
-        "application/x-ndjson" in content_type
-        or "application/stream+json" in content_type
-    ):
-        chunks = []
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                chunks.append(json.loads(line))
-            except (json.JSONDecodeError, ValueError):
-                chunks.append(line)
-        return chunks if chunks else text
-
-    return text
+    if stream_format(response.headers.get("Content-Type", "")) is None:
+        return response.text
+    result = read_streaming_response(response)
+    return result["chunks"] if result["events"] else result["text"]
 
 
 def make_request(method, url, json=None, timeout=10):
     """Wrapper for HTTP requests that logs all requests and responses
     for reporting.
 
+    The timing of the request is kept for the current thread and attached
+    to the next record logged with ``log_test_result``.
+
     Args:
         method: HTTP method (GET, POST, PUT, DELETE)
         url: Full URL to request
@@ -76,21 +122,137 @@ def make_request(method, url, json=None, timeout=10):
         timeout: Request timeout in seconds
 
     Returns:
-        requests.Response object
+        CachedResponse: The response, with its text and JSON body decoded
+            at most once
     """
-    # Make the actual request
-    if method.upper() == "GET":
-        response = requests.get(url, timeout=timeout)
-    elif method.upper() == "POST":
-        response = requests.post(url, json=json, timeout=timeout)
-    elif method.upper() == "PUT":
-        response = requests.put(url, json=json, timeout=timeout)
-    elif method.upper() == "DELETE":
-        response = requests.delete(url, timeout=timeout)
-    else:
-        raise ValueError(f"Unsupported HTTP method: {method}")
+    _context.timing = None
+
+    # Reuse the pooled connection to the target server
+    session = get_session(url)
+
+    # Make the actual request. Bodies are streamed so that SSE/NDJSON
+    # responses can be consumed incrementally; other bodies are read
+    # right away.
+    start = time.perf_counter()
+    with connection_timer() as timer:
+        if method.upper() == "GET":
+            response = session.get(url, timeout=timeout, stream=True)
+        elif method.upper() == "POST":
+            response = session.post(
+                url, json=json, timeout=timeout, stream=True
+            )
+        elif method.upper() == "PUT":
+            response = session.put(url, json=json, timeout=timeout, stream=True)
+        elif method.upper() == "DELETE":
+            response = session.delete(url, timeout=timeout, stream=True)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        ttfb = response.elapsed.total_seconds()
+        if stream_format(response.headers.get("Content-Type", "")):
+            # Completed by read_streaming_response
+            size = 0
+        else:
+            size = len(response.content)
+    total = time.perf_counter() - start
+
+    _context.request_started = start
+    _context.timing = make_timing(
+        connect=timer["connect"],
+        ttfb=ttfb,
+        total=total,
+        size=size,
+    )
+    return CachedResponse(response)
+
+
+def make_timing(connect, ttfb, total, size):
+    """Create the timing record attached to a test result.
+
+    Args:
+        connect: Seconds spent opening a new connection (0 when a pooled
+            connection was reused)
+        ttfb: Seconds until the response headers were received
+        total: Seconds until the whole response body was read
+        size: Response body size in bytes
+
+    Returns:
+        dict: Timing record with millisecond durations
+    """
+    return {
+        "connect_ms": round(connect * 1000, 3),
+        "ttfb_ms": round(ttfb * 1000, 3),
+        "total_ms": round(total * 1000, 3),
+        "size_bytes": size,
+    }
+
+
+def check_latency_budget(
+    method,
+    url,
+    operation,
+    status_code,
+    request_body=None,
+    timeout=10,
+    max_latency_ms=None,
+    latency_samples=1,
+):
+    """Check the time of the last request against its latency budget.
+
+    When the first response is over budget and *latency_samples* is
+    greater than 1, idempotent requests (GET, PUT) are sent again and the
+    median time is compared instead, so one slow outlier does not fail
+    the case. POST and DELETE are measured once and never re-sent.
+    Streaming responses are judged on the time to read the whole stream
+    (up to the stream caps), so they must have been read already.
+
+    Args:
+        method: HTTP method of the request
+        url: Full URL of the request
+        operation: OpenAPI operation object
+        status_code: Status code of the response
+        request_body: JSON body of the request, if any
+        timeout: Request timeout in seconds
+        max_latency_ms: Budget used when the spec declares none
+        latency_samples: Number of measurements taken for a slow response
+
+    Returns:
+        str or None: Error message if the response was too slow
+    """
+    budget = latency_budget_ms(operation, status_code, max_latency_ms)
+    timing = getattr(_context, "timing", None)
+    if budget is None or timing is None:
+        return None
+
+    samples = [timing["total_ms"]]
+    if samples[0] > budget and method.upper() in RESAMPLE_METHODS:
+        for _ in range(latency_samples - 1):
+            try:
+                response = make_request(
+                    method, url, json=request_body, timeout=timeout
+                )
+            except requests.exceptions.RequestException:
+                break
+            samples.append(_resample_time_ms(response))
+        # The record keeps the first response's timing
+        _context.timing = dict(timing, samples_ms=samples)
+
+    return latency_budget_error(samples, budget)
 
-    return response
+
+def _resample_time_ms(response):
+    """Return the time of a re-sent request and release its connection.
+
+    Measured like the first response: to the end of the body, which for a
+    stream means reading it through (up to the stream caps).
+    """
+    if stream_format(response.headers.get("Content-Type", "")):
+        result = read_stream(
+            response, started=getattr(_context, "request_started", None)
+        )
+        return result["total_ms"]
+    response.close()
+    return _context.timing["total_ms"]
 
 
 def log_test_result(
@@ -105,6 +267,7 @@ def log_test_result(
     error_message=None,
     test_case_origin=None,
     documented_statuses=None,
+    operation_path=None,
 ):
     """Log a test result for the final report.
 
@@ -119,6 +282,9 @@ def log_test_result(
         success: Whether the test passed
         error_message: Error message if test failed
         test_case_origin: Origin of test case ('example' or 'generated')
+        documented_statuses: Status codes the spec documents
+        operation_path: Path template of the operation, when *path* has
+            its parameters filled in (defaults to *path*)
     """
     report = {
         "method": method,
@@ -137,7 +303,17 @@ def log_test_result(
     report["documented_statuses"] = (
         list(documented_statuses) if documented_statuses else []
     )
-    test_reports.append(report)
+    # Operations are keyed by their path template, not by the URL sent
+    report["operation_path"] = operation_path or path
+    # Timing of the request this result is about, if one was sent
+    report["timing"] = getattr(_context, "timing", None)
+    _context.timing = None
+    bound_record(report)
+    captured = getattr(_context, "records", None)
+    if captured is not None:
+        captured.append(report)
+    else:
+        test_reports.append(report)
 
 
 def get_test_report():
@@ -222,81 +398,142 @@ def get_test_report():
     return "\n".join(report_lines)
 
 
-def get_test_report_markdown():
+def get_test_report_markdown(records=None, **options):
     """Generate a Markdown-formatted test report.
 
+    Args:
+        records: Optional iterable of full records, in test order (see
+            ``write_test_report_markdown``)
+        **options: Rendering options of ``write_test_report_markdown``
+
     Returns:
         str: Markdown formatted report of all tests
     """
     if not test_reports:
         return "No tests have been run yet."
+    out = io.StringIO()
+    write_test_report_markdown(out, records, **options)
+    return out.getvalue()
+
+
+def _format_json(value, max_bytes=None):
+    """Pretty-print *value* as JSON, cut after *max_bytes* UTF-8 bytes.
+
+    The JSON is encoded piece by piece, so a huge body is never formatted
+    in full just to be cut. The cut falls on a character boundary.
+
+    Raises:
+        TypeError, ValueError: If *value* cannot be encoded as JSON
+    """
+    if max_bytes is None:
+        return json.dumps(value, indent=2)
+    parts = []
+    size = 0
+    for part in json.JSONEncoder(indent=2).iterencode(value):
+        parts.append(part)
+        size += len(part.encode("utf-8"))
+        if size > max_bytes:
+            data = "".join(parts).encode("utf-8")[:max_bytes]
+            text = data.decode("utf-8", errors="ignore")
+            return f"{text}\n... (truncated at {max_bytes} bytes)"
+    return "".join(parts)
+
+
+def _format_body(body, max_bytes=None):
+    if body == "" or body is None:
+        return None
+    try:
+        return _format_json(body, max_bytes)
+    except (TypeError, ValueError):
+        return str(body)
 
-    report_lines = []
-    report_lines.append("# OpenAPI Contract Test Report")
-    report_lines.append("")
+
+def write_test_report_markdown(
+    out,
+    records=None,
+    omit_passing_bodies=False,
+    collapse_expected=False,
+    max_json_bytes=None,
+):
+    """Write the Markdown test report to *out*, one test at a time.
+
+    Nothing is accumulated: each test's section is written as soon as it
+    is rendered, so memory does not grow with the size of the report.
+
+    The summary and latency sections are computed from ``test_reports``.
+    The per-test sections are rendered from *records* when given, for
+    example a records file read back one record at a time, whose bodies
+    are no longer held in memory.
+
+    Args:
+        out: Text file object the report is written to
+        records: Optional iterable of full records, in test order
+        omit_passing_bodies: Leave out the request and response bodies of
+            passing tests
+        collapse_expected: Render each distinct expected body once and
+            refer back to it from later tests
+        max_json_bytes: Cut pretty-printed JSON bodies after this many
+            bytes, or None for no limit
+    """
+    if not test_reports:
+        out.write("No tests have been run yet.")
+        return
+
+    def write(*lines):
+        out.write("\n".join(lines))
+        out.write("\n")
+
+    write("# OpenAPI Contract Test Report", "")
 
     # Summary statistics
     total_tests = len(test_reports)
     passed_tests = sum(1 for test in test_reports if test["success"])
     failed_tests = total_tests - passed_tests
 
-    report_lines.append("## Summary")
-    report_lines.append("")
-    report_lines.append(f"- **Total Tests:** {total_tests}")
-    report_lines.append(f"- **Passed:** ✅ {passed_tests}")
-    report_lines.append(f"- **Failed:** ❌ {failed_tests}")
-    report_lines.append("")
-    report_lines.append("---")
-    report_lines.append("")
+    write(
+        "## Summary",
+        "",
+        f"- **Total Tests:** {total_tests}",
+        f"- **Passed:** ✅ {passed_tests}",
+        f"- **Failed:** ❌ {failed_tests}",
+        "",
+        *get_latency_report_markdown(test_reports),
+    )
+    write("---", "")
 
-    for i, test in enumerate(test_reports, 1):
+    # SHA-256 of each distinct expected body -> number of its first test
+    seen_expected = {}
+
+    if records is None:
+        records = test_reports
+    for i, test in enumerate(records, 1):
+        # A separator line follows every test except the last one
+        if i > 1:
+            write("")
         status_symbol = "✅" if test["success"] else "❌"
-        report_lines.append(f"## Test #{i} {status_symbol}")
-        report_lines.append("")
+        write(f"## Test #{i} {status_symbol}", "")
 
         # Display test case origin if available
         if test.get("test_case_origin"):
             origin = test["test_case_origin"]
             if origin == "example":
-                report_lines.append("📋 *Test case from OpenAPI example*")
+                write("📋 *Test case from OpenAPI example*")
             elif origin == "generated":
-                report_lines.append("🔧 *Test case generated from schema*")
-            report_lines.append("")
+                write("🔧 *Test case generated from schema*")
+            write("")
 
-        report_lines.append(
-            f"**Endpoint:** `{test['method'].upper()} {test['path']}`"
-        )
-        report_lines.append("")
+        write(f"**Endpoint:** `{test['method'].upper()} {test['path']}`", "")
 
-        if test["request_body"] is not None:
-            formatted_request = json.dumps(test["request_body"], indent=2)
-            report_lines.append("### Request Body")
-            report_lines.append("")
-            report_lines.append("```json")
-            report_lines.append(formatted_request)
-            report_lines.append("```")
-            report_lines.append("")
-
-        # Format expected body
-        if test["expected_body"] == "" or test["expected_body"] is None:
-            expected_body_str = "*(empty)*"
-        else:
-            try:
-                expected_body_str = json.dumps(test["expected_body"], indent=2)
-            except (TypeError, ValueError):
-                expected_body_str = str(test["expected_body"])
+        show_bodies = test["success"] is False or not omit_passing_bodies
 
-        # Format actual body
-        if test["actual_body"] == "" or test["actual_body"] is None:
-            actual_body_str = "*(empty)*"
-        else:
-            try:
-                actual_body_str = json.dumps(test["actual_body"], indent=2)
-            except (TypeError, ValueError):
-                actual_body_str = str(test["actual_body"])
+        if show_bodies and test["request_body"] is not None:
+            formatted_request = _format_json(
+                test["request_body"], max_json_bytes
+            )
+            write("### Request Body", "", "```json", formatted_request, "```")
+            write("")
 
-        report_lines.append("### Expected Response")
-        report_lines.append("")
+        write("### Expected Response", "")
         # Include documented statuses (for example, 501) alongside
         # primary expected status
         documented = test.get("documented_statuses", []) or []
@@ -305,40 +542,148 @@ def get_test_report_markdown():
             str(s) for s in documented if s != expected_primary
         ]
         expected_display = " or ".join(statuses)
-        report_lines.append(f"**Status:** `{expected_display}`")
-        report_lines.append("")
-        if expected_body_str != "*(empty)*":
-            report_lines.append("```json")
-            report_lines.append(expected_body_str)
-            report_lines.append("```")
-        else:
-            report_lines.append(expected_body_str)
-        report_lines.append("")
-
-        report_lines.append("### Actual Response")
-        report_lines.append("")
-        report_lines.append(f"**Status:** `{test['actual_status']}`")
-        report_lines.append("")
-        if actual_body_str != "*(empty)*":
-            report_lines.append("```json")
-            report_lines.append(actual_body_str)
-            report_lines.append("```")
-        else:
-            report_lines.append(actual_body_str)
-        report_lines.append("")
+        write(f"**Status:** `{expected_display}`", "")
+        if show_bodies:
+            expected_body_str = _format_body(
+                test["expected_body"], max_json_bytes
+            )
+            if expected_body_str is None:
+                write("*(empty)*")
+            else:
+                first = None
+                if collapse_expected:
+                    # Compare full bodies, not the possibly cut rendering
+                    full = json.dumps(test["expected_body"], default=str)
+                    digest = hashlib.sha256(full.encode("utf-8")).hexdigest()
+                    first = seen_expected.setdefault(digest, i)
+                if first is not None and first != i:
+                    write(f"*Same as Test #{first}*")
+                else:
+                    write("```json", expected_body_str, "```")
+            write("")
+
+        write("### Actual Response", "")
+        write(f"**Status:** `{test['actual_status']}`", "")
+        if show_bodies:
+            actual_body_str = _format_body(test["actual_body"], max_json_bytes)
+            if actual_body_str is None:
+                write("*(empty)*")
+            else:
+                write("```json", actual_body_str, "```")
+            write("")
 
         if not test["success"] and test["error_message"]:
-            report_lines.append("### ❌ Error")
-            report_lines.append("")
-            report_lines.append("```")
-            report_lines.append(test["error_message"])
-            report_lines.append("```")
-            report_lines.append("")
+            write("### ❌ Error", "", "```", test["error_message"], "```", "")
 
-        report_lines.append("---")
-        report_lines.append("")
+        out.write("---\n")
 
-    return "\n".join(report_lines)
+
+def _classify(schema, data, path, spec, found):
+    """Walk *schema* and *data* together, appending offending paths to
+    *found*."""
+    if not isinstance(schema, dict):
+        return
+
+    schema = resolve_schema(spec, schema)
+    schema_type = primary_type(schema.get("type"))
+
+    if "enum" in schema:
+        if not isinstance(data, (dict, list)) and data not in schema["enum"]:
+            found["invalid_enum"].append(path)
+
+    if schema_type == "string" and isinstance(data, str):
+        invalid_values = _INVALID_FORMAT_VALUES.get(schema.get("format"))
+        if invalid_values and data in invalid_values:
+            found["invalid_format"].append(path)
+
+    elif schema_type == "object" and isinstance(data, dict):
+        properties = schema.get("properties", {})
+        for prop, prop_schema in properties.items():
+            if prop in data:
+                child_path = f"{path}.{prop}" if path else prop
+                _classify(prop_schema, data[prop], child_path, spec, found)
+
+    elif schema_type == "array" and isinstance(data, list):
+        items_schema = schema.get("items", {})
+        for i, item in enumerate(data):
+            _classify(items_schema, item, f"{path}[{i}]", spec, found)
+
+
+def classify_request_body(schema, data, path="", spec=None):
+    """Classify a request body against its schema in a single pass.
+
+    Every negative-case category is detected in the same traversal, so
+    each node is resolved and visited only once.
+
+    Args:
+        schema: OpenAPI schema object (may contain $ref or allOf)
+        data: Request data to classify
+        path: Dot-separated path of *data* within the full body
+        spec: Full OpenAPI spec dict for $ref resolution
+
+    Returns:
+        dict: Maps each category (``"invalid_enum"``, ``"invalid_format"``)
+            to the list of paths holding a value of that kind. All lists
+            are empty for a valid body.
+    """
+    found = {"invalid_enum": [], "invalid_format": []}
+    _classify(schema, data, path, spec, found)
+    return found
+
+
+def classify_case(schema, value, origin="example", spec=None):
+    """Wrap a request value that was not generated (e.g. an example)
+    in a case record.
+
+    The value is classified once with ``classify_request_body`` so that it
+    carries the same intent tags as generated cases.
+
+    Args:
+        schema: Request body schema, or None
+        value: Request value
+        origin: 'example' or 'generated'
+        spec: Full OpenAPI spec dict for $ref resolution
+
+    Returns:
+        dict: Case record (see ``case_generator.make_case_record``)
+    """
+    if schema:
+        classification = classify_request_body(schema, value, spec=spec)
+        for rule in CASE_RULES:
+            if classification[rule]:
+                return make_case_record(
+                    value, origin, rule=rule, path=classification[rule][0]
+                )
+    return make_case_record(value, origin)
+
+
+def is_negative_case(classification, documented_statuses):
+    """Return True if a classified body should be rejected by the API.
+
+    Invalid enum values always make a negative case. Invalid formats only
+    do when the operation documents a 400 response.
+
+    Args:
+        classification: Result of ``classify_request_body``
+        documented_statuses: Status codes (ints) documented for the
+            operation
+
+    Returns:
+        bool: True for a negative case
+    """
+    if classification["invalid_enum"]:
+        return True
+    return bool(classification["invalid_format"]) and (
+        400 in documented_statuses
+    )
+
+
+def _case_classification(case):
+    """Return the ``classify_request_body`` view of a case record."""
+    return {
+        rule: [case["path"]] if case["rule"] == rule else []
+        for rule in CASE_RULES
+    }
 
 
 def contains_invalid_enum_value(schema, data, path="", spec=None):
@@ -357,36 +702,7 @@ def contains_invalid_enum_value(schema, data, path="", spec=None):
     Returns:
         bool: True if data contains an invalid enum value, False otherwise
     """
-    if not isinstance(schema, dict):
-        return False
-
-    schema = resolve_schema(spec, schema)
-    schema_type = primary_type(schema.get("type"))
-
-    if "enum" in schema:
-        allowed_values = schema["enum"]
-        if not isinstance(data, (dict, list)) and data not in allowed_values:
-            return True
-
-    if schema_type == "object" and isinstance(data, dict):
-        properties = schema.get("properties", {})
-        for prop, prop_schema in properties.items():
-            if prop in data:
-                child_path = f"{path}.{prop}" if path else prop
-                if contains_invalid_enum_value(
-                    prop_schema, data[prop], child_path, spec
-                ):
-                    return True
-
-    elif schema_type == "array" and isinstance(data, list):
-        items_schema = schema.get("items", {})
-        for i, item in enumerate(data):
-            if contains_invalid_enum_value(
-                items_schema, item, f"{path}[{i}]", spec
-            ):
-                return True
-
-    return False
+    return bool(classify_request_body(schema, data, path, spec)["invalid_enum"])
 
 
 def _has_nonempty_string_value(data):
@@ -418,37 +734,8 @@ def contains_invalid_format_value(schema, data, path="", spec=None):
     Returns:
         bool: True if data contains an invalid format value, False otherwise
     """
-    if not isinstance(schema, dict):
-        return False
-
-    schema = resolve_schema(spec, schema)
-    schema_type = primary_type(schema.get("type"))
-
-    if schema_type == "string" and "format" in schema:
-        fmt = schema["format"]
-        if fmt in _INVALID_FORMAT_VALUES and isinstance(data, str):
-            if data in _INVALID_FORMAT_VALUES[fmt]:
-                return True
-
-    if schema_type == "object" and isinstance(data, dict):
-        properties = schema.get("properties", {})
-        for prop, prop_schema in properties.items():
-            if prop in data:
-                child_path = f"{path}.{prop}" if path else prop
-                if contains_invalid_format_value(
-                    prop_schema, data[prop], child_path, spec
-                ):
-                    return True
-
-    elif schema_type == "array" and isinstance(data, list):
-        items_schema = schema.get("items", {})
-        for i, item in enumerate(data):
-            if contains_invalid_format_value(
-                items_schema, item, f"{path}[{i}]", spec
-            ):
-                return True
-
-    return False
+    classification = classify_request_body(schema, data, path, spec)
+    return bool(classification["invalid_format"])
 
 
 def validate_against_schema(schema, actual, path="", spec=None):
@@ -462,6 +749,9 @@ def validate_against_schema(schema, actual, path="", spec=None):
     - type: ["string", "null"] nullable syntax (3.1.x)
     - nullable: true (3.0.x)
 
+    The schema is compiled into a checker tree on first use and the
+    compiled form is reused for every later response (see validator.py).
+
     Args:
         schema: JSON schema object (may contain $ref or allOf)
         actual: Actual response data to validate
@@ -471,147 +761,7 @@ def validate_against_schema(schema, actual, path="", spec=None):
     Returns:
         tuple: (valid: bool, error_message: str or None)
     """
-    schema = resolve_schema(spec, schema)
-    schema_type = schema.get("type")
-    path_prefix = f"{path}: " if path else ""
-
-    # ── const ─────────────────────────────────────────────────────────────────
-    if "const" in schema:
-        const_val = schema["const"]
-        if actual != const_val:
-            return (
-                False,
-                f"{path_prefix}Expected const value {const_val!r}, "
-                f"got {actual!r}",
-            )
-        return True, None
-
-    # ── oneOf ─────────────────────────────────────────────────────────────────
-    if "oneOf" in schema:
-        for sub in schema["oneOf"]:
-            valid, _ = validate_against_schema(sub, actual, path, spec)
-            if valid:
-                return True, None
-        return (
-            False,
-            f"{path_prefix}Value does not match any oneOf schema",
-        )
-
-    # ── anyOf ─────────────────────────────────────────────────────────────────
-    if "anyOf" in schema:
-        for sub in schema["anyOf"]:
-            valid, _ = validate_against_schema(sub, actual, path, spec)
-            if valid:
-                return True, None
-        return (
-            False,
-            f"{path_prefix}Value does not match any anyOf schema",
-        )
-
-    # ── nullable (OpenAPI 3.0 and 3.1) ───────────────────────────────────────
-    is_nullable = schema.get("nullable", False)
-    if isinstance(schema_type, list):
-        if "null" in schema_type and actual is None:
-            return True, None
-        non_null_types = [t for t in schema_type if t != "null"]
-        if len(non_null_types) == 1:
-            schema_type = non_null_types[0]
-        elif len(non_null_types) > 1:
-            for possible_type in non_null_types:
-                temp_schema = {**schema, "type": possible_type}
-                valid, _ = validate_against_schema(
-                    temp_schema, actual, path, spec
-                )
-                if valid:
-                    return True, None
-            return (
-                False,
-                f"{path_prefix}Value does not match any of the allowed "
-                f"types: {non_null_types}",
-            )
-    elif is_nullable and actual is None:
-        return True, None
-
-    # ── enum ──────────────────────────────────────────────────────────────────
-    if "enum" in schema:
-        allowed_values = schema["enum"]
-        if actual not in allowed_values:
-            return (
-                False,
-                f"{path_prefix}Value {actual!r} is not one of the "
-                f"allowed enum values: {allowed_values}",
-            )
-
-    # ── type checks ───────────────────────────────────────────────────────────
-    if schema_type == "object":
-        if not isinstance(actual, dict):
-            return (
-                False,
-                f"{path_prefix}Expected object, got {type(actual).__name__}",
-            )
-
-        required = schema.get("required", [])
-        for prop in required:
-            if prop not in actual:
-                return (
-                    False,
-                    f"{path_prefix}Missing required property '{prop}'",
-                )
-
-        properties = schema.get("properties", {})
-        for prop, prop_schema in properties.items():
-            if prop in actual:
-                child_path = f"{path}.{prop}" if path else prop
-                valid, error = validate_against_schema(
-                    prop_schema, actual[prop], child_path, spec
-                )
-                if not valid:
-                    return False, error
-
-    elif schema_type == "array":
-        if not isinstance(actual, list):
-            return (
-                False,
-                f"{path_prefix}Expected array, got {type(actual).__name__}",
-            )
-
-        items_schema = schema.get("items", {})
-        for i, item in enumerate(actual):
-            valid, error = validate_against_schema(
-                items_schema, item, f"{path}[{i}]", spec
-            )
-            if not valid:
-                return False, error
-
-    elif schema_type == "string":
-        if not isinstance(actual, str):
-            return (
-                False,
-                f"{path_prefix}Expected string, got {type(actual).__name__}",
-            )
-
-    elif schema_type == "number":
-        if not isinstance(actual, (int, float)):
-            return (
-                False,
-                f"{path_prefix}Expected number, got {type(actual).__name__}",
-            )
-
-    elif schema_type == "integer":
-        if not isinstance(actual, int) or isinstance(actual, bool):
-            return (
-                False,
-                f"{path_prefix}Expected integer, got {type(actual).__name__}",
-            )
-
-    elif schema_type == "boolean":
-        if not isinstance(actual, bool):
-            return (
-                False,
-                f"{path_prefix}Expected boolean, got {type(actual).__name__}",
-            )
-
-    return True, None
+    return get_validator(schema, spec)(actual, path)
 
 
 def compare_responses(expected, actual, strict=True):
@@ -781,7 +931,14 @@ def substitute_path_params(path, operation):
 
 
 def test_get_endpoint(
-    base_url, path, operation, strict_examples=True, timeout=10, spec=None
+    base_url,
+    path,
+    operation,
+    strict_examples=True,
+    timeout=10,
+    spec=None,
+    max_latency_ms=None,
+    latency_samples=1,
 ):
     """Test a GET endpoint using the example from the OpenAPI spec.
 
@@ -792,6 +949,10 @@ def test_get_endpoint(
         strict_examples: If True, strictly match example responses;
             if False, only validate structure
         spec: Full OpenAPI spec dict for $ref resolution
+        max_latency_ms: Latency budget in milliseconds for operations that
+            do not declare ``x-latency-budget-ms``
+        latency_samples: Number of measurements taken before a slow
+            idempotent request fails its latency budget
 
     Returns:
         tuple: (success: bool, error_message: str or None)
@@ -868,13 +1029,31 @@ def test_get_endpoint(
         )
         return False, error_msg
 
-    # Check status code
-    actual_response = (
-        response.json()
-        if response.status_code in [200, 201, 202]
-        else response.text
+    # Streams are read once, up front, so that the latency budget covers
+    # the whole stream and not only its headers
+    streamed = None
+    if stream_format(response.headers.get("Content-Type", "")):
+        streamed = collect_streaming_response(response)
+
+    # Fail otherwise passing responses that are slower than their budget
+    latency_error = check_latency_budget(
+        "GET",
+        url,
+        operation,
+        response.status_code,
+        timeout=timeout,
+        max_latency_ms=max_latency_ms,
+        latency_samples=latency_samples,
     )
 
+    # Check status code
+    if streamed is not None:
+        actual_response = streamed
+    elif response.status_code in [200, 201, 202]:
+        actual_response = response.json()
+    else:
+        actual_response = response.text
+
     # In lenient mode, accept any documented status code
     if not strict_examples and response.status_code in documented_statuses:
         # Get the response schema/example for the actual status code
@@ -892,7 +1071,7 @@ def test_get_endpoint(
 
         # Parse JSON response if possible
         try:
-            if response.text:
+            if response.content:
                 actual_response = response.json()
         except ValueError:
             pass
@@ -919,12 +1098,12 @@ def test_get_endpoint(
                 expected_response,
                 response.status_code,
                 actual_response,
-                True,
-                None,
+                latency_error is None,
+                latency_error,
                 "example",
                 documented_statuses=documented_statuses,
             )
-            return True, None
+            return latency_error is None, latency_error
         else:
             log_test_result(
                 "GET",
@@ -951,12 +1130,12 @@ def test_get_endpoint(
             expected_response,
             response.status_code,
             actual_response,
-            True,
-            None,
+            latency_error is None,
+            latency_error,
             "example",
             documented_statuses=documented_statuses,
         )
-        return True, None
+        return latency_error is None, latency_error
 
     if response.status_code != expected_status:
         error_msg = (
@@ -1019,11 +1198,11 @@ def test_get_endpoint(
         expected_response,
         response.status_code,
         actual_response,
-        True,
-        None,
+        latency_error is None,
+        latency_error,
         "example",
     )
-    return True, None
+    return latency_error is None, latency_error
 
 
 def test_post_endpoint(
@@ -1149,13 +1328,10 @@ def test_post_endpoint(
 
         is_negative_test = False
         if request_schema:
-            is_negative_test = contains_invalid_enum_value(
-                request_schema, request_test_case
+            is_negative_test = is_negative_case(
+                classify_request_body(request_schema, request_test_case),
+                documented_statuses,
             )
-            if not is_negative_test and 400 in documented_statuses:
-                is_negative_test = contains_invalid_format_value(
-                    request_schema, request_test_case
-                )
 
         # Make the POST request
         try:
@@ -1184,7 +1360,7 @@ def test_post_endpoint(
         if is_negative_test:
             # Parse response
             try:
-                actual_response = response.json() if response.text else ""
+                actual_response = response.json() if response.content else ""
             except ValueError:
                 actual_response = response.text
 
@@ -1415,7 +1591,7 @@ def test_post_endpoint(
 
             # Parse JSON response if possible
             try:
-                if response.text:
+                if response.content:
                     actual_response = response.json()
             except ValueError:
                 pass
@@ -1695,13 +1871,10 @@ def test_put_endpoint(
 
         is_negative_test = False
         if request_schema:
-            is_negative_test = contains_invalid_enum_value(
-                request_schema, request_test_case
+            is_negative_test = is_negative_case(
+                classify_request_body(request_schema, request_test_case),
+                documented_statuses,
             )
-            if not is_negative_test and 400 in documented_statuses:
-                is_negative_test = contains_invalid_format_value(
-                    request_schema, request_test_case
-                )
 
         # Make the PUT request
         try:
@@ -1722,6 +1895,7 @@ def test_put_endpoint(
                 error_msg,
                 test_origin,
                 documented_statuses=documented_statuses,
+                operation_path=path,
             )
             errors.append(error_msg)
             continue
@@ -1730,7 +1904,7 @@ def test_put_endpoint(
         if is_negative_test:
             # Parse response
             try:
-                actual_response = response.json() if response.text else ""
+                actual_response = response.json() if response.content else ""
             except ValueError:
                 actual_response = response.text
 
@@ -1755,6 +1929,7 @@ def test_put_endpoint(
                         error_msg,
                         test_origin,
                         documented_statuses=documented_statuses,
+                        operation_path=path,
                     )
                     errors.append(error_msg)
                     continue
@@ -1770,6 +1945,7 @@ def test_put_endpoint(
                     None,
                     test_origin,
                     documented_statuses=documented_statuses,
+                    operation_path=path,
                 )
                 continue
             elif response.status_code >= 500:
@@ -1791,6 +1967,7 @@ def test_put_endpoint(
                     error_msg,
                     test_origin,
                     documented_statuses=documented_statuses,
+                    operation_path=path,
                 )
                 errors.append(error_msg)
                 continue
@@ -1813,6 +1990,7 @@ def test_put_endpoint(
                     error_msg,
                     test_origin,
                     documented_statuses=documented_statuses,
+                    operation_path=path,
                 )
                 errors.append(error_msg)
                 continue
@@ -1841,7 +2019,7 @@ def test_put_endpoint(
 
             # Parse JSON response if possible
             try:
-                if response.text:
+                if response.content:
                     actual_response = response.json()
             except ValueError:
                 pass
@@ -1872,6 +2050,7 @@ def test_put_endpoint(
                     None,
                     test_origin,
                     documented_statuses=documented_statuses,
+                    operation_path=path,
                 )
                 continue
             else:
@@ -1887,6 +2066,7 @@ def test_put_endpoint(
                     error,
                     test_origin,
                     documented_statuses=documented_statuses,
+                    operation_path=path,
                 )
                 errors.append(error)
                 continue
@@ -1905,6 +2085,7 @@ def test_put_endpoint(
                 None,
                 test_origin,
                 documented_statuses=documented_statuses,
+                operation_path=path,
             )
             continue
 
@@ -1925,6 +2106,7 @@ def test_put_endpoint(
                 error_msg,
                 test_origin,
                 documented_statuses=documented_statuses,
+                operation_path=path,
             )
             errors.append(error_msg)
             continue
@@ -1959,6 +2141,7 @@ def test_put_endpoint(
                 error,
                 test_origin,
                 documented_statuses=documented_statuses,
+                operation_path=path,
             )
             errors.append(error)
             continue
@@ -1975,6 +2158,7 @@ def test_put_endpoint(
             None,
             test_origin,
             documented_statuses=documented_statuses,
+            operation_path=path,
         )
 
     if errors:
@@ -1985,7 +2169,14 @@ def test_put_endpoint(
 
 
 def test_delete_endpoint(
-    base_url, path, operation, strict_examples=True, timeout=10, spec=None
+    base_url,
+    path,
+    operation,
+    strict_examples=True,
+    timeout=10,
+    spec=None,
+    max_latency_ms=None,
+    latency_samples=1,
 ):
     """Test a DELETE endpoint.
 
@@ -1995,6 +2186,10 @@ def test_delete_endpoint(
         operation: OpenAPI operation object
         strict_examples: If True, strictly match example responses;
             if False, only validate structure
+        max_latency_ms: Latency budget in milliseconds for operations that
+            do not declare ``x-latency-budget-ms``
+        latency_samples: Number of measurements taken before a slow
+            idempotent request fails its latency budget
 
     Returns:
         tuple: (success: bool, error_message: str or None)
@@ -2108,12 +2303,24 @@ def test_delete_endpoint(
             error_msg,
             "example",
             documented_statuses=documented_statuses,
+            operation_path=path,
         )
         return False, error_msg
 
+    # Fail otherwise passing responses that are slower than their budget
+    latency_error = check_latency_budget(
+        "DELETE",
+        url,
+        operation,
+        response.status_code,
+        timeout=timeout,
+        max_latency_ms=max_latency_ms,
+        latency_samples=latency_samples,
+    )
+
     # Check status code (accept 200 or 204 for successful DELETE)
     actual_response = ""
-    if response.status_code == 200 and response.text:
+    if response.status_code == 200 and response.content:
         try:
             actual_response = response.json()
         except ValueError:
@@ -2136,7 +2343,7 @@ def test_delete_endpoint(
 
         # Parse JSON response if possible
         try:
-            if response.text:
+            if response.content:
                 actual_response = response.json()
         except ValueError:
             pass
@@ -2163,12 +2370,13 @@ def test_delete_endpoint(
                 expected_body,
                 response.status_code,
                 actual_response,
-                True,
-                None,
+                latency_error is None,
+                latency_error,
                 "example",
                 documented_statuses=documented_statuses,
+                operation_path=path,
             )
-            return True, None
+            return latency_error is None, latency_error
         else:
             log_test_result(
                 "DELETE",
@@ -2182,6 +2390,7 @@ def test_delete_endpoint(
                 error,
                 "example",
                 documented_statuses=documented_statuses,
+                operation_path=path,
             )
             return False, error
 
@@ -2195,12 +2404,13 @@ def test_delete_endpoint(
             expected_body,
             response.status_code,
             actual_response,
-            True,
-            None,
+            latency_error is None,
+            latency_error,
             "example",
             documented_statuses=documented_statuses,
+            operation_path=path,
         )
-        return True, None
+        return latency_error is None, latency_error
 
     if response.status_code not in [200, 204]:
         error_msg = (
@@ -2219,6 +2429,7 @@ def test_delete_endpoint(
             error_msg,
             "example",
             documented_statuses=documented_statuses,
+            operation_path=path,
         )
         return False, error_msg
 
@@ -2230,12 +2441,13 @@ def test_delete_endpoint(
         expected_body,
         response.status_code,
         actual_response,
-        True,
-        None,
+        latency_error is None,
+        latency_error,
         "example",
         documented_statuses=documented_statuses,
+        operation_path=path,
     )
-    return True, None
+    return latency_error is None, latency_error
 
 
 def test_post_endpoint_single(
@@ -2247,6 +2459,9 @@ def test_post_endpoint_single(
     strict_examples=True,
     timeout=10,
     spec=None,
+    case=None,
+    max_latency_ms=None,
+    latency_samples=1,
 ):
     """Test a single POST request with a specific request body.
 
@@ -2262,6 +2477,13 @@ def test_post_endpoint_single(
         strict_examples: If True, strictly match example responses;
             if False, only validate structure
         timeout: Request timeout in seconds
+        case: Case record for *request_body*. When given, its tag decides
+            whether this is a negative case and the body is not re-walked
+            against the schema.
+        max_latency_ms: Latency budget in milliseconds for operations that
+            do not declare ``x-latency-budget-ms``
+        latency_samples: Number of measurements taken before a slow
+            idempotent request fails its latency budget
 
     Returns:
         tuple: (success: bool, error_message: str or None)
@@ -2341,14 +2563,15 @@ def test_post_endpoint_single(
             break
 
     is_negative_test = False
-    if request_schema:
-        is_negative_test = contains_invalid_enum_value(
-            request_schema, request_body, spec=spec
+    if case is not None:
+        is_negative_test = is_negative_case(
+            _case_classification(case), documented_statuses
+        )
+    elif request_schema:
+        is_negative_test = is_negative_case(
+            classify_request_body(request_schema, request_body, spec=spec),
+            documented_statuses,
         )
-        if not is_negative_test and 400 in documented_statuses:
-            is_negative_test = contains_invalid_format_value(
-                request_schema, request_body, spec=spec
-            )
 
     # Make the POST request
     try:
@@ -2370,10 +2593,39 @@ def test_post_endpoint_single(
         )
         return False, error_msg
 
+    # Streams are read once, up front, so that their timing covers the
+    # whole stream before the latency budget is checked. Each item is
+    # validated as it arrives if the spec declares an item schema.
+    streamed = None
+    stream_error = None
+    content_type = response.headers.get("Content-Type", "")
+    if not is_negative_test and stream_format(content_type):
+        item_schema = stream_item_schema(
+            responses.get(str(response.status_code)), content_type
+        )
+        on_chunk = None
+        if item_schema is not None:
+            on_chunk = make_chunk_validator(item_schema, spec)
+        result = read_streaming_response(response, on_chunk=on_chunk)
+        streamed = result["chunks"] if result["events"] else result["text"]
+        stream_error = result["error"]
+
+    # Fail otherwise passing responses that are slower than their budget
+    latency_error = check_latency_budget(
+        "POST",
+        url,
+        operation,
+        response.status_code,
+        request_body,
+        timeout=timeout,
+        max_latency_ms=max_latency_ms,
+        latency_samples=latency_samples,
+    )
+
     # Handle negative tests
     if is_negative_test:
         try:
-            if response.text:
+            if response.content:
                 actual_response = response.json()
             else:
                 actual_response = ""
@@ -2409,12 +2661,12 @@ def test_post_endpoint_single(
                 "400/422 (invalid value)",
                 response.status_code,
                 actual_response,
-                True,
-                None,
+                latency_error is None,
+                latency_error,
                 test_origin,
                 documented_statuses=documented_statuses,
             )
-            return True, None
+            return latency_error is None, latency_error
         elif response.status_code >= 500:
             error_msg = (
                 f"Expected 400/422 for invalid value, got "
@@ -2458,21 +2710,10 @@ def test_post_endpoint_single(
             )
             return False, error_msg
 
-    # Check if response is a streaming response
-    content_type = response.headers.get("Content-Type", "")
-    is_streaming = any(
-        stream_type in content_type.lower()
-        for stream_type in [
-            "text/event-stream",
-            "application/x-ndjson",
-            "application/stream+json",
-        ]
-    )
-
-    if is_streaming:
-        # Streaming responses are valid - we can't validate their
-        # content in the same way. Just verify we got a 200/201/202.
-        if response.status_code in [200, 201, 202]:
+    if streamed is not None:
+        # Streams are checked item by item against their item schema, if
+        # one is declared, and otherwise only by status code
+        if response.status_code in [200, 201, 202] and stream_error:
             log_test_result(
                 "POST",
                 path,
@@ -2480,13 +2721,28 @@ def test_post_endpoint_single(
                 expected_status,
                 expected_response,
                 response.status_code,
-                collect_streaming_response(response),
-                True,
-                None,
+                streamed,
+                False,
+                stream_error,
                 test_origin,
                 documented_statuses=documented_statuses,
             )
-            return True, None
+            return False, stream_error
+        elif response.status_code in [200, 201, 202]:
+            log_test_result(
+                "POST",
+                path,
+                request_body,
+                expected_status,
+                expected_response,
+                response.status_code,
+                streamed,
+                latency_error is None,
+                latency_error,
+                test_origin,
+                documented_statuses=documented_statuses,
+            )
+            return latency_error is None, latency_error
         else:
             error_msg = (
                 f"Expected {expected_status}, got "
@@ -2499,7 +2755,7 @@ def test_post_endpoint_single(
                 expected_status,
                 expected_response,
                 response.status_code,
-                collect_streaming_response(response),
+                streamed,
                 False,
                 error_msg,
                 test_origin,
@@ -2529,7 +2785,7 @@ def test_post_endpoint_single(
             break
 
         try:
-            if response.text:
+            if response.content:
                 actual_response = response.json()
         except ValueError:
             pass
@@ -2554,12 +2810,12 @@ def test_post_endpoint_single(
                 expected_response,
                 response.status_code,
                 actual_response,
-                True,
-                None,
+                latency_error is None,
+                latency_error,
                 test_origin,
                 documented_statuses=documented_statuses,
             )
-            return True, None
+            return latency_error is None, latency_error
         else:
             log_test_result(
                 "POST",
@@ -2586,12 +2842,12 @@ def test_post_endpoint_single(
             expected_response,
             response.status_code,
             actual_response,
-            True,
-            None,
+            latency_error is None,
+            latency_error,
             test_origin,
             documented_statuses=documented_statuses,
         )
-        return True, None
+        return latency_error is None, latency_error
 
     valid_success_statuses = {
         s for s in documented_statuses if s in {200, 201, 202}
@@ -2656,12 +2912,12 @@ def test_post_endpoint_single(
         expected_response,
         response.status_code,
         actual_response,
-        True,
-        None,
+        latency_error is None,
+        latency_error,
         test_origin,
         documented_statuses=documented_statuses,
     )
-    return True, None
+    return latency_error is None, latency_error
 
 
 def test_put_endpoint_single(
@@ -2673,6 +2929,8 @@ def test_put_endpoint_single(
     strict_examples=True,
     timeout=10,
     spec=None,
+    max_latency_ms=None,
+    latency_samples=1,
 ):
     """Test a single PUT request with a specific request body.
 
@@ -2688,6 +2946,10 @@ def test_put_endpoint_single(
         strict_examples: If True, strictly match example responses;
             if False, only validate structure
         timeout: Request timeout in seconds
+        max_latency_ms: Latency budget in milliseconds for operations that
+            do not declare ``x-latency-budget-ms``
+        latency_samples: Number of measurements taken before a slow
+            idempotent request fails its latency budget
 
     Returns:
         tuple: (success: bool, error_message: str or None)
@@ -2783,13 +3045,32 @@ def test_put_endpoint_single(
         )
         return False, error_msg
 
-    # Check status code
-    actual_response = (
-        response.json()
-        if response.status_code in [200, 201, 202]
-        else response.text
+    # Streams are read once, up front, so that the latency budget covers
+    # the whole stream and not only its headers
+    streamed = None
+    if stream_format(response.headers.get("Content-Type", "")):
+        streamed = collect_streaming_response(response)
+
+    # Fail otherwise passing responses that are slower than their budget
+    latency_error = check_latency_budget(
+        "PUT",
+        url,
+        operation,
+        response.status_code,
+        request_body,
+        timeout=timeout,
+        max_latency_ms=max_latency_ms,
+        latency_samples=latency_samples,
     )
 
+    # Check status code
+    if streamed is not None:
+        actual_response = streamed
+    elif response.status_code in [200, 201, 202]:
+        actual_response = response.json()
+    else:
+        actual_response = response.text
+
     # In lenient mode, accept any documented status code
     if not strict_examples and response.status_code in documented_statuses:
         actual_status_response = responses.get(str(response.status_code), {})
@@ -2805,7 +3086,7 @@ def test_put_endpoint_single(
             break
 
         try:
-            if response.text:
+            if response.content:
                 actual_response = response.json()
         except ValueError:
             pass
@@ -2830,12 +3111,12 @@ def test_put_endpoint_single(
                 expected_response,
                 response.status_code,
                 actual_response,
-                True,
-                None,
+                latency_error is None,
+                latency_error,
                 test_origin,
                 documented_statuses=documented_statuses,
             )
-            return True, None
+            return latency_error is None, latency_error
         else:
             log_test_result(
                 "PUT",
@@ -2862,12 +3143,12 @@ def test_put_endpoint_single(
             expected_response,
             response.status_code,
             actual_response,
-            True,
-            None,
+            latency_error is None,
+            latency_error,
             test_origin,
             documented_statuses=documented_statuses,
         )
-        return True, None
+        return latency_error is None, latency_error
 
     valid_success_statuses = {
         s for s in documented_statuses if s in {200, 201, 202}
@@ -2932,9 +3213,9 @@ def test_put_endpoint_single(
         expected_response,
         response.status_code,
         actual_response,
-        True,
-        None,
+        latency_error is None,
+        latency_error,
         test_origin,
         documented_statuses=documented_statuses,
     )
-    return True, None
+    return latency_error is None, latency_error
@@ -0,0 +1,308 @@
+"""Latency statistics for the OpenAPI contract test report.
+
+Every record logged after an HTTP request carries a ``timing`` dict (see
+``contract.make_timing``). This module summarises those timings per
+operation and renders the latency section of the Markdown report.
+
+It also resolves latency budgets. An operation, or one of its responses,
+can declare ``x-latency-budget-ms: N``; the response-level value wins, and
+``--openapi-max-latency-ms`` applies to operations that declare none.
+
+Finally, a run's per-operation percentiles can be stored as a baseline
+file and later runs compared against it, flagging operations whose p95
+grew beyond a configurable ratio.
+"""
+
+import json
+from statistics import median
+
+# Percentiles shown for every operation
+REPORT_PERCENTILES = (50, 95, 99)
+
+# Number of rows in the slowest endpoints table
+SLOWEST_ENDPOINTS = 10
+
+# Spec extension declaring a latency budget in milliseconds
+LATENCY_BUDGET_EXTENSION = "x-latency-budget-ms"
+
+# Methods that are safe to send again when re-measuring a slow response
+RESAMPLE_METHODS = ("GET", "PUT")
+
+# Format version of latency baseline files
+BASELINE_VERSION = 1
+
+# Default allowed p95 growth factor before an operation counts as regressed
+DEFAULT_REGRESSION_RATIO = 1.5
+
+# p95 increases smaller than this (in ms) are treated as noise
+REGRESSION_MIN_DELTA_MS = 5.0
+
+
+def percentile(values, q):
+    """Return the *q*-th percentile of *values*.
+
+    Uses linear interpolation between the two closest ranks, so the 50th
+    percentile of an even number of values is the mean of the middle two.
+
+    Args:
+        values: Non-empty iterable of numbers
+        q: Percentile between 0 and 100
+
+    Returns:
+        float: The percentile value
+
+    Raises:
+        ValueError: If *values* is empty or *q* is out of range
+    """
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("Cannot compute a percentile of no values")
+    if not 0 <= q <= 100:
+        raise ValueError(f"Percentile must be between 0 and 100, got {q}")
+
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    fraction = position - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+
+
+def latency_by_operation(records):
+    """Summarise the total request time of each operation.
+
+    Args:
+        records: Test report records; records without timing are ignored
+
+    Returns:
+        dict: ``"METHOD /path"`` (path template) -> summary with
+            ``count``, ``p50``, ``p95``, ``p99``, ``max`` (milliseconds),
+            ``ttfb_p50``, ``connect_total`` and ``bytes``, in first-seen
+            order
+    """
+    samples = {}
+    for record in records:
+        timing = record.get("timing")
+        if not timing:
+            continue
+        path = record.get("operation_path") or record["path"]
+        key = f"{record['method'].upper()} {path}"
+        samples.setdefault(key, []).append(timing)
+
+    summary = {}
+    for key, timings in samples.items():
+        totals = [t["total_ms"] for t in timings]
+        entry = {"count": len(totals)}
+        for q in REPORT_PERCENTILES:
+            entry[f"p{q}"] = percentile(totals, q)
+        entry["max"] = max(totals)
+        entry["ttfb_p50"] = percentile([t["ttfb_ms"] for t in timings], 50)
+        entry["connect_total"] = sum(t["connect_ms"] for t in timings)
+        entry["bytes"] = sum(t["size_bytes"] for t in timings)
+        summary[key] = entry
+    return summary
+
+
+def get_latency_report_markdown(records, slowest=SLOWEST_ENDPOINTS):
+    """Render the latency section of the Markdown report.
+
+    Args:
+        records: Test report records
+        slowest: Number of operations in the slowest endpoints table
+
+    Returns:
+        list: Markdown lines, empty if no record carries timing
+    """
+    summary = latency_by_operation(records)
+    if not summary:
+        return []
+
+    lines = ["## Latency", ""]
+    lines.append(
+        "| Endpoint | Requests | p50 (ms) | p95 (ms) | p99 (ms) | max (ms) |"
+    )
+    lines.append("|---|---:|---:|---:|---:|---:|")
+    for key, entry in summary.items():
+        lines.append(
+            f"| `{key}` | {entry['count']} | {entry['p50']:.1f} | "
+            f"{entry['p95']:.1f} | {entry['p99']:.1f} | {entry['max']:.1f} |"
+        )
+    lines.append("")
+
+    lines.append("### Slowest Endpoints")
+    lines.append("")
+    lines.append(
+        "| Endpoint | p95 (ms) | TTFB p50 (ms) | Connect (ms) | Bytes |"
+    )
+    lines.append("|---|---:|---:|---:|---:|")
+    ranked = sorted(summary.items(), key=lambda item: -item[1]["p95"])
+    for key, entry in ranked[:slowest]:
+        lines.append(
+            f"| `{key}` | {entry['p95']:.1f} | {entry['ttfb_p50']:.1f} | "
+            f"{entry['connect_total']:.1f} | {entry['bytes']} |"
+        )
+    lines.append("")
+    return lines
+
+
+def _budget_value(obj):
+    """Return the latency budget declared on *obj*, if valid."""
+    if not isinstance(obj, dict):
+        return None
+    value = obj.get(LATENCY_BUDGET_EXTENSION)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if value > 0:
+            return value
+    return None
+
+
+def latency_budget_ms(operation, status_code=None, default=None):
+    """Return the latency budget that applies to a response.
+
+    Args:
+        operation: OpenAPI operation object
+        status_code: Status code of the response, if known
+        default: Budget used when the spec declares none (for example
+            ``--openapi-max-latency-ms``)
+
+    Returns:
+        float or None: Budget in milliseconds, or None for no budget
+    """
+    response = operation.get("responses", {}).get(str(status_code))
+    for obj in (response, operation):
+        budget = _budget_value(obj)
+        if budget is not None:
+            return budget
+    return default
+
+
+def latency_budget_error(samples_ms, budget_ms):
+    """Compare measured response times with a latency budget.
+
+    Several samples are reduced to their median, so a single outlier does
+    not decide the result.
+
+    Args:
+        samples_ms: Total response times in milliseconds
+        budget_ms: Latency budget in milliseconds
+
+    Returns:
+        str or None: Error message if the budget is exceeded
+    """
+    measured = median(samples_ms)
+    if measured <= budget_ms:
+        return None
+    if len(samples_ms) > 1:
+        how = f"median of {len(samples_ms)} samples"
+    else:
+        how = "1 sample"
+    return (
+        f"Response time {measured:.1f} ms exceeds the latency budget of "
+        f"{budget_ms:g} ms ({how})"
+    )
+
+
+def make_baseline(records):
+    """Build a latency baseline from a run's records.
+
+    Args:
+        records: Test report records
+
+    Returns:
+        dict: ``{"version": 1, "operations": {...}}`` holding the count and
+            p50/p95/p99/max total time of each operation
+    """
+    operations = {}
+    for key, entry in latency_by_operation(records).items():
+        operations[key] = {
+            "count": entry["count"],
+            **{f"p{q}": round(entry[f"p{q}"], 3) for q in REPORT_PERCENTILES},
+            "max": round(entry["max"], 3),
+        }
+    return {"version": BASELINE_VERSION, "operations": operations}
+
+
+def write_baseline(path, records):
+    """Write the latency baseline of *records* to *path* as JSON.
+
+    Args:
+        path: Output file path
+        records: Test report records
+
+    Returns:
+        dict: The baseline that was written
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    baseline = make_baseline(records)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return baseline
+
+
+def read_baseline(path):
+    """Read a latency baseline written by ``write_baseline``.
+
+    Args:
+        path: Baseline file path
+
+    Returns:
+        dict: The baseline
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a baseline
+    """
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if (
+        not isinstance(baseline, dict)
+        or baseline.get("version") != BASELINE_VERSION
+        or not isinstance(baseline.get("operations"), dict)
+    ):
+        raise ValueError(f"{path} is not a version {BASELINE_VERSION} baseline")
+    return baseline
+
+
+def find_regressions(
+    records,
+    baseline,
+    ratio=DEFAULT_REGRESSION_RATIO,
+    min_delta_ms=REGRESSION_MIN_DELTA_MS,
+):
+    """Find operations whose p95 regressed against a baseline.
+
+    An operation regresses when its p95 is more than *ratio* times the
+    baseline p95 and at least *min_delta_ms* slower, so that jitter on
+    very fast endpoints is not reported. Operations missing from either
+    side are ignored.
+
+    Args:
+        records: Test report records of the current run
+        baseline: Baseline from ``read_baseline``
+        ratio: Allowed p95 growth factor
+        min_delta_ms: Smallest p95 increase reported, in milliseconds
+
+    Returns:
+        list: One dict per regression with ``operation``,
+            ``baseline_p95``, ``p95`` and ``ratio``, worst first
+    """
+    regressions = []
+    for key, entry in latency_by_operation(records).items():
+        previous = baseline["operations"].get(key)
+        if not previous:
+            continue
+        before = previous["p95"]
+        after = entry["p95"]
+        if after > before * ratio and after - before >= min_delta_ms:
+            regressions.append(
+                {
+                    "operation": key,
+                    "baseline_p95": before,
+                    "p95": after,
+                    "ratio": after / before if before else float("inf"),
+                }
+            )
+    regressions.sort(key=lambda r: -r["ratio"])
+    return regressions
@@ -0,0 +1,237 @@
+"""Load-test mode: replay the contract case corpus at a target rate.
+
+With ``--openapi-load`` the examples and generated cases that would
+normally become one pytest item each are instead replayed for a fixed
+duration, cycling through the corpus, and every response is still
+validated by the regular contract checks.
+
+Two schedulers are available:
+
+- **Open loop** (``--openapi-load-rps``): request *i* is due at
+  ``start + i / rps``, whether or not earlier requests have completed.
+  Latency is measured from the due time, so queueing behind a slow server
+  is counted instead of hidden (no coordinated omission).
+- **Closed loop** (no target rate): ``concurrency`` workers each send the
+  next case as soon as their previous one completes.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .contract import captured_test_results
+from .latency import REPORT_PERCENTILES, percentile
+
+# Methods replayed unless mutating methods are opted in
+DEFAULT_LOAD_METHODS = ("get",)
+
+# Number of distinct failure messages kept in the summary
+MAX_FAILURE_MESSAGES = 5
+
+
+def _run_one(check):
+    """Run one check with its report records kept out of the report.
+
+    Returns:
+        tuple: (success, error_message)
+    """
+    with captured_test_results():
+        try:
+            return check()
+        except Exception as e:  # Counted as a failed request
+            return False, f"{type(e).__name__}: {e}"
+
+
+async def _open_loop(checks, rps, duration, executor, clock, record):
+    loop = asyncio.get_running_loop()
+    start = clock()
+    pending = []
+
+    async def send(check, due):
+        result = await loop.run_in_executor(executor, _run_one, check)
+        record(result, clock() - due)
+
+    index = 0
+    while True:
+        offset = index / rps
+        if offset >= duration:
+            break
+        due = start + offset
+        delay = due - clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        pending.append(
+            asyncio.ensure_future(send(checks[index % len(checks)], due))
+        )
+        index += 1
+
+    await asyncio.gather(*pending)
+    return clock() - start
+
+
+async def _closed_loop(checks, concurrency, duration, executor, clock, record):
+    loop = asyncio.get_running_loop()
+    start = clock()
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index
+        while clock() - start < duration:
+            check = checks[next_index % len(checks)]
+            next_index += 1
+            sent = clock()
+            result = await loop.run_in_executor(executor, _run_one, check)
+            record(result, clock() - sent)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return clock() - start
+
+
+def run_load(checks, duration, rps=None, concurrency=10, clock=time.monotonic):
+    """Replay *checks* for *duration* seconds and summarise the run.
+
+    Args:
+        checks: Non-empty list of zero-argument callables returning
+            ``(success, error)``, replayed in order, round robin
+        duration: Seconds during which new requests are started
+        rps: Target requests per second (open loop), or None to run
+            *concurrency* closed-loop workers as fast as possible
+        concurrency: Maximum number of requests in flight
+        clock: Monotonic clock, in seconds
+
+    Returns:
+        dict: Summary from ``summarize_load``
+    """
+    latencies = []
+    failures = {}
+
+    def record(result, elapsed):
+        success, error = result
+        latencies.append(elapsed * 1000)
+        if not success:
+            failures[error] = failures.get(error, 0) + 1
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        if rps is not None:
+            scheduler = _open_loop(
+                checks, rps, duration, executor, clock, record
+            )
+        else:
+            scheduler = _closed_loop(
+                checks, concurrency, duration, executor, clock, record
+            )
+        elapsed = asyncio.run(scheduler)
+
+    return summarize_load(latencies, failures, elapsed, rps, concurrency)
+
+
+def summarize_load(latencies, failures, elapsed, rps=None, concurrency=None):
+    """Build the summary of a load run.
+
+    Args:
+        latencies: Latency of every request, in milliseconds
+        failures: Failure message -> number of requests that failed with it
+        elapsed: Wall-clock duration of the run, in seconds
+        rps: Target request rate, or None for a closed-loop run
+        concurrency: Maximum number of requests in flight
+
+    Returns:
+        dict: ``requests``, ``errors``, ``error_rate``, ``throughput``
+            (requests per second), ``elapsed``, ``target_rps``,
+            ``concurrency``, latency percentiles (``p50``, ``p95``,
+            ``p99``, ``max``, in ms) and the most common ``failures``
+    """
+    requests = len(latencies)
+    errors = sum(failures.values())
+    summary = {
+        "requests": requests,
+        "errors": errors,
+        "error_rate": errors / requests if requests else 0.0,
+        "throughput": requests / elapsed if elapsed > 0 else 0.0,
+        "elapsed": elapsed,
+        "target_rps": rps,
+        "concurrency": concurrency,
+    }
+    for q in REPORT_PERCENTILES:
+        summary[f"p{q}"] = percentile(latencies, q) if latencies else None
+    summary["max"] = max(latencies) if latencies else None
+    summary["failures"] = sorted(failures.items(), key=lambda f: -f[1])[
+        :MAX_FAILURE_MESSAGES
+    ]
+    return summary
+
+
+def format_load_summary(summary):
+    """Render a load summary as console lines.
+
+    Args:
+        summary: Summary from ``run_load``
+
+    Returns:
+        list: Lines of text
+    """
+    if summary["target_rps"] is not None:
+        mode = f"open loop at {summary['target_rps']:g} req/s"
+    else:
+        mode = f"closed loop with {summary['concurrency']} workers"
+    lines = [
+        f"🚀 OpenAPI load test ({mode}): {summary['requests']} requests"
+        f" in {summary['elapsed']:.1f}s",
+        f"   Throughput: {summary['throughput']:.1f} req/s",
+        f"   Errors: {summary['errors']}"
+        f" ({summary['error_rate'] * 100:.2f}%)",
+    ]
+    if summary["requests"]:
+        lines.append(
+            "   Latency: "
+            + ", ".join(
+                f"p{q} {summary[f'p{q}']:.1f} ms" for q in REPORT_PERCENTILES
+            )
+            + f", max {summary['max']:.1f} ms"
+        )
+    for message, count in summary["failures"]:
+        lines.append(f"   ❌ {count}x {message}")
+    return lines
+
+
+def get_load_report_markdown(summary):
+    """Render a load summary as a Markdown report.
+
+    Args:
+        summary: Summary from ``run_load``
+
+    Returns:
+        str: Markdown report
+    """
+    if summary["target_rps"] is not None:
+        mode = f"Open loop at {summary['target_rps']:g} req/s"
+    else:
+        mode = f"Closed loop with {summary['concurrency']} workers"
+    lines = [
+        "# OpenAPI Load Test Report",
+        "",
+        "## Summary",
+        "",
+        f"- **Scheduler:** {mode}",
+        f"- **Requests:** {summary['requests']}"
+        f" in {summary['elapsed']:.1f}s",
+        f"- **Throughput:** {summary['throughput']:.1f} req/s",
+        f"- **Errors:** {summary['errors']}"
+        f" ({summary['error_rate'] * 100:.2f}%)",
+        "",
+    ]
+    if summary["requests"]:
+        lines += [
+            "## Latency",
+            "",
+            "| p50 (ms) | p95 (ms) | p99 (ms) | max (ms) |",
+            "|---:|---:|---:|---:|",
+            f"| {summary['p50']:.1f} | {summary['p95']:.1f} |"
+            f" {summary['p99']:.1f} | {summary['max']:.1f} |",
+            "",
+        ]
+    if summary["failures"]:
+        lines += ["## Most Common Failures", ""]
+        for message, count in summary["failures"]:
+            lines += [f"### {count}x", "", "```", message, "```", ""]
+    return "\n".join(lines)
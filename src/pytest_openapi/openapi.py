@@ -1,10 +1,16 @@
 """OpenAPI specification validation and parsing."""
 
+import hashlib
+import json
+import mmap
+import os
 import sys
 import time
 
 import requests
 
+from .session import get_session
+
 
 def check_request_body_has_example(method, path, operation):
     """Check if a POST/PUT/DELETE operation has a request body example
@@ -179,36 +185,108 @@ def check_endpoint_schema_descriptions(method, path, operation):
     return errors
 
 
-def validate_openapi_spec(base_url, timeout=10, retries=3, retry_wait=1.0):
-    """Validate that the OpenAPI spec is available and meets
-    requirements.
+def _spec_cache_paths(cache_dir, url):
+    """Return the (body, metadata) file paths caching the spec at *url*."""
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    base = os.path.join(cache_dir, key)
+    return f"{base}.json", f"{base}.meta.json"
 
-    Checks:
-    1. /openapi.json endpoint is accessible
-    2. All GET/POST/PUT/DELETE endpoints have request examples
-       (where applicable)
-    3. All endpoints have response schemas
+
+def _read_cached_spec(cache_dir, url):
+    """Read a cached spec body and its validators.
+
+    Returns:
+        tuple: (body bytes or None, metadata dict)
+    """
+    body_path, meta_path = _spec_cache_paths(cache_dir, url)
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, {}
+    return body, meta
+
+
+def _write_cached_spec(cache_dir, url, response):
+    """Store a spec response body with its ETag/Last-Modified
+    validators.
+
+    Responses without validators are not cached, since they could never
+    be revalidated with a conditional request.
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+
+    body_path, meta_path = _spec_cache_paths(cache_dir, url)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(body_path, "wb") as f:
+            f.write(response.content)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"url": url, "etag": etag, "last_modified": last_modified}, f
+            )
+    except OSError as e:
+        print(f"\n⚠️  Warning: Failed to cache OpenAPI spec: {e}")
+
+
+def load_openapi_spec(
+    base_url, timeout=10, retries=3, retry_wait=1.0, cache_dir=None
+):
+    """Fetch and parse /openapi.json, retrying on failure.
+
+    This is the single place where the spec is downloaded; both
+    validation and test generation use the parsed document it returns.
+
+    When *cache_dir* is given, the body is stored there together with its
+    ETag/Last-Modified headers, and later runs revalidate it with a
+    conditional request (``If-None-Match``/``If-Modified-Since``). A
+    ``304 Not Modified`` answer is served from the cache.
 
     Args:
         base_url: Base URL of the API server
         timeout: HTTP request timeout in seconds
         retries: Number of retry attempts after the first failure (default: 3)
         retry_wait: Seconds to wait between retries (default: 1.0)
+        cache_dir: Optional directory for the on-disk spec cache
+
+    Returns:
+        dict: The parsed OpenAPI spec
 
     Raises:
-        SystemExit: If validation fails
+        SystemExit: If the spec cannot be fetched or is not valid JSON
     """
     openapi_url = f"{base_url}/openapi.json"
     max_attempts = retries + 1
 
-    # Check 1: Fetch OpenAPI spec
+    headers = {}
+    cached_body = None
+    if cache_dir:
+        cached_body, meta = _read_cached_spec(cache_dir, openapi_url)
+        if cached_body is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
     last_error = None
     spec = None
     for attempt in range(1, max_attempts + 1):
         try:
-            response = requests.get(openapi_url, timeout=timeout)
+            response = get_session(openapi_url).get(
+                openapi_url, timeout=timeout, headers=headers
+            )
+            if response.status_code == 304 and cached_body is not None:
+                spec = json.loads(cached_body)
+                break
             response.raise_for_status()
             spec = response.json()
+            if cache_dir:
+                _write_cached_spec(cache_dir, openapi_url, response)
             break
         except requests.exceptions.RequestException as e:
             last_error = e
@@ -235,6 +313,177 @@ def validate_openapi_spec(base_url, timeout=10, retries=3, retry_wait=1.0):
         print(f"   Reason: {last_error}")
         sys.exit(1)
 
+    return spec
+
+
+def _parse_spec_document(data, source):
+    """Parse a JSON or YAML spec document held in a bytes-like buffer.
+
+    JSON is parsed with ``orjson`` straight from the buffer when it is
+    installed. Files ending in ``.yaml``/``.yml``, and anything that is
+    not valid JSON, are parsed as YAML when PyYAML is installed.
+
+    Args:
+        data: Bytes-like object (bytes or a memory-mapped file)
+        source: File name used to pick the format and in error messages
+
+    Returns:
+        The parsed document
+
+    Raises:
+        ValueError: If the document cannot be parsed
+    """
+    is_yaml = source.lower().endswith((".yaml", ".yml"))
+    json_error = None
+
+    if not is_yaml:
+        try:
+            import orjson  # noqa: PLC0415
+
+            with memoryview(data) as view:
+                return orjson.loads(view)
+        except ImportError:
+            try:
+                return json.loads(bytes(data))
+            except ValueError as e:
+                json_error = e
+        except ValueError as e:
+            json_error = e
+
+    try:
+        import yaml  # noqa: PLC0415
+    except ImportError:
+        if is_yaml:
+            raise ValueError(
+                "Cannot read YAML spec: 'PyYAML' package not installed."
+                " Install with: pip install pyyaml"
+            )
+        raise ValueError(f"Invalid JSON: {json_error}")
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(bytes(data), Loader=loader)
+    except yaml.YAMLError as e:
+        if json_error is not None:
+            raise ValueError(f"Invalid JSON: {json_error}")
+        raise ValueError(f"Invalid YAML: {e}")
+
+
+def read_openapi_spec_file(path):
+    """Load an OpenAPI spec from a local file, or from stdin for ``-``.
+
+    Files are memory-mapped rather than read into a separate buffer, so
+    very large documents are parsed straight from the page cache.
+
+    Args:
+        path: Path to a JSON or YAML spec file, or ``-`` for stdin
+
+    Returns:
+        dict: The parsed OpenAPI spec
+
+    Raises:
+        SystemExit: If the file cannot be read or parsed
+    """
+    source = "<stdin>" if path == "-" else path
+    spec = None
+    try:
+        if path == "-":
+            spec = _parse_spec_document(sys.stdin.buffer.read(), source)
+        else:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    raise ValueError("File is empty")
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    spec = _parse_spec_document(mm, source)
+    except OSError as e:
+        print(f"\n❌ ERROR: Could not read OpenAPI spec from {source}")
+        print(f"   Reason: {e}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"\n❌ ERROR: Invalid OpenAPI spec in {source}")
+        print(f"   Reason: {e}")
+        sys.exit(1)
+
+    if not isinstance(spec, dict):
+        print(f"\n❌ ERROR: OpenAPI spec in {source} is not an object")
+        sys.exit(1)
+
+    return spec
+
+
+def read_openapi_spec_url(url, timeout=10):
+    """Fetch a JSON or YAML OpenAPI spec from a full URL.
+
+    Unlike ``load_openapi_spec``, which fetches ``/openapi.json`` from the
+    server under test, this reads a spec document from anywhere (for
+    example a previous release published by CI).
+
+    Args:
+        url: URL of the spec document
+        timeout: HTTP request timeout in seconds
+
+    Returns:
+        dict: The parsed OpenAPI spec
+
+    Raises:
+        SystemExit: If the spec cannot be fetched or parsed
+    """
+    try:
+        response = get_session(url).get(url, timeout=timeout)
+        response.raise_for_status()
+        spec = _parse_spec_document(response.content, url)
+    except requests.exceptions.RequestException as e:
+        print(f"\n❌ ERROR: Could not fetch OpenAPI spec from {url}")
+        print(f"   Reason: {e}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"\n❌ ERROR: Invalid OpenAPI spec from {url}")
+        print(f"   Reason: {e}")
+        sys.exit(1)
+
+    if not isinstance(spec, dict):
+        print(f"\n❌ ERROR: OpenAPI spec from {url} is not an object")
+        sys.exit(1)
+
+    return spec
+
+
+def validate_openapi_spec(
+    base_url, timeout=10, retries=3, retry_wait=1.0, spec=None, source=None
+):
+    """Validate that the OpenAPI spec is available and meets
+    requirements.
+
+    Checks:
+    1. /openapi.json endpoint is accessible
+    2. All GET/POST/PUT/DELETE endpoints have request examples
+       (where applicable)
+    3. All endpoints have response schemas
+
+    Args:
+        base_url: Base URL of the API server
+        timeout: HTTP request timeout in seconds
+        retries: Number of retry attempts after the first failure (default: 3)
+        retry_wait: Seconds to wait between retries (default: 1.0)
+        spec: Already-loaded spec; fetched with ``load_openapi_spec``
+            when omitted
+        source: Where the spec came from, for messages (defaults to the
+            /openapi.json URL)
+
+    Returns:
+        dict: The validated OpenAPI spec
+
+    Raises:
+        SystemExit: If validation fails
+    """
+    openapi_url = source or f"{base_url}/openapi.json"
+
+    # Check 1: Fetch OpenAPI spec
+    if spec is None:
+        spec = load_openapi_spec(
+            base_url, timeout=timeout, retries=retries, retry_wait=retry_wait
+        )
+
     # Validate the spec structure
     if "paths" not in spec:
         print("\n❌ ERROR: OpenAPI spec missing 'paths' key")
@@ -292,3 +541,5 @@ def validate_openapi_spec(base_url, timeout=10, retries=3, retry_wait=1.0):
 
     print(f"\n✅ OpenAPI spec validated successfully from {openapi_url}")
     print(f"   Found {len(paths)} path(s)")
+
+    return spec
@@ -0,0 +1,222 @@
+"""Machine-readable test outputs: NDJSON results and JUnit XML.
+
+Both outputs are built from the records ``contract.log_test_result``
+writes, reduced to one compact result per case without bodies:
+
+- ``--openapi-json-output=PATH`` streams the results as newline-delimited
+  JSON, one line per case, written as soon as each test finishes.
+- ``--openapi-junit-xml=PATH`` writes a JUnit XML file at the end of the
+  run, with one ``testcase`` per case carrying its request time and the
+  method, path and statuses of its operation as attributes.
+"""
+
+import json
+import xml.etree.ElementTree as ET
+
+_json_file = None
+_kept_results = None
+
+
+def configure_outputs(json_path=None, keep=False):
+    """Set up the machine-readable outputs.
+
+    Args:
+        json_path: NDJSON file receiving one result per case, or None
+        keep: Whether results are kept in memory, for ``write_junit_xml``
+            or to be sent from an xdist worker to the controller
+
+    Raises:
+        OSError: If the NDJSON file cannot be opened
+    """
+    global _json_file, _kept_results
+
+    close_outputs()
+    _kept_results = [] if keep else None
+    if json_path is not None:
+        _json_file = open(json_path, "w", encoding="utf-8")
+
+
+def close_outputs():
+    """Close the NDJSON output, if one is open."""
+    global _json_file
+
+    if _json_file is not None:
+        _json_file.close()
+        _json_file = None
+
+
+def case_result(record, test=None):
+    """Reduce a test record to its machine-readable result.
+
+    Args:
+        record: Record built by ``contract.log_test_result``
+        test: pytest node ID of the test that logged the record
+
+    Returns:
+        dict: ``test``, ``operation``, ``method``, ``path``, ``origin``,
+            ``expected_status``, ``documented_statuses``,
+            ``actual_status``, ``success``, ``skipped``, ``error`` and
+            ``timing``
+    """
+    method = record["method"].upper()
+    operation_path = record.get("operation_path") or record["path"]
+    return {
+        "test": test,
+        "operation": f"{method} {operation_path}",
+        "method": method,
+        "path": record["path"],
+        "origin": record.get("test_case_origin"),
+        "expected_status": record["expected_status"],
+        "documented_statuses": record.get("documented_statuses") or [],
+        "actual_status": record["actual_status"],
+        "success": record["success"],
+        "skipped": None,
+        "error": record["error_message"],
+        "timing": record.get("timing"),
+    }
+
+
+def skipped_result(test, reason):
+    """Build the result of a case that was skipped before sending.
+
+    Args:
+        test: pytest node ID of the skipped test
+        reason: Why the test was skipped
+
+    Returns:
+        dict: A result shaped like ``case_result``'s
+    """
+    return {
+        "test": test,
+        "operation": None,
+        "method": None,
+        "path": None,
+        "origin": None,
+        "expected_status": None,
+        "documented_statuses": [],
+        "actual_status": None,
+        "success": None,
+        "skipped": reason,
+        "error": None,
+        "timing": None,
+    }
+
+
+def failed_result(test, error):
+    """Build the result of a case that failed without logging a record.
+
+    This covers checks that stopped before reaching a contract check,
+    for example on an exception or a missing example.
+
+    Args:
+        test: pytest node ID of the failed test
+        error: Why the test failed
+
+    Returns:
+        dict: A result shaped like ``case_result``'s
+    """
+    result = skipped_result(test, None)
+    result["success"] = False
+    result["error"] = error
+    return result
+
+
+def record_case_results(results):
+    """Publish case results to the configured outputs.
+
+    Args:
+        results: Results from ``case_result`` or ``skipped_result``
+    """
+    for result in results:
+        if _json_file is not None:
+            _json_file.write(json.dumps(result, default=str) + "\n")
+        if _kept_results is not None:
+            _kept_results.append(result)
+    if _json_file is not None:
+        _json_file.flush()
+
+
+def kept_case_results():
+    """Return the results kept since ``configure_outputs(keep=True)``.
+
+    Returns:
+        list: Results in publication order (empty if none are kept)
+    """
+    return list(_kept_results or [])
+
+
+def _testcase_name(result):
+    test = result["test"] or result["operation"]
+    return test.split("::", 1)[-1]
+
+
+def make_junit_xml(results, suite_name="pytest-openapi"):
+    """Build a JUnit XML document from case results.
+
+    Args:
+        results: Results from ``case_result`` or ``skipped_result``
+        suite_name: Name of the single test suite
+
+    Returns:
+        xml.etree.ElementTree.Element: The ``testsuites`` root element
+    """
+    failures = sum(1 for r in results if r["success"] is False)
+    skipped = sum(1 for r in results if r["skipped"] is not None)
+    total_ms = sum((r["timing"] or {}).get("total_ms", 0) for r in results)
+
+    root = ET.Element("testsuites")
+    suite = ET.SubElement(
+        root,
+        "testsuite",
+        name=suite_name,
+        tests=str(len(results)),
+        failures=str(failures),
+        errors="0",
+        skipped=str(skipped),
+        time=f"{total_ms / 1000:.3f}",
+    )
+    for result in results:
+        timing = result["timing"] or {}
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname=suite_name,
+            name=_testcase_name(result),
+            time=f"{timing.get('total_ms', 0) / 1000:.3f}",
+        )
+        for attribute in ("operation", "method", "path", "origin"):
+            if result[attribute] is not None:
+                case.set(attribute, str(result[attribute]))
+        for attribute in ("expected_status", "actual_status"):
+            if result[attribute] is not None:
+                case.set(attribute, str(result[attribute]))
+        if "ttfb_ms" in timing:
+            case.set("ttfb_ms", f"{timing['ttfb_ms']:g}")
+
+        if result["skipped"] is not None:
+            ET.SubElement(case, "skipped", message=result["skipped"])
+        elif result["success"] is False:
+            error = result["error"] or "Contract check failed"
+            failure = ET.SubElement(
+                case, "failure", message=error.split("\n", 1)[0]
+            )
+            failure.text = error
+    return root
+
+
+def write_junit_xml(path):
+    """Write the results kept during the run as JUnit XML.
+
+    Args:
+        path: Output file path
+
+    Returns:
+        int: Number of test cases written
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    results = _kept_results or []
+    tree = ET.ElementTree(make_junit_xml(results))
+    tree.write(path, encoding="utf-8", xml_declaration=True)
+    return len(results)
@@ -0,0 +1,337 @@
+"""Collection plan: which OpenAPI cases become pytest items.
+
+Collection first builds a plan with one entry per request that could be
+sent (one per GET/DELETE operation, one per request body case for
+POST/PUT), then trims it to the configured case budgets, and only then
+turns the remaining entries into pytest items.
+
+When a budget is smaller than the plan, cases are kept by value:
+explicit examples (and GET/DELETE checks) first, then boundary cases (on
+a declared minimum, maximum, length or item count edge) and negative
+cases that the API is expected to reject, then the remaining generated
+cases, each in generation order. The selection is deterministic, so the
+same spec and budget always produce the same items.
+
+With ``--openapi-shard INDEX/COUNT`` the trimmed plan is then split across
+COUNT independent CI jobs. Whole operations are balanced across shards by
+estimated cost (historical duration when available, case count otherwise),
+and each job keeps only its own shard.
+
+With ``--openapi-changed-since`` the plan is first narrowed to the
+operations whose contract changed since a previous spec, plus a small
+smoke subset that always runs.
+"""
+
+from .case_generator import generate_test_case_records, make_case_record
+from .contract import classify_case
+
+# Case priorities, lowest first. Boundary cases rank with negative ones.
+PRIORITY_EXAMPLE = 0
+PRIORITY_NEGATIVE = 1
+PRIORITY_GENERATED = 2
+
+# Vendor extension holding per-operation plugin settings
+VENDOR_EXTENSION = "x-pytest-openapi"
+
+
+def collect_request_cases(operation, spec=None):
+    """Return the case records for a POST/PUT operation's request body.
+
+    Explicit examples come first, classified once here so that the check
+    does not have to re-walk them, followed by the cases generated from
+    the schema, which are tagged as they are generated.
+
+    Args:
+        operation: OpenAPI operation object
+        spec: Full OpenAPI spec dict for $ref resolution
+
+    Returns:
+        list: Case records (see ``case_generator.make_case_record``)
+    """
+    request_body_def = operation.get("requestBody", {})
+    request_content = request_body_def.get("content", {})
+
+    cases = []
+    for media_type, media_obj in request_content.items():
+        schema = media_obj.get("schema")
+        if "example" in media_obj:
+            cases.append(classify_case(schema, media_obj["example"], spec=spec))
+        if "examples" in media_obj:
+            for ex_name, ex_obj in media_obj["examples"].items():
+                if "value" in ex_obj:
+                    cases.append(
+                        classify_case(schema, ex_obj["value"], spec=spec)
+                    )
+
+        if schema is not None:
+            generated, _ = generate_test_case_records(
+                schema, "request_body", spec
+            )
+            cases.extend(generated)
+        break
+
+    # If no requestBody is defined, still test the endpoint with no body
+    if not cases and "requestBody" not in operation:
+        cases.append(make_case_record(None, "example"))
+
+    return cases
+
+
+def make_plan_entry(method, path, operation, index=0, case=None):
+    """Create one plan entry.
+
+    Args:
+        method: HTTP method (lowercase)
+        path: API endpoint path
+        operation: OpenAPI operation object
+        index: Position of the case within its operation
+        case: Request body case record, or None for GET/DELETE
+
+    Returns:
+        dict: Plan entry
+    """
+    return {
+        "method": method,
+        "path": path,
+        "operation": operation,
+        "index": index,
+        "case": case,
+    }
+
+
+def case_priority(case):
+    """Return the priority of a planned case (lower is more valuable).
+
+    Args:
+        case: Case record, or None for a GET/DELETE check
+
+    Returns:
+        int: One of the ``PRIORITY_*`` constants
+    """
+    if case is None or case["origin"] == "example":
+        return PRIORITY_EXAMPLE
+    if case["expected"] == "reject" or case["intent"] == "boundary":
+        return PRIORITY_NEGATIVE
+    return PRIORITY_GENERATED
+
+
+def operation_case_budget(operation, default=None):
+    """Return the case budget of one operation.
+
+    An operation can override the global per-operation budget with the
+    vendor extension ``x-pytest-openapi: {max-cases: N}``.
+
+    Args:
+        operation: OpenAPI operation object
+        default: Budget used when the operation does not set one
+
+    Returns:
+        int or None: Maximum number of cases, or None for no limit
+    """
+    settings = operation.get(VENDOR_EXTENSION)
+    if isinstance(settings, dict):
+        budget = settings.get("max-cases")
+        if isinstance(budget, int) and not isinstance(budget, bool):
+            if budget >= 0:
+                return budget
+    return default
+
+
+def apply_case_budgets(plan, max_per_operation=None, max_total=None):
+    """Trim a plan to the per-operation and total case budgets.
+
+    Each operation first keeps its most valuable cases up to its own
+    budget. If the total is still over ``max_total``, cases are kept by
+    priority across all operations; within a priority, operations take
+    turns, so every operation gets its best case before any gets its
+    second.
+
+    Args:
+        plan: List of plan entries, in collection order
+        max_per_operation: Default per-operation budget, None for no limit
+        max_total: Budget for the whole run, None for no limit
+
+    Returns:
+        list: The kept entries, in their original collection order
+    """
+    operations = {}
+    for position, entry in enumerate(plan):
+        key = (entry["method"], entry["path"])
+        operations.setdefault(key, []).append(position)
+
+    # (priority, rank within operation, operation order) per kept entry
+    ranked = []
+    for op_order, positions in enumerate(operations.values()):
+        budget = operation_case_budget(
+            plan[positions[0]]["operation"], max_per_operation
+        )
+        by_value = sorted(
+            positions, key=lambda p: case_priority(plan[p]["case"])
+        )
+        if budget is not None:
+            by_value = by_value[:budget]
+        for rank, position in enumerate(by_value):
+            ranked.append(
+                (
+                    (case_priority(plan[position]["case"]), rank, op_order),
+                    position,
+                )
+            )
+
+    if max_total is not None and len(ranked) > max_total:
+        ranked.sort()
+        ranked = ranked[:max_total]
+
+    return [plan[position] for position in sorted(p for _, p in ranked)]
+
+
+def parse_shard(value):
+    """Parse a ``--openapi-shard`` value.
+
+    Args:
+        value: ``"INDEX/COUNT"``, with INDEX counted from 1
+
+    Returns:
+        tuple: (index, count), with index counted from 1
+
+    Raises:
+        ValueError: If the value is malformed or INDEX is out of range
+    """
+    index, sep, count = str(value).partition("/")
+    if not sep:
+        raise ValueError(f"expected INDEX/COUNT, got {value!r}")
+    index, count = int(index), int(count)
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"shard {index} out of range 1..{count}")
+    return index, count
+
+
+def operation_costs(plan, durations=None):
+    """Estimate how long each operation of a plan takes to run.
+
+    The cost of an operation is its number of planned cases times its
+    historical duration per case. Operations without history are costed
+    at the median of the known durations, and if nothing is known every
+    case costs 1, so the cost is the case count.
+
+    Args:
+        plan: List of plan entries
+        durations: Optional ``"METHOD /path"`` -> duration per case (ms)
+
+    Returns:
+        dict: ``"METHOD /path"`` -> estimated cost, in plan order
+    """
+    counts = {}
+    for entry in plan:
+        key = f"{entry['method'].upper()} {entry['path']}"
+        counts[key] = counts.get(key, 0) + 1
+
+    known = sorted(
+        d
+        for d in (durations or {}).values()
+        if isinstance(d, (int, float)) and d > 0
+    )
+    default = known[len(known) // 2] if known else 1.0
+
+    costs = {}
+    for key, count in counts.items():
+        duration = (durations or {}).get(key)
+        if not isinstance(duration, (int, float)) or duration <= 0:
+            duration = default
+        costs[key] = count * duration
+    return costs
+
+
+def shard_plan(plan, index, count, durations=None):
+    """Keep the plan entries that belong to one shard.
+
+    Operations are the unit of distribution, so all cases of one
+    operation land on the same shard and keep their relative order.
+    They are assigned longest-processing-time first: the most expensive
+    operation goes to the least loaded shard, ties broken by operation
+    name and shard number, so every CI node computes the same split.
+
+    Args:
+        plan: List of plan entries, in collection order
+        index: Shard number, counted from 1
+        count: Total number of shards
+        durations: Optional ``"METHOD /path"`` -> duration per case (ms),
+            see ``operation_costs``
+
+    Returns:
+        list: The entries of shard *index*, in their original order
+    """
+    costs = operation_costs(plan, durations)
+    loads = [0.0] * count
+    shard_of = {}
+    for key in sorted(costs, key=lambda k: (-costs[k], k)):
+        shard = min(range(count), key=lambda s: (loads[s], s))
+        shard_of[key] = shard
+        loads[shard] += costs[key]
+
+    return [
+        entry
+        for entry in plan
+        if shard_of[f"{entry['method'].upper()} {entry['path']}"] == index - 1
+    ]
+
+
+def is_smoke_operation(operation):
+    """Return whether an operation is flagged as part of the smoke subset.
+
+    Operations opt in with ``x-pytest-openapi: {smoke: true}``.
+
+    Args:
+        operation: OpenAPI operation object
+
+    Returns:
+        bool: True if the operation is flagged
+    """
+    settings = operation.get(VENDOR_EXTENSION)
+    return isinstance(settings, dict) and settings.get("smoke") is True
+
+
+def smoke_operations(plan):
+    """Return the operations that run even when their contract is unchanged.
+
+    These are the operations flagged with ``is_smoke_operation``. When the
+    spec flags none, they default to the GET operations without path
+    parameters, which each cost one read-only request.
+
+    Args:
+        plan: List of plan entries
+
+    Returns:
+        set: ``"METHOD /path"`` of the smoke operations
+    """
+    flagged = {
+        f"{entry['method'].upper()} {entry['path']}"
+        for entry in plan
+        if is_smoke_operation(entry["operation"])
+    }
+    if flagged:
+        return flagged
+    return {
+        f"GET {entry['path']}"
+        for entry in plan
+        if entry["method"] == "get" and "{" not in entry["path"]
+    }
+
+
+def select_changed(plan, changed):
+    """Keep the entries of changed operations and of the smoke subset.
+
+    Args:
+        plan: List of plan entries, in collection order
+        changed: ``"METHOD /path"`` of the changed operations (see
+            ``specdiff.changed_operations``)
+
+    Returns:
+        list: The kept entries, in their original order
+    """
+    keep = set(changed) | smoke_operations(plan)
+    return [
+        entry
+        for entry in plan
+        if f"{entry['method'].upper()} {entry['path']}" in keep
+    ]
@@ -1,7 +1,11 @@
 """Pytest plugin for OpenAPI contract testing."""
 
+import functools
 import json
+import os
 import re
+import shutil
+import tempfile
 import time
 
 import pytest
@@ -9,9 +13,68 @@ import requests
 from _pytest.python import Module
 
 from . import contract
-from .case_generator import generate_test_cases_for_schema
-from .contract import get_test_report_markdown
-from .openapi import validate_openapi_spec
+from .case_generator import (
+    DEFAULT_COMBINATION_STRENGTH,
+    DEFAULT_MAX_COMBINATIONS,
+    configure_combinations,
+)
+from .contract import write_test_report_markdown
+from .latency import (
+    DEFAULT_REGRESSION_RATIO,
+    find_regressions,
+    read_baseline,
+    write_baseline,
+)
+from .load import (
+    DEFAULT_LOAD_METHODS,
+    format_load_summary,
+    get_load_report_markdown,
+    run_load,
+)
+from .openapi import (
+    load_openapi_spec,
+    read_openapi_spec_file,
+    read_openapi_spec_url,
+    validate_openapi_spec,
+)
+from .outputs import (
+    case_result,
+    close_outputs,
+    configure_outputs,
+    failed_result,
+    record_case_results,
+    skipped_result,
+    write_junit_xml,
+)
+from .plan import (
+    apply_case_budgets,
+    case_priority,
+    collect_request_cases,
+    make_plan_entry,
+    parse_shard,
+    select_changed,
+    shard_plan,
+    smoke_operations,
+)
+from .records import (
+    close_records,
+    configure_records,
+    flush_records,
+    iter_records,
+)
+from .runner import replay_outcome, run_checks_concurrently
+from .session import (
+    DEFAULT_POOL_SIZE,
+    close_sessions,
+    configure_sessions,
+    get_session,
+)
+from .specdiff import changed_operations
+from .streaming import (
+    DEFAULT_MAX_STREAM_BYTES,
+    DEFAULT_MAX_STREAM_EVENTS,
+    configure_streaming,
+)
 
 # Module-level variable to store config for access in hooks
 _pytest_config = None
@@ -42,6 +105,51 @@ def pytest_addoption(parser):
         default=None,
         help="Write test results in Markdown format to the specified file",
     )
+    group.addoption(
+        "--openapi-report-omit-passing-bodies",
+        action="store_true",
+        default=False,
+        help=(
+            "Leave the request and response bodies of passing tests out of"
+            " the Markdown report"
+        ),
+    )
+    group.addoption(
+        "--openapi-report-collapse-expected",
+        action="store_true",
+        default=False,
+        help=(
+            "Show each distinct expected response body once in the Markdown"
+            " report and refer back to it from later tests"
+        ),
+    )
+    group.addoption(
+        "--openapi-report-max-json-bytes",
+        action="store",
+        metavar="N",
+        default=None,
+        help="Cut JSON bodies in the Markdown report after N bytes",
+    )
+    group.addoption(
+        "--openapi-json-output",
+        action="store",
+        metavar="FILENAME",
+        default=None,
+        help=(
+            "Stream one JSON result per case (newline-delimited) to the"
+            " specified file while the tests run"
+        ),
+    )
+    group.addoption(
+        "--openapi-junit-xml",
+        action="store",
+        metavar="FILENAME",
+        default=None,
+        help=(
+            "Write a JUnit XML file with one test case per OpenAPI case,"
+            " its request time and its operation"
+        ),
+    )
     group.addoption(
         "--openapi-no-stdout",
         action="store_true",
@@ -85,109 +193,849 @@ def pytest_addoption(parser):
             " (default: 1.0)"
         ),
     )
+    group.addoption(
+        "--openapi-spec-cache",
+        action="store",
+        metavar="DIR",
+        default=None,
+        help=(
+            "Cache /openapi.json in DIR and revalidate it with a"
+            " conditional request on the next run"
+        ),
+    )
+    group.addoption(
+        "--openapi-spec",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "Read the OpenAPI spec (JSON, or YAML if PyYAML is installed)"
+            " from PATH, or from stdin if PATH is '-', instead of fetching"
+            " /openapi.json; requests still go to --openapi"
+        ),
+    )
+    group.addoption(
+        "--openapi-pool-size",
+        action="store",
+        metavar="N",
+        default=DEFAULT_POOL_SIZE,
+        help=(
+            "Maximum number of pooled connections kept open to the"
+            f" target API (default: {DEFAULT_POOL_SIZE})"
+        ),
+    )
+    group.addoption(
+        "--openapi-concurrency",
+        action="store",
+        metavar="N",
+        default=1,
+        help=(
+            "Run OpenAPI checks concurrently with at most N requests in"
+            " flight (default: 1, run serially)"
+        ),
+    )
+    group.addoption(
+        "--openapi-strict-path-order",
+        action="store_true",
+        default=False,
+        help=(
+            "With --openapi-concurrency, run the checks of each path one"
+            " at a time, in collection order"
+        ),
+    )
+    group.addoption(
+        "--openapi-combination-strength",
+        action="store",
+        metavar="T",
+        default=DEFAULT_COMBINATION_STRENGTH,
+        help=(
+            "Combine object property values so that every combination of"
+            " values of any T properties is sent at least once"
+            f" (default: {DEFAULT_COMBINATION_STRENGTH}, pairwise)"
+        ),
+    )
+    group.addoption(
+        "--openapi-max-combinations",
+        action="store",
+        metavar="N",
+        default=DEFAULT_MAX_COMBINATIONS,
+        help=(
+            "Maximum number of combined objects generated per object"
+            f" schema (default: {DEFAULT_MAX_COMBINATIONS})"
+        ),
+    )
+    group.addoption(
+        "--openapi-stream-max-bytes",
+        action="store",
+        metavar="N",
+        default=DEFAULT_MAX_STREAM_BYTES,
+        help=(
+            "Stop reading an SSE/NDJSON response after N bytes"
+            f" (default: {DEFAULT_MAX_STREAM_BYTES})"
+        ),
+    )
+    group.addoption(
+        "--openapi-stream-max-events",
+        action="store",
+        metavar="N",
+        default=DEFAULT_MAX_STREAM_EVENTS,
+        help=(
+            "Stop reading an SSE/NDJSON response after N events"
+            f" (default: {DEFAULT_MAX_STREAM_EVENTS})"
+        ),
+    )
+    group.addoption(
+        "--openapi-records-file",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "Write every test record to PATH (JSON Lines) as soon as its"
+            " test finishes and drop its bodies from memory; the Markdown"
+            " report is rendered from this file"
+        ),
+    )
+    group.addoption(
+        "--openapi-max-body-bytes",
+        action="store",
+        metavar="N",
+        default=None,
+        help=(
+            "Truncate request/response bodies and error messages longer"
+            " than N bytes in test records and reports"
+        ),
+    )
+    group.addoption(
+        "--openapi-max-cases-per-operation",
+        action="store",
+        metavar="N",
+        default=None,
+        help=(
+            "Run at most N cases per operation, keeping examples first,"
+            " then boundary and negative cases, then other generated"
+            " cases. Operations can override it with"
+            " 'x-pytest-openapi: {max-cases: N}'"
+        ),
+    )
+    group.addoption(
+        "--openapi-max-total-cases",
+        action="store",
+        metavar="N",
+        default=None,
+        help=(
+            "Run at most N OpenAPI cases in total, keeping the most"
+            " valuable cases across all operations"
+        ),
+    )
+    group.addoption(
+        "--openapi-shard",
+        action="store",
+        metavar="INDEX/COUNT",
+        default=None,
+        help=(
+            "Run only shard INDEX (from 1) of COUNT. Operations are"
+            " balanced across shards by their duration in"
+            " --openapi-compare-baseline, or by case count without a"
+            " baseline; all cases of an operation run on the same shard"
+        ),
+    )
+    group.addoption(
+        "--openapi-changed-since",
+        action="store",
+        metavar="PATH_OR_URL",
+        default=None,
+        help=(
+            "Compare the spec with a previous version (a JSON or YAML file"
+            " or URL) and run only the operations whose request or"
+            " response contract changed, including through $ref"
+            " components, plus the smoke operations: those flagged with"
+            " 'x-pytest-openapi: {smoke: true}', or by default the GET"
+            " operations without path parameters"
+        ),
+    )
+    group.addoption(
+        "--openapi-time-budget",
+        action="store",
+        metavar="SECONDS",
+        default=None,
+        help=(
+            "Stop sending OpenAPI requests SECONDS after the run starts and"
+            " skip the remaining OpenAPI items. Previously failed cases and"
+            " examples run first"
+        ),
+    )
+    group.addoption(
+        "--openapi-max-latency-ms",
+        action="store",
+        metavar="MS",
+        default=None,
+        help=(
+            "Fail OpenAPI cases whose response takes longer than MS"
+            " milliseconds. x-latency-budget-ms on an operation or response"
+            " overrides it"
+        ),
+    )
+    group.addoption(
+        "--openapi-latency-samples",
+        action="store",
+        metavar="N",
+        default="1",
+        help=(
+            "Re-measure a slow GET/PUT response up to N times in total and"
+            " compare the median with its latency budget (default: 1)."
+            " POST and DELETE responses are measured once and never re-sent"
+        ),
+    )
+    group.addoption(
+        "--openapi-load",
+        action="store_true",
+        default=False,
+        help=(
+            "Load-test mode: replay the OpenAPI case corpus for"
+            " --openapi-load-duration seconds instead of running each case"
+            " once, validating every response"
+        ),
+    )
+    group.addoption(
+        "--openapi-load-duration",
+        action="store",
+        metavar="SECONDS",
+        default="10",
+        help="Duration of the load test in seconds (default: 10)",
+    )
+    group.addoption(
+        "--openapi-load-rps",
+        action="store",
+        metavar="RPS",
+        default=None,
+        help=(
+            "Target request rate of the load test (open loop). Without it,"
+            " --openapi-load-concurrency workers send requests back to back"
+        ),
+    )
+    group.addoption(
+        "--openapi-load-concurrency",
+        action="store",
+        metavar="N",
+        default="10",
+        help="Maximum number of load-test requests in flight (default: 10)",
+    )
+    group.addoption(
+        "--openapi-load-methods",
+        action="store",
+        metavar="METHODS",
+        default=",".join(DEFAULT_LOAD_METHODS),
+        help=(
+            "Comma-separated HTTP methods replayed by the load test"
+            " (default: get). Mutating methods must be opted in"
+        ),
+    )
+    group.addoption(
+        "--openapi-load-max-error-rate",
+        action="store",
+        metavar="RATE",
+        default="0",
+        help=(
+            "Fail the load test if more than RATE (0-1) of the responses"
+            " break the contract (default: 0)"
+        ),
+    )
+    group.addoption(
+        "--openapi-write-baseline",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "Write the per-operation latency percentiles of this run to"
+            " PATH, for use with --openapi-compare-baseline"
+        ),
+    )
+    group.addoption(
+        "--openapi-compare-baseline",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "Fail the run if an operation's p95 latency regressed against"
+            " the baseline in PATH"
+        ),
+    )
+    group.addoption(
+        "--openapi-regression-ratio",
+        action="store",
+        metavar="RATIO",
+        default=str(DEFAULT_REGRESSION_RATIO),
+        help=(
+            "Allowed p95 growth factor versus the baseline before an"
+            " operation counts as regressed"
+            f" (default: {DEFAULT_REGRESSION_RATIO:g})"
+        ),
+    )
+    group.addoption(
+        "--openapi-no-keep-alive",
+        action="store_true",
+        default=False,
+        help=(
+            "Open a new connection for every request instead of"
+            " reusing pooled keep-alive connections"
+        ),
+    )
 
 
-def pytest_configure(config):
-    """Configure pytest with OpenAPI marker and validate spec."""
-    config.addinivalue_line(
-        "markers",
-        "openapi: OpenAPI contract tests",
+def _read_spec_file(config, spec_path):
+    """Read the spec given with --openapi-spec, releasing stdin if
+    needed.
+
+    pytest keeps stdin redirected while it configures plugins, so it is
+    handed back for the duration of the read when the path is ``-``.
+    """
+    capman = config.pluginmanager.getplugin("capturemanager")
+    if spec_path != "-" or capman is None:
+        return read_openapi_spec_file(spec_path)
+
+    capman.suspend_global_capture(in_=True)
+    try:
+        return read_openapi_spec_file(spec_path)
+    finally:
+        # Back to the state pytest_configure runs in: only stdin captured
+        capman.resume_global_capture()
+        capman.suspend_global_capture()
+
+
+def _option_value(config, name, convert, is_valid):
+    """Return option *name* converted with *convert*, or None when unset.
+
+    Exits pytest with status 2 when the value cannot be converted or is
+    rejected by *is_valid*.
+    """
+    value = config.getoption(name)
+    if value is None:
+        return None
+    try:
+        converted = convert(value)
+        if not is_valid(converted):
+            raise ValueError(value)
+    except ValueError:
+        pytest.exit(f"Invalid value for {name}: {value}", returncode=2)
+    return converted
+
+
+def _int_option(config, name, minimum):
+    """Return integer option *name*, which must be at least *minimum*."""
+    return _option_value(config, name, int, lambda v: v >= minimum)
+
+
+def _float_option(config, name, minimum, exclusive=False):
+    """Return float option *name*, which must be at least *minimum*.
+
+    With *exclusive*, the value must be strictly greater than *minimum*.
+    """
+    if exclusive:
+        return _option_value(config, name, float, lambda v: v > minimum)
+    return _option_value(config, name, float, lambda v: v >= minimum)
+
+
+def _configure_execution(config):
+    """Validate the options that shape how cases are sent and timed."""
+    concurrency = _int_option(config, "--openapi-concurrency", 1)
+
+    baseline_path = config.getoption("--openapi-compare-baseline")
+    baseline = None
+    if baseline_path:
+        try:
+            baseline = read_baseline(baseline_path)
+        except (OSError, ValueError) as e:
+            pytest.exit(
+                f"❌ Cannot read latency baseline {baseline_path}: {e}",
+                returncode=2,
+            )
+    load = None
+    if config.getoption("--openapi-load"):
+        load = _load_options(config)
+
+    # Every in-flight request needs its own pooled connection, or
+    # load-test latencies would include new handshakes
+    in_flight = concurrency
+    if load is not None:
+        in_flight = max(in_flight, load["concurrency"])
+    configure_sessions(
+        pool_size=max(_int_option(config, "--openapi-pool-size", 1), in_flight),
+        keep_alive=not config.getoption("--openapi-no-keep-alive"),
+    )
+    configure_combinations(
+        strength=_int_option(config, "--openapi-combination-strength", 1),
+        max_combinations=_int_option(config, "--openapi-max-combinations", 1),
+    )
+    configure_streaming(
+        max_bytes=_int_option(config, "--openapi-stream-max-bytes", 1),
+        max_events=_int_option(config, "--openapi-stream-max-events", 1),
     )
 
-    # If --openapi flag is provided, validate and store the OpenAPI spec
-    base_url = config.getoption("--openapi")
+    config._openapi_concurrency = concurrency
+    config._openapi_max_latency_ms = _float_option(
+        config, "--openapi-max-latency-ms", 0, exclusive=True
+    )
+    config._openapi_latency_samples = _int_option(
+        config, "--openapi-latency-samples", 1
+    )
+    config._openapi_regression_ratio = _float_option(
+        config, "--openapi-regression-ratio", 1
+    )
+    config._openapi_baseline = baseline
+    config._openapi_baseline_path = baseline_path
+    config._openapi_write_baseline = config.getoption(
+        "--openapi-write-baseline"
+    )
+    config._openapi_load = load
+    config._openapi_load_summary = None
 
-    if base_url:
-        strict_examples = not config.getoption(
-            "--openapi-no-strict-example-checking"
+
+def _configure_xdist_worker(config):
+    """Set up the state of an xdist worker from what its controller sent.
+
+    Workers send their case results to the controller with each report,
+    and write their records to a file of their own, which the controller
+    merges at the end of the run.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    config._openapi_worker_records = None
+    if workerinput is not None and "openapi_worker_dir" in workerinput:
+        config._openapi_worker_records = _worker_records_path(
+            workerinput["openapi_worker_dir"], workerinput["workerid"]
         )
-        markdown_output_file = config.getoption("--openapi-markdown-output")
-        no_stdout = config.getoption("--openapi-no-stdout")
-        ignore_pattern = config.getoption("--openapi-ignore")
-        openapi_timeout = float(config.getoption("--openapi-timeout"))
-        openapi_retries = int(config.getoption("--openapi-retries"))
-        openapi_retry_wait = float(config.getoption("--openapi-retry-wait"))
-        max_attempts = openapi_retries + 1
-
-        # Run validation checks
-        validate_openapi_spec(
-            base_url,
-            timeout=openapi_timeout,
-            retries=openapi_retries,
-            retry_wait=openapi_retry_wait,
+    # An xdist worker only runs a phase concurrently over the items
+    # queued to it, which worksteal scheduling can take away
+    config._openapi_xdist_worker = _xdist_worker(config)
+    if workerinput is not None:
+        config._openapi_concurrency = workerinput.get(
+            "openapi_concurrency", config._openapi_concurrency
+        )
+        if config._openapi_xdist_worker is None:
+            config._openapi_concurrency = 1
+        if workerinput.get("openapi_loadgroup"):
+            config.option.loadgroup = True
+
+
+def _configure_outputs(config):
+    """Open the JSON and records outputs, and read the report options."""
+    is_worker = hasattr(config, "workerinput")
+    json_output_file = config.getoption("--openapi-json-output")
+    junit_xml_file = config.getoption("--openapi-junit-xml")
+    try:
+        if not is_worker:
+            configure_outputs(
+                json_path=json_output_file, keep=bool(junit_xml_file)
+            )
+    except OSError as e:
+        pytest.exit(
+            f"Cannot open --openapi-json-output {json_output_file}: {e}",
+            returncode=2,
         )
 
-        # Fetch the OpenAPI spec
-        spec = None
-        last_exc = None
-        for attempt in range(1, max_attempts + 1):
-            try:
-                response = requests.get(
-                    f"{base_url}/openapi.json", timeout=openapi_timeout
-                )
-                response.raise_for_status()
-                spec = response.json()
-                break
-            except (requests.exceptions.RequestException, ValueError) as e:
-                last_exc = e
-                if attempt < max_attempts:
-                    print(
-                        f"\n⚠️  Attempt {attempt}/{max_attempts} failed fetching"
-                        f" OpenAPI spec: {e}. Retrying in"
-                        f" {openapi_retry_wait}s..."
-                    )
-                    time.sleep(openapi_retry_wait)
-        if spec is None:
+    records_file = config.getoption("--openapi-records-file")
+    max_body_bytes = _int_option(config, "--openapi-max-body-bytes", 1)
+    try:
+        configure_records(
+            path=(
+                config._openapi_worker_records if is_worker else records_file
+            ),
+            max_body_bytes=max_body_bytes,
+        )
+    except OSError as e:
+        pytest.exit(
+            f"Cannot open --openapi-records-file {records_file}: {e}",
+            returncode=2,
+        )
+
+    config._openapi_markdown_output = config.getoption(
+        "--openapi-markdown-output"
+    )
+    config._openapi_records_file = records_file
+    config._openapi_json_output = json_output_file
+    config._openapi_junit_xml = junit_xml_file
+    config._openapi_records_published = 0
+    config._openapi_worker_outputs = {}
+    config._openapi_report_options = {
+        "omit_passing_bodies": config.getoption(
+            "--openapi-report-omit-passing-bodies"
+        ),
+        "collapse_expected": config.getoption(
+            "--openapi-report-collapse-expected"
+        ),
+        "max_json_bytes": _int_option(
+            config, "--openapi-report-max-json-bytes", 1
+        ),
+    }
+
+
+def _configure_selection(config):
+    """Validate the options that select which cases run."""
+    shard = config.getoption("--openapi-shard")
+    if shard is not None:
+        try:
+            shard = parse_shard(shard)
+        except ValueError as e:
+            pytest.exit(f"Invalid value for --openapi-shard: {e}", returncode=2)
+
+    # Compile ignore pattern if provided
+    ignore_pattern = config.getoption("--openapi-ignore")
+    ignore_re = None
+    if ignore_pattern:
+        try:
+            ignore_re = re.compile(ignore_pattern)
+        except re.error:
             pytest.exit(
-                f"\n❌ Failed to fetch OpenAPI spec after {max_attempts}"
-                f" attempts: {last_exc}",
-                returncode=1,
+                f"Invalid regular expression for"
+                f" --openapi-ignore: {ignore_pattern}",
+                returncode=2,
             )
 
+    config._openapi_shard = shard
+    config._openapi_ignore_re = ignore_re
+    config._openapi_ignore_pattern = ignore_pattern
+    config._openapi_max_cases_per_operation = _int_option(
+        config, "--openapi-max-cases-per-operation", 0
+    )
+    config._openapi_max_total_cases = _int_option(
+        config, "--openapi-max-total-cases", 0
+    )
+    config._openapi_strict_path_order = config.getoption(
+        "--openapi-strict-path-order"
+    )
+
+
+def _load_spec(config, base_url):
+    """Load the OpenAPI spec once and validate the parsed document.
+
+    xdist workers receive the spec, and the changed operations, the
+    controller already validated and computed.
+
+    Returns:
+        str: Where the spec was loaded from
+    """
+    workerinput = getattr(config, "workerinput", None)
+    openapi_timeout = config._openapi_timeout
+    spec_path = config.getoption("--openapi-spec")
+    if workerinput is not None and "openapi_spec" in workerinput:
+        spec_source = "the xdist controller"
+        spec = json.loads(workerinput["openapi_spec"])
+    elif spec_path:
+        spec_source = "stdin" if spec_path == "-" else spec_path
+        spec = _read_spec_file(config, spec_path)
+    else:
+        spec_source = f"{base_url}/openapi.json"
+        spec = load_openapi_spec(
+            base_url,
+            timeout=openapi_timeout,
+            retries=int(config.getoption("--openapi-retries")),
+            retry_wait=float(config.getoption("--openapi-retry-wait")),
+            cache_dir=config.getoption("--openapi-spec-cache"),
+        )
+    if workerinput is None:
+        validate_openapi_spec(base_url, spec=spec, source=spec_source)
+
         # Reset server state if /reset endpoint exists (for testing)
         try:
-            reset_response = requests.post(
+            reset_response = get_session(base_url).post(
                 f"{base_url}/reset", timeout=openapi_timeout
             )
             if reset_response.status_code == 200:
-                if not no_stdout:
+                if not config._openapi_no_stdout:
                     print(f"🔄 Server state reset via {base_url}/reset")
         except requests.exceptions.RequestException:
-            # Server doesn't have /reset endpoint or it failed - that's OK
+            # Server doesn't have /reset endpoint or it failed - OK
             pass
 
-        # Compile ignore pattern if provided
-        ignore_re = None
-        if ignore_pattern:
-            try:
-                ignore_re = re.compile(ignore_pattern)
-            except re.error:
-                pytest.exit(
-                    f"Invalid regular expression for"
-                    f" --openapi-ignore: {ignore_pattern}",
-                    returncode=2,
-                )
+    # Operations whose contract changed since the previous spec
+    changed = None
+    changed_since = config.getoption("--openapi-changed-since")
+    if workerinput is not None and "openapi_changed" in workerinput:
+        changed = set(workerinput["openapi_changed"])
+    elif changed_since:
+        if changed_since.startswith(("http://", "https://")):
+            previous = read_openapi_spec_url(
+                changed_since, timeout=openapi_timeout
+            )
+        else:
+            previous = _read_spec_file(config, changed_since)
+        changed = changed_operations(previous, spec)
+
+    config._openapi_spec = spec
+    config._openapi_changed = changed
+    config._openapi_changed_since = changed_since
+    return spec_source
+
+
+def pytest_configure(config):
+    """Configure pytest with OpenAPI marker and validate spec."""
+    config.addinivalue_line(
+        "markers",
+        "openapi: OpenAPI contract tests",
+    )
+
+    # If --openapi flag is provided, validate and store the OpenAPI spec
+    base_url = config.getoption("--openapi")
+
+    if base_url:
+        # The time budget covers the whole run, spec loading included
+        time_budget = _float_option(
+            config, "--openapi-time-budget", 0, exclusive=True
+        )
+        deadline = None
+        if time_budget is not None:
+            deadline = time.monotonic() + time_budget
 
         # Store configuration on the config object for use during
         # test generation and execution
         config._openapi_base_url = base_url
-        config._openapi_spec = spec
-        config._openapi_strict_examples = strict_examples
-        config._openapi_timeout = openapi_timeout
-        config._openapi_markdown_output = markdown_output_file
-        config._openapi_no_stdout = no_stdout
-        config._openapi_ignore_re = ignore_re
-        config._openapi_ignore_pattern = ignore_pattern
+        config._openapi_strict_examples = not config.getoption(
+            "--openapi-no-strict-example-checking"
+        )
+        config._openapi_timeout = float(config.getoption("--openapi-timeout"))
+        config._openapi_no_stdout = config.getoption("--openapi-no-stdout")
+        config._openapi_results = {}
+        config._openapi_time_budget = time_budget
+        config._openapi_deadline = deadline
+        config._openapi_budget_ran = 0
+        config._openapi_budget_skipped = 0
+
+        # Every option is validated before the spec is loaded
+        _configure_execution(config)
+        _configure_xdist_worker(config)
+        _configure_outputs(config)
+        _configure_selection(config)
+        spec_source = _load_spec(config, base_url)
+        if _is_xdist_controller(config):
+            _configure_xdist_controller(config, config._openapi_no_stdout)
+
+        if not config._openapi_no_stdout:
+            print(f"\n✅ OpenAPI spec validated and loaded from {spec_source}")
+
+    # Store config globally for access in other hooks
+    global _pytest_config
+    _pytest_config = config
+
+
+def _operation_durations(config):
+    """Return the duration per case of each operation, in ms, for sharding.
+
+    Every CI node must compute the same split, so only the p50 of
+    ``--openapi-compare-baseline`` is used: a file all nodes share, unlike
+    each machine's own pytest cache. Without it, shards are balanced by
+    case count.
+    """
+    baseline = getattr(config, "_openapi_baseline", None)
+    if baseline is None:
+        return {}
+    return {
+        key: entry["p50"]
+        for key, entry in baseline["operations"].items()
+        if "p50" in entry
+    }
+
+
+def _is_xdist_controller(config):
+    """Return whether this process distributes tests to xdist workers."""
+    return getattr(config.option, "dist", "no") != "no" and bool(
+        getattr(config.option, "tx", None)
+    )
+
+
+def _xdist_group(path):
+    """Return the xdist group of a path: its first segment (resource).
+
+    All operations on ``/pets`` and ``/pets/{petId}`` share state on the
+    server, so they are sent to the same worker and run there in
+    GET -> POST -> PUT -> DELETE order.
+    """
+    return "/" + path.strip("/").split("/", 1)[0]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Ship the validated spec and the directory of its records and
+    results files from the xdist controller to a worker."""
+    config = node.config
+    spec = getattr(config, "_openapi_spec", None)
+    if spec is not None:
+        node.workerinput["openapi_spec"] = json.dumps(spec, default=str)
+        node.workerinput["openapi_worker_dir"] = config._openapi_worker_dir
+        changed = getattr(config, "_openapi_changed", None)
+        if changed is not None:
+            node.workerinput["openapi_changed"] = sorted(changed)
+        # Workers read --dist from the command line, which may predate
+        # the switch to loadgroup made by pytest_configure
+        node.workerinput["openapi_loadgroup"] = (
+            config.option.dist == "loadgroup"
+        )
+        # Workers see --dist as "no", so the controller tells them when
+        # worksteal scheduling rules out running phases concurrently
+        node.workerinput["openapi_concurrency"] = (
+            1
+            if config.option.dist == "worksteal"
+            else config._openapi_concurrency
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Keep the records file an xdist worker sent back."""
+    output = getattr(node, "workeroutput", None) or {}
+    if "openapi_records" not in output:
+        return
+    config = node.config
+    worker_outputs = getattr(config, "_openapi_worker_outputs", None)
+    if worker_outputs is not None:
+        worker_outputs[node.gateway.id] = output
+
 
+def _configure_xdist_controller(config, no_stdout=False):
+    """Prepare the xdist controller: scheduling and worker files.
+
+    Items of one resource must run on one worker, in order, which only
+    ``loadgroup`` scheduling guarantees. The ``load`` scheduling implied
+    by ``-n`` is switched to it; a ``--dist`` given explicitly is kept,
+    with a warning when it does not keep resources together.
+    """
+    explicit_dist = getattr(config.known_args_namespace, "dist", "no")
+    if explicit_dist == "no" and config.option.dist == "load":
+        config.option.dist = "loadgroup"
         if not no_stdout:
             print(
-                f"\n✅ OpenAPI spec validated and loaded"
-                f" from {base_url}/openapi.json"
+                "🔀 pytest-xdist: using --dist loadgroup so that each"
+                " resource's OpenAPI items run on one worker, in order"
             )
+    elif config.option.dist != "loadgroup":
+        print(
+            f"\n⚠️  Warning: --dist {config.option.dist} may run operations"
+            " on one resource on different workers, out of order;"
+            " use --dist loadgroup to keep them together"
+        )
+    if config.option.dist == "worksteal" and (
+        int(config.getoption("--openapi-concurrency")) > 1
+    ):
+        print(
+            "\n⚠️  Warning: --openapi-concurrency is ignored with --dist"
+            " worksteal, which can move queued items to another worker;"
+            " each worker runs its checks one at a time"
+        )
+    config._openapi_worker_dir = tempfile.mkdtemp(prefix="pytest-openapi-")
 
-    # Store config globally for access in other hooks
-    global _pytest_config
-    _pytest_config = config
+
+def _xdist_worker(config):
+    """Return the pytest-xdist plugin that feeds this worker its tests.
+
+    A worker collects every item but only runs the ones the controller
+    schedules to it, which this plugin queues as item indices. Returns
+    None outside a worker, or if this xdist version keeps its queue
+    elsewhere.
+    """
+    if getattr(config, "workerinput", None) is None:
+        return None
+    for plugin in config.pluginmanager.get_plugins():
+        if hasattr(plugin, "torun") and hasattr(plugin, "nextitem_index"):
+            return plugin
+    return None
+
+
+def _scheduled_items(session):
+    """Return the items this process will run, from the current one on.
+
+    Outside xdist, these are all the collected items. On an xdist worker,
+    they are the running item and the items already queued behind it:
+    items scheduled to other workers are left out, so that their checks
+    are never sent from here.
+    """
+    worker = getattr(session.config, "_openapi_xdist_worker", None)
+    if worker is None:
+        return session.items
+    with worker.torun.lock() as queued:
+        indices = [worker.item_index, worker.nextitem_index, *queued]
+    scheduled = []
+    for index in indices:
+        # The queue ends with a shutdown marker once all work is sent
+        if not isinstance(index, int):
+            break
+        scheduled.append(session.items[index])
+    return scheduled
+
+
+def _worker_records_path(worker_dir, worker_id):
+    """Return the records file of one xdist worker."""
+    return os.path.join(worker_dir, f"{worker_id}.records.jsonl")
+
+
+def _send_worker_output(config):
+    """Complete this xdist worker's records file and tell the
+    controller."""
+    flush_records(contract.test_reports)
+    close_records()
+    config.workeroutput["openapi_records"] = config._openapi_worker_records
+    config.workeroutput["openapi_budget"] = [
+        config._openapi_budget_ran,
+        config._openapi_budget_skipped,
+    ]
+
+
+def _merge_worker_outputs(config):
+    """Merge the records of every xdist worker, in worker order, as if
+    this process had run all the tests.
+
+    Records are read back one at a time and flushed to this process's
+    records file as they are added, so that with ``--openapi-records-file``
+    their bodies do not pile up in memory. Case results are not merged
+    here: they reached the structured outputs with each test's report.
+    """
+    for worker_id in sorted(config._openapi_worker_outputs):
+        output = config._openapi_worker_outputs[worker_id]
+        for record in iter_records(output["openapi_records"]):
+            contract.test_reports.append(record)
+            flush_records(contract.test_reports)
+        ran, skipped = output["openapi_budget"]
+        config._openapi_budget_ran += ran
+        config._openapi_budget_skipped += skipped
+    config._openapi_worker_outputs = {}
+
+
+def _load_options(config):
+    """Parse and validate the ``--openapi-load-*`` options.
+
+    Args:
+        config: The pytest config
+
+    Returns:
+        dict: ``duration``, ``rps``, ``concurrency``, ``methods`` and
+            ``max_error_rate``
+    """
+    parsers = {
+        "--openapi-load-duration": (float, lambda v: v > 0),
+        "--openapi-load-rps": (float, lambda v: v > 0),
+        "--openapi-load-concurrency": (int, lambda v: v >= 1),
+        "--openapi-load-max-error-rate": (float, lambda v: 0 <= v <= 1),
+    }
+    values = {
+        option: _option_value(config, option, convert, is_valid)
+        for option, (convert, is_valid) in parsers.items()
+    }
+
+    methods = config.getoption("--openapi-load-methods")
+    load_methods = [m.strip().lower() for m in methods.split(",") if m.strip()]
+    unknown = [
+        m for m in load_methods if m not in ("get", "post", "put", "delete")
+    ]
+    if unknown or not load_methods:
+        pytest.exit(
+            f"Invalid value for --openapi-load-methods: {methods}",
+            returncode=2,
+        )
+
+    return {
+        "duration": values["--openapi-load-duration"],
+        "rps": values["--openapi-load-rps"],
+        "concurrency": values["--openapi-load-concurrency"],
+        "methods": load_methods,
+        "max_error_rate": values["--openapi-load-max-error-rate"],
+    }
 
 
 def pytest_report_teststatus(report, config):
@@ -210,7 +1058,8 @@ def pytest_report_teststatus(report, config):
 
 
 def pytest_runtest_logreport(report):
-    """Print verbose details for OpenAPI tests when using -vv."""
+    """Print verbose details for OpenAPI tests when using -vv, then
+    publish their records to the records file and structured outputs."""
     if report.when == "call" and hasattr(report, "nodeid"):
         if report.nodeid.startswith(".::test_openapi["):
             # Access config through module-level variable
@@ -219,6 +1068,13 @@ def pytest_runtest_logreport(report):
             if config is None:
                 return
 
+            # Under xdist, each worker's case results come attached to its
+            # reports (see pytest_runtest_makereport) and are published as
+            # they arrive; records are merged at the end of the run
+            if _is_xdist_controller(config):
+                record_case_results(getattr(report, "openapi_results", []))
+                return
+
             # Only print in very verbose mode (-vv means verbose >= 2)
             if config.option.verbose >= 2:
                 # Get the most recent test report from contract module
@@ -286,12 +1142,337 @@ def pytest_runtest_logreport(report):
                         f" {truncate(actual_str)}"
                     )
 
+            # Publish the test's results before its bodies leave memory
+            if getattr(config, "workerinput", None) is None:
+                _publish_case_results(config, report)
+            flush_records(contract.test_reports)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """On an xdist worker, attach an OpenAPI test's case results to its
+    report, which xdist sends to the controller as soon as it is made."""
+    outcome = yield
+    config = item.config
+    if call.when != "call" or getattr(config, "workerinput", None) is None:
+        return
+    report = outcome.get_result()
+    if report.nodeid.startswith(".::test_openapi["):
+        report.openapi_results = _case_results(config, report)
+
+
+def _publish_case_results(config, report):
+    """Send the records logged by one test to the structured outputs."""
+    record_case_results(_case_results(config, report))
+
+
+def _case_results(config, report):
+    """Return the structured-output results of the records logged by one
+    test.
+
+    A test skipped before sending its request (for example by the time
+    budget) has no record and is published as skipped; a test that failed
+    without logging one (for example on an exception) is published as
+    failed, so the outputs count the same tests as pytest.
+    """
+    published = getattr(config, "_openapi_records_published", 0)
+    records = contract.test_reports[published:]
+    config._openapi_records_published = len(contract.test_reports)
+
+    results = [case_result(record, report.nodeid) for record in records]
+    if not results and report.skipped:
+        reason = report.longrepr
+        if isinstance(reason, tuple):
+            reason = reason[2]
+        reason = str(reason).removeprefix("Skipped: ")
+        results.append(skipped_result(report.nodeid, reason))
+    elif not results and report.failed:
+        crash = getattr(report.longrepr, "reprcrash", None)
+        error = crash.message if crash is not None else report.longreprtext
+        error = error.removeprefix("Failed: ")
+        results.append(failed_result(report.nodeid, error))
+    return results
+
+
+def _current_phase(session, check):
+    """Return the not-yet-run OpenAPI items in the phase of *check*.
+
+    A phase is the contiguous run of OpenAPI items, starting at the item
+    that owns *check*, that share its HTTP method. Stopping at the first
+    item with a different method keeps the GET -> POST -> PUT -> DELETE
+    ordering as a barrier between phases. Under xdist, only the items
+    scheduled to this worker are considered.
+    """
+    results = session.config._openapi_results
+    items = [
+        item
+        for item in _scheduled_items(session)
+        if getattr(item, "_openapi_check", None) is not None
+    ]
+    start = next(
+        (i for i, item in enumerate(items) if item._openapi_check is check),
+        None,
+    )
+    if start is None:
+        return []
+
+    method = items[start]._openapi_method
+    phase = []
+    for item in items[start:]:
+        if item._openapi_method != method:
+            break
+        if item._openapi_check not in results:
+            phase.append(item)
+    return phase
+
+
+def _run_check(session, check):
+    """Run one OpenAPI check, or fetch its result from the concurrent
+    engine.
+
+    In concurrent mode, the first item of each phase executes the checks
+    of the whole phase at once; each later item of that phase then only
+    picks up its precomputed outcome.
+
+    Args:
+        session: The pytest session
+        check: Zero-argument callable returning ``(success, error)``
+
+    Returns:
+        tuple: (success: bool, error_message: str or None)
+    """
+    config = session.config
+    concurrency = getattr(config, "_openapi_concurrency", 1)
+    deadline = getattr(config, "_openapi_deadline", None)
+    if concurrency <= 1:
+        if deadline is not None and time.monotonic() >= deadline:
+            _skip_over_budget(config)
+        config._openapi_budget_ran += 1
+        return check()
+
+    results = config._openapi_results
+    if check not in results:
+        phase = _current_phase(session, check)
+        pending = [item._openapi_check for item in phase] or [check]
+        keys = None
+        if getattr(config, "_openapi_strict_path_order", False):
+            keys = [item._openapi_path for item in phase] or None
+        outcomes = run_checks_concurrently(
+            pending,
+            concurrency,
+            keys,
+            deadline=deadline,
+            should_stop=_stop_condition(session),
+        )
+        results.update(zip(pending, outcomes))
+
+    outcome = results.pop(check)
+    if outcome is None:
+        if deadline is not None and time.monotonic() >= deadline:
+            _skip_over_budget(config)
+        pytest.skip("OpenAPI check not sent: the run stopped after failures")
+    config._openapi_budget_ran += 1
+    return replay_outcome(outcome, contract.test_reports)
+
 
+def _stop_condition(session):
+    """Return the ``should_stop`` callback of the concurrent engine.
+
+    A phase runs before pytest sees any of its results, so failures are
+    counted as they happen: under ``-x``/``--maxfail``, no further check
+    is sent once the failures of the run and of the phase reach the
+    limit.
+    """
+    maxfail = session.config.getoption("maxfail", 0) or 0
+    failed_before = session.testsfailed
+
+    def should_stop(failures):
+        if session.shouldstop or session.shouldfail:
+            return True
+        return maxfail > 0 and failed_before + failures >= maxfail
+
+    return should_stop
+
+
+def _skip_over_budget(config):
+    """Skip the current OpenAPI item because the time budget is spent."""
+    config._openapi_budget_skipped += 1
+    pytest.skip(
+        f"OpenAPI time budget of {config._openapi_time_budget:g}s exhausted"
+    )
+
+
+def _prioritize_items(items, failed_nodeids):
+    """Reorder OpenAPI items by value within each method phase.
+
+    Previously failed items run first, then examples (and GET/DELETE
+    checks), then boundary and negative cases, then other generated
+    cases. The
+    GET -> POST -> PUT -> DELETE phase order is kept, and the sort is
+    stable, so ties keep their collection order.
+
+    Args:
+        items: OpenAPI items in collection order
+        failed_nodeids: Node IDs that failed in the previous run
+
+    Returns:
+        list: The reordered items
+    """
+    methods = ["get", "post", "put", "delete"]
+    return sorted(
+        items,
+        key=lambda item: (
+            methods.index(item._openapi_method),
+            item.nodeid not in failed_nodeids,
+            case_priority(item._openapi_case),
+        ),
+    )
+
+
+def _make_item(module, session, test_id, method, path, check, case=None):
+    """Create the pytest item that runs one OpenAPI check.
+
+    Args:
+        module: Virtual module used as parent of all OpenAPI items
+        session: The pytest session
+        test_id: Item name, e.g. ``test_openapi[GET /users]``
+        method: HTTP method (lowercase)
+        path: API endpoint path
+        check: Zero-argument callable returning ``(success, error)``
+        case: Case record of the request body, for POST/PUT items
+
+    Returns:
+        pytest.Function: The OpenAPI test item
+    """
+
+    def test_func():
+        success, error = _run_check(session, check)
+        if not success:
+            pytest.fail(f"{method.upper()} {path}: {error}")
+
+    test_func.__name__ = test_id
+
+    item = pytest.Function.from_parent(
+        module,
+        name=test_id,
+        callobj=test_func,
+    )
+    item.add_marker(pytest.mark.openapi)
+    item._openapi_check = check
+    item._openapi_method = method
+    item._openapi_path = path
+    item._openapi_case = case
+    return item
+
+
+def _make_load_item(module, config, checks, load):
+    """Create the single pytest item that runs the load test.
+
+    Args:
+        module: Virtual module used as parent of all OpenAPI items
+        config: The pytest config
+        checks: Contract checks replayed by the load test
+        load: Options from ``_load_options``
+
+    Returns:
+        pytest.Function: The load-test item
+    """
+
+    def test_func():
+        if not checks:
+            pytest.skip(
+                "No OpenAPI cases to replay for methods:"
+                f" {', '.join(load['methods'])}"
+            )
+        summary = run_load(
+            checks,
+            load["duration"],
+            rps=load["rps"],
+            concurrency=load["concurrency"],
+        )
+        config._openapi_load_summary = summary
+        if summary["error_rate"] > load["max_error_rate"]:
+            message, _ = summary["failures"][0]
+            pytest.fail(
+                f"Load test error rate {summary['error_rate']:.2%} exceeds"
+                f" {load['max_error_rate']:.2%}. Most common failure:"
+                f" {message}"
+            )
+
+    test_id = "test_openapi[LOAD]"
+    test_func.__name__ = test_id
+    item = pytest.Function.from_parent(module, name=test_id, callobj=test_func)
+    item.add_marker(pytest.mark.openapi)
+    return item
+
+
+def _make_check(config, entry):
+    """Build the contract check for one plan entry.
+
+    Args:
+        config: The pytest config holding the OpenAPI options
+        entry: Plan entry (see ``plan.make_plan_entry``)
+
+    Returns:
+        callable: Zero-argument callable returning ``(success, error)``
+    """
+    method = entry["method"]
+    path = entry["path"]
+    operation = entry["operation"]
+    case = entry["case"]
+    base_url = config.getoption("--openapi")
+    strict_examples = getattr(config, "_openapi_strict_examples", True)
+    options = {
+        "timeout": getattr(config, "_openapi_timeout", 10),
+        "spec": getattr(config, "_openapi_spec", None),
+        "max_latency_ms": getattr(config, "_openapi_max_latency_ms", None),
+        "latency_samples": getattr(config, "_openapi_latency_samples", 1),
+    }
+
+    if case is None:
+        func_map = {
+            "get": contract.test_get_endpoint,
+            "delete": contract.test_delete_endpoint,
+        }
+        return functools.partial(
+            func_map[method],
+            base_url,
+            path,
+            operation,
+            strict_examples,
+            **options,
+        )
+    if method == "post":
+        return functools.partial(
+            contract.test_post_endpoint_single,
+            base_url,
+            path,
+            operation,
+            case["value"],
+            case["origin"],
+            strict_examples,
+            case=case,
+            **options,
+        )
+    return functools.partial(
+        contract.test_put_endpoint_single,
+        base_url,
+        path,
+        operation,
+        case["value"],
+        case["origin"],
+        strict_examples,
+        **options,
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(session, config, items):
     """Inject OpenAPI test items dynamically into the test collection.
 
     This hook allows us to add OpenAPI tests without requiring a test
-    file.
+    file. It runs first so that other plugins, such as pytest-xdist's
+    grouping, see the OpenAPI items.
     """
     # Check if --openapi flag was provided
     base_url = config.getoption("--openapi", default=None)
@@ -306,23 +1487,16 @@ def pytest_collection_modifyitems(session, config, items):
     ignore_re = getattr(config, "_openapi_ignore_re", None)
     ignore_pattern = getattr(config, "_openapi_ignore_pattern", None)
     no_stdout = getattr(config, "_openapi_no_stdout", False)
-    strict_examples = getattr(config, "_openapi_strict_examples", True)
-    timeout = getattr(config, "_openapi_timeout", 10)
 
     # Create a virtual module to be parent of all OpenAPI test items
     # Use the session as parent
     module = Module.from_parent(session, path=session.path)
     module._openapi_virtual_module = True
 
-    # Collect all test cases from the OpenAPI spec
-    test_items = []
+    # Plan every request that could be sent, in execution order:
+    # GET -> POST -> PUT -> DELETE
+    plan = []
     paths = spec.get("paths", {})
-
-    # Track counts for reporting
-    example_count = 0
-    generated_count = 0
-
-    # Execute tests in order: GET -> POST -> PUT -> DELETE
     for method in ["get", "post", "put", "delete"]:
         for path, path_item in paths.items():
             if method not in path_item:
@@ -339,136 +1513,130 @@ def pytest_collection_modifyitems(session, config, items):
 
             operation = path_item[method]
 
-            # For GET and DELETE: typically no request body,
-            # one test per endpoint
+            # GET and DELETE: typically no request body, one test per
+            # endpoint. POST and PUT: one test per example and per case
+            # generated from the schema.
             if method in ["get", "delete"]:
-                test_id = f"test_openapi[{method.upper()} {path}]"
-
-                # Create test function for this endpoint
-                def make_test_func(m, p, op):
-                    def test_func():
-                        func_map = {
-                            "get": contract.test_get_endpoint,
-                            "delete": contract.test_delete_endpoint,
-                        }
-                        test_fn = func_map[m]
-                        success, error = test_fn(
-                            base_url,
-                            p,
-                            op,
-                            strict_examples,
-                            timeout=timeout,
-                            spec=spec,
-                        )
-                        if not success:
-                            pytest.fail(f"{m.upper()} {p}: {error}")
+                plan.append(make_plan_entry(method, path, operation))
+            else:
+                for i, case in enumerate(
+                    collect_request_cases(operation, spec)
+                ):
+                    plan.append(
+                        make_plan_entry(method, path, operation, i, case)
+                    )
 
-                    return test_func
+    # Keep the operations whose contract changed, and the smoke subset
+    changed = getattr(config, "_openapi_changed", None)
+    if changed is not None:
+        kept = select_changed(plan, changed)
+        if not no_stdout:
+            operations = {f"{e['method'].upper()} {e['path']}" for e in plan}
+            changed_count = len(operations & changed)
+            smoke_count = len(smoke_operations(plan) - changed)
+            operation_word = "operation" if changed_count == 1 else "operations"
+            print(
+                f"🔍 Changed since {config._openapi_changed_since}: running"
+                f" {len(kept)} of {len(plan)} OpenAPI cases ({changed_count}"
+                f" changed {operation_word}, {smoke_count} smoke)"
+            )
+        plan = kept
+
+    # Keep the most valuable cases within the configured budgets
+    planned_count = len(plan)
+    plan = apply_case_budgets(
+        plan,
+        max_per_operation=getattr(
+            config, "_openapi_max_cases_per_operation", None
+        ),
+        max_total=getattr(config, "_openapi_max_total_cases", None),
+    )
+    if len(plan) < planned_count and not no_stdout:
+        print(
+            f"✂️  Case budget: running {len(plan)} of {planned_count}"
+            " planned OpenAPI cases"
+        )
 
-                test_func = make_test_func(method, path, operation)
-                test_func.__name__ = test_id
+    # Keep only this CI node's share of the operations
+    shard = getattr(config, "_openapi_shard", None)
+    if shard is not None:
+        index, count = shard
+        kept = shard_plan(plan, index, count, _operation_durations(config))
+        if not no_stdout:
+            operations = len({(e["method"], e["path"]) for e in kept})
+            operation_word = "operation" if operations == 1 else "operations"
+            print(
+                f"🧩 Shard {index}/{count}: running {len(kept)} of"
+                f" {len(plan)} OpenAPI cases ({operations} {operation_word})"
+            )
+        plan = kept
 
-                # Create pytest Function item
-                item = pytest.Function.from_parent(
-                    module,
-                    name=test_id,
-                    callobj=test_func,
-                )
-                item.add_marker(pytest.mark.openapi)
-                test_items.append(item)
-                example_count += 1  # GET/DELETE tests are based on examples
-
-            # For POST and PUT: generate test cases from examples and schemas
-            elif method in ["post", "put"]:
-                request_body_def = operation.get("requestBody", {})
-                request_content = request_body_def.get("content", {})
-
-                request_test_cases = []
-                test_origins = []
-
-                for media_type, media_obj in request_content.items():
-                    # Collect explicit examples
-                    if "example" in media_obj:
-                        request_test_cases.append(media_obj["example"])
-                        test_origins.append("example")
-                    if "examples" in media_obj:
-                        examples_dict = media_obj["examples"]
-                        for ex_name, ex_obj in examples_dict.items():
-                            if "value" in ex_obj:
-                                request_test_cases.append(ex_obj["value"])
-                                test_origins.append("example")
-
-                    # Generate test cases from schema
-                    if "schema" in media_obj:
-                        schema = media_obj["schema"]
-                        generated, _ = generate_test_cases_for_schema(
-                            schema, "request_body", spec
-                        )
-                        for gen_case in generated:
-                            request_test_cases.append(gen_case)
-                            test_origins.append("generated")
-                    break
-
-                # If no requestBody is defined, still test the endpoint
-                # with no body
-                if not request_test_cases and "requestBody" not in operation:
-                    request_test_cases.append(None)
-                    test_origins.append("example")
-
-                # Create a test item for each request body variant
-                for i, (req_body, origin) in enumerate(
-                    zip(request_test_cases, test_origins)
-                ):
-                    origin_marker = (
-                        "example" if origin == "example" else "generated"
-                    )
-                    test_id = (
-                        f"test_openapi[{method.upper()} {path}"
-                        f" [{origin_marker}-{i + 1}]]"
-                    )
+    # Load-test mode replays the whole corpus from a single item
+    load = getattr(config, "_openapi_load", None)
+    if load is not None:
+        corpus = [entry for entry in plan if entry["method"] in load["methods"]]
+        checks = [_make_check(config, entry) for entry in corpus]
+        if not no_stdout:
+            case_word = "case" if len(checks) == 1 else "cases"
+            print(
+                f"🚀 Load test: replaying {len(checks)} OpenAPI {case_word}"
+                f" ({', '.join(m.upper() for m in load['methods'])})"
+                f" for {load['duration']:g}s"
+            )
+        items.append(_make_load_item(module, config, checks, load))
+        return
 
-                    # Create test function for this specific request
-                    def make_test_func(m, p, op, rb, to):
-                        def test_func():
-                            func_map = {
-                                "post": contract.test_post_endpoint_single,
-                                "put": contract.test_put_endpoint_single,
-                            }
-                            test_fn = func_map[m]
-                            success, error = test_fn(
-                                base_url,
-                                p,
-                                op,
-                                rb,
-                                to,
-                                strict_examples,
-                                timeout=timeout,
-                                spec=spec,
-                            )
-                            if not success:
-                                pytest.fail(f"{m.upper()} {p}: {error}")
+    # Track counts for reporting
+    example_count = 0
+    generated_count = 0
 
-                        return test_func
+    test_items = []
+    for entry in plan:
+        method = entry["method"]
+        path = entry["path"]
+        operation = entry["operation"]
+        case = entry["case"]
+
+        check = _make_check(config, entry)
+        if case is None:
+            test_id = f"test_openapi[{method.upper()} {path}]"
+            example_count += 1  # GET/DELETE tests are based on examples
+        else:
+            origin = case["origin"]
+            origin_marker = "example" if origin == "example" else "generated"
+            # Negative cases name the rule and the field they break
+            intent = ""
+            if case["rule"]:
+                intent = f" {case['rule']}"
+                if case["path"]:
+                    intent += f":{case['path']}"
+            test_id = (
+                f"test_openapi[{method.upper()} {path}"
+                f" [{origin_marker}-{entry['index'] + 1}{intent}]]"
+            )
 
-                    test_func = make_test_func(
-                        method, path, operation, req_body, origin
-                    )
-                    test_func.__name__ = test_id
+            # Track origin
+            if origin == "example":
+                example_count += 1
+            else:
+                generated_count += 1
 
-                    # Create pytest Function item
-                    item = pytest.Function.from_parent(
-                        module,
-                        name=test_id,
-                        callobj=test_func,
-                    )
-                    item.add_marker(pytest.mark.openapi)
-                    test_items.append(item)
+        test_items.append(
+            _make_item(module, session, test_id, method, path, check, case)
+        )
 
-                    # Track origin
-                    if origin == "example":
-                        example_count += 1
-                    else:
-                        generated_count += 1
+    # Under a time budget, run the most valuable items of each phase first
+    if getattr(config, "_openapi_time_budget", None) is not None:
+        cache = getattr(config, "cache", None)
+        failed = cache.get("cache/lastfailed", {}) if cache else {}
+        test_items = _prioritize_items(test_items, failed)
+
+    # Under xdist, send the items of one resource to the same worker
+    if getattr(config, "workerinput", None) is not None:
+        for item in test_items:
+            item.add_marker(
+                pytest.mark.xdist_group(_xdist_group(item._openapi_path))
+            )
 
     # Add all OpenAPI test items to the collection
     items.extend(test_items)
@@ -491,6 +1659,13 @@ def pytest_collection_finish(session):
         no_stdout = getattr(config, "_openapi_no_stdout", False)
 
         if total_count > 0 and not no_stdout:
+            time_budget = getattr(config, "_openapi_time_budget", None)
+            if time_budget is not None:
+                print(
+                    f"⏱️  Time budget: {time_budget:g}s for {total_count}"
+                    " OpenAPI items; previously failed cases and examples"
+                    " run first"
+                )
             if example_count > 0:
                 example_word = "item" if example_count == 1 else "items"
                 print(
@@ -516,10 +1691,45 @@ def pytest_unconfigure(config):
     When pytest-openapi calls pytest.exit() during pytest_configure, it
     can interfere with pytest-depends' internal state management. This
     hook ensures proper cleanup happens.
+
+    It also closes the pooled HTTP sessions so that keep-alive
+    connections to the target API are released.
+    """
+    close_sessions()
+    close_records()
+    close_outputs()
+
+
+def _check_latency_regressions(session, config, baseline):
+    """Fail the session if an operation's p95 latency regressed.
+
+    Args:
+        session: The pytest session
+        config: The pytest config
+        baseline: Baseline read from ``--openapi-compare-baseline``
     """
-    # No specific cleanup needed for pytest-openapi,
-    # but defining this hook prevents the IndexError in pytest-depends
-    pass
+    ratio = config._openapi_regression_ratio
+    regressions = find_regressions(contract.test_reports, baseline, ratio)
+    if not regressions:
+        if not getattr(config, "_openapi_no_stdout", False):
+            print(
+                "\n✅ No latency regressions against"
+                f" {config._openapi_baseline_path}"
+            )
+        return
+
+    print(
+        f"\n❌ Latency regressions against {config._openapi_baseline_path}"
+        f" (p95 more than {ratio:g}x the baseline):"
+    )
+    for regression in regressions:
+        print(
+            f"   {regression['operation']}: p95"
+            f" {regression['baseline_p95']:.1f} ms ->"
+            f" {regression['p95']:.1f} ms ({regression['ratio']:.1f}x)"
+        )
+    if session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
 
 
 def pytest_sessionfinish(session, exitstatus):
@@ -530,14 +1740,59 @@ def pytest_sessionfinish(session, exitstatus):
     if not hasattr(config, "_openapi_base_url"):
         return
 
+    # An xdist worker hands everything to the controller, which reports
+    if getattr(config, "workeroutput", None) is not None:
+        _send_worker_output(config)
+        return
+    if getattr(config, "_openapi_worker_outputs", None):
+        _merge_worker_outputs(config)
+    worker_dir = getattr(config, "_openapi_worker_dir", None)
+    if worker_dir is not None:
+        shutil.rmtree(worker_dir, ignore_errors=True)
+
     markdown_output_file = getattr(config, "_openapi_markdown_output", None)
     no_stdout = getattr(config, "_openapi_no_stdout", False)
 
+    load_summary = getattr(config, "_openapi_load_summary", None)
+    if load_summary is not None and not no_stdout:
+        print()
+        for line in format_load_summary(load_summary):
+            print(line)
+
+    # Complete the records file; the report details are read back from it
+    records_file = getattr(config, "_openapi_records_file", None)
+    flush_records(contract.test_reports)
+    close_records()
+    if records_file and not no_stdout:
+        print(f"\n🗂️  Test records saved to: {records_file}")
+
+    json_output_file = getattr(config, "_openapi_json_output", None)
+    close_outputs()
+    if json_output_file and not no_stdout:
+        print(f"\n🧾 JSON results saved to: {json_output_file}")
+
+    junit_xml_file = getattr(config, "_openapi_junit_xml", None)
+    if junit_xml_file:
+        try:
+            write_junit_xml(junit_xml_file)
+            if not no_stdout:
+                print(f"\n🧾 JUnit XML report saved to: {junit_xml_file}")
+        except OSError as e:
+            print(f"\n⚠️  Warning: Failed to write JUnit XML report: {e}")
+
     # Write markdown report to file if requested
     if markdown_output_file:
         try:
             with open(markdown_output_file, "w", encoding="utf-8") as f:
-                f.write(get_test_report_markdown())
+                if load_summary is not None:
+                    f.write(get_load_report_markdown(load_summary))
+                else:
+                    # Written test by test, straight to the file
+                    write_test_report_markdown(
+                        f,
+                        iter_records(records_file) if records_file else None,
+                        **config._openapi_report_options,
+                    )
             if not no_stdout:
                 print(f"\n📝 Full test report saved to: {markdown_output_file}")
                 print(
@@ -547,6 +1802,31 @@ def pytest_sessionfinish(session, exitstatus):
         except OSError as e:
             print(f"\n⚠️  Warning: Failed to write markdown report: {e}")
 
+    # Store this run's latency distribution for later comparisons
+    baseline_output = getattr(config, "_openapi_write_baseline", None)
+    if baseline_output:
+        try:
+            write_baseline(baseline_output, contract.test_reports)
+            if not no_stdout:
+                print(f"\n📈 Latency baseline saved to: {baseline_output}")
+        except OSError as e:
+            print(f"\n⚠️  Warning: Failed to write latency baseline: {e}")
+
+    baseline = getattr(config, "_openapi_baseline", None)
+    if baseline is not None:
+        _check_latency_regressions(session, config, baseline)
+
+    time_budget = getattr(config, "_openapi_time_budget", None)
+    if time_budget is not None and not no_stdout:
+        ran = config._openapi_budget_ran
+        skipped = config._openapi_budget_skipped
+        if ran or skipped:
+            print(
+                f"\n⏱️  Time budget: ran {ran} of {ran + skipped} OpenAPI"
+                f" items within {time_budget:g}s"
+                + (f"; {skipped} skipped" if skipped else "")
+            )
+
     # Don't display the full report to stdout anymore since tests
     # appear as individual pytest items
     # Users can see test results in pytest's normal output
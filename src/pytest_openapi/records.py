@@ -0,0 +1,143 @@
+"""Bounded storage of test report records.
+
+Every record logged by ``contract.log_test_result`` holds the request
+body, the expected body and the full actual body. On long runs against
+endpoints returning large pages, keeping all of them in memory until the
+report is written costs gigabytes. Two options bound that:
+
+- ``--openapi-max-body-bytes=N`` truncates any body (and error message)
+  whose JSON encoding is longer than N bytes. The truncated text ends
+  with the full size and the SHA-256 of the body, so identical bodies can
+  still be recognised.
+- ``--openapi-records-file=PATH`` writes every record to a JSON Lines file
+  as soon as its test finishes, and then drops its bodies from memory.
+  The Markdown report is rendered from that file.
+"""
+
+import hashlib
+import json
+
+# Record fields holding request and response bodies
+BODY_FIELDS = ("request_body", "expected_body", "actual_body")
+
+_max_body_bytes = None
+_records_file = None
+_written = 0
+
+
+def configure_records(path=None, max_body_bytes=None):
+    """Set up the records file and the body size limit.
+
+    Args:
+        path: JSON Lines file receiving every record, or None to keep
+            records in memory only
+        max_body_bytes: Truncate bodies longer than this many bytes, or
+            None for no limit
+
+    Raises:
+        ValueError: If *max_body_bytes* is smaller than 1
+        OSError: If the records file cannot be opened
+    """
+    global _max_body_bytes, _records_file, _written
+
+    if max_body_bytes is not None and max_body_bytes < 1:
+        raise ValueError(
+            f"Body size limit must be at least 1, got {max_body_bytes}"
+        )
+    close_records()
+    _max_body_bytes = max_body_bytes
+    _written = 0
+    if path is not None:
+        _records_file = open(path, "w", encoding="utf-8")
+
+
+def close_records():
+    """Close the records file, if one is open."""
+    global _records_file
+
+    if _records_file is not None:
+        _records_file.close()
+        _records_file = None
+
+
+def truncate_body(body, max_bytes):
+    """Truncate a body whose JSON encoding is longer than *max_bytes*.
+
+    Args:
+        body: Request or response body (any JSON value, or text)
+        max_bytes: Size limit in bytes, or None for no limit
+
+    Returns:
+        The body unchanged if it fits, otherwise a string holding the
+        first *max_bytes* bytes of its encoding followed by its full size
+        and SHA-256
+    """
+    if max_bytes is None or body is None or body == "":
+        return body
+    if isinstance(body, str):
+        text = body
+    else:
+        try:
+            text = json.dumps(body)
+        except (TypeError, ValueError):
+            text = str(body)
+    data = text.encode("utf-8")
+    if len(data) <= max_bytes:
+        return body
+    preview = data[:max_bytes].decode("utf-8", errors="ignore")
+    digest = hashlib.sha256(data).hexdigest()
+    return f"{preview}... [truncated: {len(data)} bytes, sha256:{digest}]"
+
+
+def bound_record(report):
+    """Apply the configured body size limit to a record, in place.
+
+    Args:
+        report: Record built by ``contract.log_test_result``
+
+    Returns:
+        dict: The same record
+    """
+    if _max_body_bytes is not None:
+        for field in (*BODY_FIELDS, "error_message"):
+            report[field] = truncate_body(report[field], _max_body_bytes)
+    return report
+
+
+def flush_records(records):
+    """Write the records not yet written to the records file.
+
+    Written records keep their status, error and timing in memory, but
+    their bodies are dropped; the file holds the full records.
+
+    Args:
+        records: The session's list of records (``contract.test_reports``)
+    """
+    global _written
+
+    if _records_file is None:
+        return
+    for record in records[_written:]:
+        _records_file.write(json.dumps(record, default=str) + "\n")
+        for field in BODY_FIELDS:
+            record[field] = None
+    _records_file.flush()
+    _written = len(records)
+
+
+def iter_records(path):
+    """Yield the records stored in a records file, one at a time.
+
+    Args:
+        path: JSON Lines file written by ``flush_records``
+
+    Yields:
+        dict: One record per line
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,83 @@
+"""Response wrapper that decodes the body at most once.
+
+A contract check reads the same body several times: as JSON for the
+status and schema checks, again in the lenient branch, and as text for
+error messages and the report. ``requests`` decodes the text and parses
+the JSON anew on every access, which is a measurable cost for responses
+of several megabytes. ``CachedResponse`` does each of those once, on
+first use, and shares the result.
+
+JSON bodies are parsed with ``orjson`` straight from the raw bytes when
+it is installed. Anything ``orjson`` rejects (for example ``NaN`` or
+integers wider than 64 bits) is handed to ``requests``, so the parsed
+values and errors are the same with or without it.
+"""
+
+try:
+    import orjson
+except ImportError:  # Optional; requests' own parser is used instead
+    orjson = None
+
+# Response encodings whose bytes orjson can parse directly
+_ORJSON_ENCODINGS = ("utf-8", "utf8")
+
+_UNSET = object()
+
+
+class CachedResponse:
+    """Wrap a ``requests.Response`` and cache its decoded body.
+
+    ``text`` and ``json()`` are computed on first use and reused; a JSON
+    decoding error is cached too and raised again on every call. All
+    other attributes (``status_code``, ``headers``, ``raw``...) are read
+    from the wrapped response.
+
+    Args:
+        response: requests.Response to wrap
+    """
+
+    def __init__(self, response):
+        self._response = response
+        self._text = None
+        self._json = _UNSET
+        self._json_error = None
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def __repr__(self):
+        return f"<CachedResponse {self._response!r}>"
+
+    @property
+    def text(self):
+        """Body decoded as text, decoded once."""
+        if self._text is None:
+            self._text = self._response.text
+        return self._text
+
+    def json(self):
+        """Return the parsed JSON body, parsed once.
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if self._json_error is not None:
+            raise self._json_error
+        if self._json is _UNSET:
+            try:
+                self._json = self._parse_json()
+            except ValueError as e:
+                self._json_error = e
+                raise
+        return self._json
+
+    def _parse_json(self):
+        encoding = self._response.encoding
+        if orjson is not None and (
+            encoding is None or encoding.lower() in _ORJSON_ENCODINGS
+        ):
+            try:
+                return orjson.loads(self._response.content)
+            except orjson.JSONDecodeError:
+                pass
+        return self._response.json()
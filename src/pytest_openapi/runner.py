@@ -0,0 +1,142 @@
+"""Concurrent execution engine for OpenAPI contract checks.
+
+By default every OpenAPI item performs its HTTP request when pytest calls
+it. With ``--openapi-concurrency N`` the checks are instead executed ahead
+of time on an asyncio event loop, with at most N requests in flight, and
+each pytest item then reports the outcome of its own check.
+
+Checks are scheduled one phase at a time. A phase is a contiguous run of
+items with the same HTTP method, so GET -> POST -> PUT -> DELETE ordering
+acts as a barrier: no DELETE is sent before every PUT has completed.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .contract import captured_test_results
+
+
+def _run_captured(check):
+    """Run one check, capturing its report records.
+
+    Args:
+        check: Zero-argument callable returning ``(success, error)``
+
+    Returns:
+        tuple: (result, records, exception). ``exception`` is set instead
+            of ``result`` when the check raised.
+    """
+    with captured_test_results() as records:
+        try:
+            return check(), records, None
+        except Exception as e:  # Re-raised by the pytest item that owns it
+            return None, records, e
+
+
+def _failed(outcome):
+    """Return whether a captured outcome is a failed check."""
+    result, _, exception = outcome
+    return exception is not None or not result[0]
+
+
+async def _run_all(checks, concurrency, keys, deadline, should_stop):
+    """Run *checks* on worker threads, at most *concurrency* at once."""
+    loop = asyncio.get_running_loop()
+    outcomes = [None] * len(checks)
+    # Counted on the worker threads, as soon as each check completes
+    failures = 0
+    failures_lock = threading.Lock()
+
+    # Checks sharing a key form a chain that runs in list order
+    chains = {}
+    for index, key in enumerate(keys):
+        chains.setdefault(key, []).append(index)
+
+    def start(index):
+        # Runs when a worker thread is free, so that checks not started
+        # by the deadline or once the run must stop are left as None
+        nonlocal failures
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+        if should_stop is not None:
+            with failures_lock:
+                if should_stop(failures):
+                    return None
+        outcome = _run_captured(checks[index])
+        if _failed(outcome):
+            with failures_lock:
+                failures += 1
+        return outcome
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+        async def run_chain(indices):
+            for index in indices:
+                outcomes[index] = await loop.run_in_executor(
+                    executor, start, index
+                )
+
+        await asyncio.gather(*(run_chain(i) for i in chains.values()))
+
+    return outcomes
+
+
+def run_checks_concurrently(
+    checks, concurrency, keys=None, deadline=None, should_stop=None
+):
+    """Execute contract checks concurrently.
+
+    The checks use blocking ``requests`` calls through the pooled
+    sessions, so each one is dispatched from the event loop to a pool of
+    *concurrency* worker threads, which bounds how many requests are in
+    flight at once.
+
+    Args:
+        checks: List of zero-argument callables returning
+            ``(success, error)``
+        concurrency: Maximum number of checks running at the same time
+        keys: Optional list parallel to *checks*. Checks that share a key
+            run one after another in list order (for example, all checks
+            of one path); checks with different keys run in parallel.
+        deadline: Optional ``time.monotonic()`` value after which no
+            further check is started
+        should_stop: Optional ``should_stop(failures)`` called before each
+            check starts with the number of checks that failed so far;
+            once it returns True no further check is started (for
+            example under ``-x``/``--maxfail``)
+
+    Returns:
+        list: One ``(result, records, exception)`` tuple per check, in the
+            same order as *checks*, or None for a check that was not
+            started before the deadline or the stop
+    """
+    if not checks:
+        return []
+    if keys is None:
+        keys = range(len(checks))
+    return asyncio.run(
+        _run_all(checks, concurrency, keys, deadline, should_stop)
+    )
+
+
+def replay_outcome(outcome, test_reports):
+    """Publish a captured outcome as if the check had just run.
+
+    Args:
+        outcome: ``(result, records, exception)`` tuple from
+            ``run_checks_concurrently``
+        test_reports: List that receives the captured report records
+
+    Returns:
+        tuple: (success: bool, error_message: str or None)
+
+    Raises:
+        Exception: Whatever the check raised while running
+    """
+    result, records, exception = outcome
+    test_reports.extend(records)
+    if exception is not None:
+        raise exception
+    return result
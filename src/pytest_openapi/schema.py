@@ -4,8 +4,49 @@ Bridges the gap between OpenAPI 3.0.x and 3.1.x:
 - 3.1.x aligns with JSON Schema draft 2020-12
 - $ref siblings are valid in 3.1.x (ignored in 3.0.x)
 - Nullable uses type: ["string", "null"] instead of nullable: true
+
+Resolved schemas are memoized per spec, so each component schema is
+resolved once per session no matter how many walks reach it.
 """
 
+import threading
+from collections import OrderedDict
+
+# Maximum number of memoized resolutions kept before the least recently
+# used entry is evicted
+RESOLUTION_CACHE_SIZE = 4096
+
+# key -> (spec, schema, result); spec and schema are kept so that a
+# recycled id() can never be mistaken for the original object. $ref
+# lookups are keyed on the pointer string itself and store None here.
+_resolution_cache = OrderedDict()
+_resolution_cache_lock = threading.Lock()
+
+
+def _cache_get(key, spec, schema):
+    """Return a memoized result, or ``None`` on a miss."""
+    with _resolution_cache_lock:
+        entry = _resolution_cache.get(key)
+        if entry is None or entry[0] is not spec or entry[1] is not schema:
+            return None
+        _resolution_cache.move_to_end(key)
+        return entry[2]
+
+
+def _cache_put(key, spec, schema, result):
+    """Memoize *result*, evicting the least recently used entry."""
+    with _resolution_cache_lock:
+        _resolution_cache[key] = (spec, schema, result)
+        _resolution_cache.move_to_end(key)
+        while len(_resolution_cache) > RESOLUTION_CACHE_SIZE:
+            _resolution_cache.popitem(last=False)
+
+
+def clear_resolution_cache():
+    """Forget every memoized ``resolve_ref``/``resolve_schema`` result."""
+    with _resolution_cache_lock:
+        _resolution_cache.clear()
+
 
 def resolve_ref(spec, ref_string):
     """Follow a JSON Pointer $ref to its schema within the spec
@@ -22,6 +63,16 @@ def resolve_ref(spec, ref_string):
     """
     if not isinstance(ref_string, str) or not ref_string.startswith("#/"):
         return {}
+    key = ("ref", id(spec), ref_string)
+    node = _cache_get(key, spec, None)
+    if node is None:
+        node = _follow_pointer(spec, ref_string)
+        _cache_put(key, spec, None, node)
+    return node
+
+
+def _follow_pointer(spec, ref_string):
+    """Walk the '#/'-prefixed JSON Pointer *ref_string* through *spec*."""
     parts = ref_string[2:].split("/")
     node = spec
     for part in parts:
@@ -44,6 +95,10 @@ def resolve_schema(spec, schema, _visited=None):
     Neither ``oneOf`` nor ``anyOf`` is merged here; those require runtime
     data to choose the matching branch and are handled in the validator.
 
+    Results for schemas containing ``$ref`` or ``allOf`` are memoized per
+    spec (keyed on object identity and *_visited*), so callers must treat
+    the returned dict as read-only.
+
     Args:
         spec: Complete OpenAPI spec dict (needed to resolve $ref pointers)
         schema: Schema object to resolve
@@ -57,9 +112,22 @@ def resolve_schema(spec, schema, _visited=None):
     if not isinstance(schema, dict) or not spec:
         return schema
 
+    if "$ref" not in schema and "allOf" not in schema:
+        return schema
+
     if _visited is None:
         _visited = frozenset()
 
+    key = ("schema", id(spec), id(schema), _visited)
+    result = _cache_get(key, spec, schema)
+    if result is None:
+        result = _resolve(spec, schema, _visited)
+        _cache_put(key, spec, schema, result)
+    return result
+
+
+def _resolve(spec, schema, _visited):
+    """Uncached body of ``resolve_schema``."""
     # ── $ref resolution ──────────────────────────────────────────────────────
     if "$ref" in schema:
         ref_string = schema["$ref"]
@@ -73,10 +141,12 @@ def resolve_schema(spec, schema, _visited=None):
         siblings = {k: v for k, v in schema.items() if k != "$ref"}
         resolved_ref = resolve_schema(spec, ref_schema, new_visited)
         if siblings:
-            # Sibling keywords override values from the referenced schema
-            return resolve_schema(
-                spec, {**resolved_ref, **siblings}, new_visited
-            )
+            # Sibling keywords override values from the referenced schema.
+            # The merged dict is a throwaway, so it is not memoized itself.
+            merged = {**resolved_ref, **siblings}
+            if "$ref" not in merged and "allOf" not in merged:
+                return merged
+            return _resolve(spec, merged, new_visited)
         return resolved_ref
 
     # ── allOf merging ─────────────────────────────────────────────────────────
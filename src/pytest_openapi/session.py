@@ -0,0 +1,167 @@
+"""Pooled, keep-alive HTTP sessions shared by all contract tests.
+
+Every request the plugin makes (fetching the spec, resetting the server,
+and each generated test case) goes through a ``requests.Session`` that is
+shared per base URL, so TCP and TLS connections are reused across tests
+instead of being opened and torn down for every single request.
+
+Sessions do not keep cookies: like separate ``requests.get`` calls, each
+case is sent without any ``Set-Cookie`` value from earlier cases, so
+results do not depend on the order in which operations ran.
+
+The adapters also time every new connection (TCP connect plus TLS
+handshake), so that reports can tell connection set-up apart from server
+time. A request that reuses a pooled connection has a connect time of 0.
+"""
+
+import http.cookiejar
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+DEFAULT_POOL_SIZE = 10
+
+# One session per scheme://host:port, created lazily on first use
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+_pool_size = DEFAULT_POOL_SIZE
+_keep_alive = True
+
+# Per-thread connection timer, set by ``connection_timer``
+_timing = threading.local()
+
+
+@contextmanager
+def connection_timer():
+    """Measure the time spent opening connections in the current thread.
+
+    Yields:
+        dict: ``{"connect": seconds}``, updated as connections are opened
+            while the context is active
+    """
+    previous = getattr(_timing, "timer", None)
+    timer = {"connect": 0.0}
+    _timing.timer = timer
+    try:
+        yield timer
+    finally:
+        _timing.timer = previous
+
+
+def _timed_connect(connect):
+    """Run a connection's ``connect`` and add its duration to the
+    active timer."""
+    start = time.perf_counter()
+    try:
+        connect()
+    finally:
+        timer = getattr(_timing, "timer", None)
+        if timer is not None:
+            timer["connect"] += time.perf_counter() - start
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        _timed_connect(super().connect)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        _timed_connect(super().connect)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    """HTTP adapter whose pools open timed connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def configure_sessions(pool_size=DEFAULT_POOL_SIZE, keep_alive=True):
+    """Set the connection pool options used for new sessions.
+
+    Any sessions that already exist are closed so that the new options
+    apply to every subsequent request.
+
+    Args:
+        pool_size: Maximum number of connections kept open per base URL
+        keep_alive: If False, send ``Connection: close`` so that every
+            request opens a fresh connection (the pre-pooling behaviour)
+    """
+    global _pool_size, _keep_alive
+
+    if pool_size < 1:
+        raise ValueError(f"Pool size must be at least 1, got {pool_size}")
+
+    close_sessions()
+    _pool_size = pool_size
+    _keep_alive = keep_alive
+
+
+def _origin(url):
+    """Return the ``scheme://netloc`` part of a URL, used as pool key."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _new_session():
+    """Create a session with a pooled adapter mounted for HTTP(S)."""
+    session = requests.Session()
+    # Cookies set by one case must not be sent with the next
+    session.cookies.set_policy(
+        http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+    )
+    adapter = _TimedAdapter(pool_connections=1, pool_maxsize=_pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not _keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def get_session(url):
+    """Return the shared session for the base URL of *url*.
+
+    Args:
+        url: Any URL on the target server
+
+    Returns:
+        requests.Session: Session whose connection pool is reused by
+            every request to the same scheme, host and port
+    """
+    origin = _origin(url)
+    with _sessions_lock:
+        session = _sessions.get(origin)
+        if session is None:
+            session = _new_session()
+            _sessions[origin] = session
+    return session
+
+
+def close_sessions():
+    """Close every shared session and release its pooled
+    connections."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
@@ -0,0 +1,196 @@
+"""Structural diff of two OpenAPI specs, per operation.
+
+``--openapi-changed-since`` compares the spec under test with a previous
+version and only runs the operations whose contract changed. Each
+operation is reduced to a fingerprint: a SHA-256 over its parameters
+(including those of its path item), request body and responses, and over
+every component reachable from them through ``$ref``, resolved with
+``schema.resolve_ref``. A change inside a shared schema therefore changes
+the fingerprint of every operation that reaches it, however deep.
+
+Each component is serialized and hashed once per spec, and what it
+reaches is summarized by a Merkle digest over the strongly connected
+components of the ``$ref`` graph (so recursive schemas are handled), which
+keeps the diff linear in the size of the specs.
+
+Documentation-only fields of the operation itself (``summary``,
+``description``, ``tags``, ``externalDocs`` and ``operationId``) are left
+out; everything else, including examples, is part of the contract since
+the tests are built from it.
+"""
+
+import hashlib
+import json
+
+from .schema import resolve_ref
+
+# Methods whose operations are fingerprinted
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch")
+
+# Operation fields that do not affect the requests sent or the checks
+DOCUMENTATION_FIELDS = (
+    "summary",
+    "description",
+    "tags",
+    "externalDocs",
+    "operationId",
+)
+
+
+def _digest(value):
+    data = json.dumps(
+        value, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def _local_refs(node):
+    """Return the local ``$ref`` targets found anywhere inside *node*."""
+    refs = set()
+    pending = [node]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, dict):
+            ref = value.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/"):
+                refs.add(ref)
+            pending.extend(value.values())
+        elif isinstance(value, list):
+            pending.extend(value)
+    return refs
+
+
+def _strongly_connected(graph):
+    """Split a directed graph into its strongly connected components.
+
+    Tarjan's algorithm, run iteratively since ``$ref`` chains can be
+    deeper than the recursion limit.
+
+    Args:
+        graph: Node -> set of successor nodes, every successor a key too
+
+    Returns:
+        list: Components (lists of nodes), each listed after every
+            component it has an edge to
+    """
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    components = []
+    for root in sorted(graph):
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(sorted(graph[root])))]
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = low[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(sorted(graph[successor]))))
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def operation_fingerprints(spec):
+    """Compute the contract fingerprint of every operation of a spec.
+
+    Args:
+        spec: Complete OpenAPI spec dict
+
+    Returns:
+        dict: ``"METHOD /path"`` -> hex SHA-256 of the operation's
+            contract and of every component it reaches
+    """
+    contracts = []
+    for path, path_item in (spec.get("paths") or {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        for method in HTTP_METHODS:
+            operation = path_item.get(method)
+            if not isinstance(operation, dict):
+                continue
+            contract = {
+                key: value
+                for key, value in operation.items()
+                if key not in DOCUMENTATION_FIELDS
+            }
+            contract["path-parameters"] = path_item.get("parameters", [])
+            contracts.append(
+                (f"{method.upper()} {path}", contract, _local_refs(contract))
+            )
+
+    # Every component reachable from an operation, hashed on its own
+    digests = {}
+    graph = {}
+    pending = [ref for _, _, refs in contracts for ref in refs]
+    while pending:
+        ref = pending.pop()
+        if ref in graph:
+            continue
+        node = resolve_ref(spec, ref)
+        digests[ref] = _digest(node)
+        graph[ref] = _local_refs(node)
+        pending.extend(graph[ref])
+
+    # Merkle digest of everything reachable from each component. The
+    # members of a cycle reach the same components, so they share one.
+    reach = {}
+    for component in _strongly_connected(graph):
+        members = set(component)
+        successors = {
+            reach[successor]
+            for member in component
+            for successor in graph[member]
+            if successor not in members
+        }
+        digest = _digest(
+            [sorted((m, digests[m]) for m in component), sorted(successors)]
+        )
+        for member in component:
+            reach[member] = digest
+
+    return {
+        key: _digest([contract, {ref: reach[ref] for ref in refs}])
+        for key, contract, refs in contracts
+    }
+
+
+def changed_operations(previous, current):
+    """Return the operations of *current* whose contract changed.
+
+    Args:
+        previous: Previous OpenAPI spec dict
+        current: OpenAPI spec dict under test
+
+    Returns:
+        set: ``"METHOD /path"`` of every operation that is new in
+            *current* or whose fingerprint differs from *previous*'s
+    """
+    before = operation_fingerprints(previous)
+    return {
+        key
+        for key, fingerprint in operation_fingerprints(current).items()
+        if before.get(key) != fingerprint
+    }
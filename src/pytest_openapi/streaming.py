@@ -0,0 +1,352 @@
+"""Incremental parsing of streaming (SSE and NDJSON) responses.
+
+Requests are sent with ``stream=True``, and streaming bodies are consumed
+here line by line as they arrive instead of being buffered in full. This
+keeps memory flat for long-running streams (for example LLM token
+streams), stops at the ``[DONE]`` sentinel or at the configured byte and
+event caps, and measures the time to the first event and the gaps
+between events.
+
+Server-sent events follow the framing of the HTML living standard: an
+event is dispatched at a blank line, multiple ``data:`` lines of one event
+are joined with newlines, and ``event:``/``id:``/``retry:`` fields and
+``:`` comments do not produce chunks. NDJSON streams produce one chunk per
+non-empty line.
+
+When the spec declares an item schema for the stream (``itemSchema`` or
+``x-stream-item-schema`` on the media type), each item is validated as it
+arrives and reading stops at the first item that does not match.
+"""
+
+import json
+import time
+
+from .schema import resolve_schema
+from .validator import get_validator
+
+STREAMING_MEDIA_TYPES = {
+    "text/event-stream": "sse",
+    "application/x-ndjson": "ndjson",
+    "application/stream+json": "ndjson",
+}
+
+# Media type keywords declaring the schema of each streamed item
+ITEM_SCHEMA_KEYWORDS = ("itemSchema", "x-stream-item-schema")
+
+# Sentinel some APIs send as the last SSE event
+DONE_SENTINEL = "[DONE]"
+
+DEFAULT_MAX_STREAM_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_STREAM_EVENTS = 10000
+
+# Maximum number of bytes taken from the socket per read
+STREAM_CHUNK_SIZE = 1024
+
+_max_stream_bytes = DEFAULT_MAX_STREAM_BYTES
+_max_stream_events = DEFAULT_MAX_STREAM_EVENTS
+
+
+class _StreamCapReached(Exception):
+    """Raised inside ``read_stream`` when the byte cap is reached."""
+
+
+def configure_streaming(
+    max_bytes=DEFAULT_MAX_STREAM_BYTES, max_events=DEFAULT_MAX_STREAM_EVENTS
+):
+    """Set the caps applied to every streaming response.
+
+    Args:
+        max_bytes: Stop reading a stream after this many bytes
+        max_events: Stop reading a stream after this many events
+
+    Raises:
+        ValueError: If a cap is smaller than 1
+    """
+    global _max_stream_bytes, _max_stream_events
+
+    if max_bytes < 1:
+        raise ValueError(f"Stream byte cap must be at least 1, got {max_bytes}")
+    if max_events < 1:
+        raise ValueError(
+            f"Stream event cap must be at least 1, got {max_events}"
+        )
+    _max_stream_bytes = max_bytes
+    _max_stream_events = max_events
+
+
+def stream_format(content_type):
+    """Return the streaming format of a Content-Type header.
+
+    Args:
+        content_type: Content-Type header value
+
+    Returns:
+        str or None: ``"sse"``, ``"ndjson"``, or None if not streaming
+    """
+    content_type = (content_type or "").lower()
+    for media_type, fmt in STREAMING_MEDIA_TYPES.items():
+        if media_type in content_type:
+            return fmt
+    return None
+
+
+def _iter_body(response):
+    """Yield the decoded body of *response* as soon as bytes arrive.
+
+    ``read1`` returns whatever one socket read delivers, so events are seen
+    when they are sent even on streams without chunked encoding, where
+    ``iter_content`` would block until a full chunk is buffered. requests
+    leaves ``Content-Encoding`` to the reader on streamed responses, so
+    gzip or deflate bodies are decoded here.
+    """
+    raw = response.raw
+    if getattr(raw, "closed", False):
+        # Already read in full (e.g. through response.text): requests
+        # serves the stored body
+        yield from response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        return
+    read1 = getattr(raw, "read1", None)
+    if read1 is None:
+        # urllib3 1.x has no read1
+        yield from raw.stream(STREAM_CHUNK_SIZE, decode_content=True)
+        return
+    while True:
+        chunk = read1(STREAM_CHUNK_SIZE, decode_content=True)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_lines(chunks):
+    """Split raw byte chunks into decoded lines.
+
+    Accepts ``\\n``, ``\\r\\n`` and ``\\r`` line endings. A last line
+    without a terminator is yielded at the end of the stream.
+    """
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        lines = pending.replace(b"\r\n", b"\n").split(b"\n")
+        # A trailing \r may be the first half of a \r\n split across chunks
+        pending = lines.pop()
+        for line in lines:
+            for part in line.split(b"\r"):
+                yield part.decode("utf-8", errors="replace")
+    if pending:
+        for part in pending.rstrip(b"\r").split(b"\r"):
+            yield part.decode("utf-8", errors="replace")
+
+
+def iter_sse_data(lines):
+    """Yield the data of each server-sent event.
+
+    Args:
+        lines: Iterable of decoded lines
+
+    Yields:
+        str: The ``data`` of one event (multi-line data joined with
+            ``\\n``); events without data are skipped
+    """
+    data = []
+    for line in lines:
+        if not line:
+            if data:
+                yield "\n".join(data)
+            data = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            data.append(value)
+    if data:
+        yield "\n".join(data)
+
+
+def iter_ndjson_data(lines):
+    """Yield every non-empty line of an NDJSON stream.
+
+    Args:
+        lines: Iterable of decoded lines
+
+    Yields:
+        str: One stripped line per JSON document
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def _parse_chunk(data):
+    data = data.strip()
+    if data == DONE_SENTINEL:
+        return DONE_SENTINEL
+    try:
+        return json.loads(data)
+    except (json.JSONDecodeError, ValueError):
+        return data
+
+
+def read_stream(
+    response, started=None, max_bytes=None, max_events=None, on_chunk=None
+):
+    """Consume a streaming response incrementally.
+
+    Args:
+        response: requests.Response sent with ``stream=True``
+        started: ``time.perf_counter()`` value when the request was sent;
+            defaults to the moment reading starts
+        max_bytes: Byte cap, defaults to the configured cap
+        max_events: Event cap, defaults to the configured cap
+        on_chunk: Optional ``on_chunk(chunk, index)`` called for every
+            parsed event except ``[DONE]`` as soon as it arrives. A
+            returned error message stops reading and closes the
+            connection.
+
+    Returns:
+        dict: ``chunks`` (parsed events, ``"[DONE]"`` included),
+            ``events``, ``bytes``, ``done`` (the sentinel was seen),
+            ``truncated`` (None, ``"max_bytes"`` or ``"max_events"``),
+            ``error`` (message returned by *on_chunk*, else None),
+            ``text`` (raw body when no event was found, else None),
+            ``first_event_ms``, ``max_gap_ms`` and ``total_ms``
+    """
+    if started is None:
+        started = time.perf_counter()
+    if max_bytes is None:
+        max_bytes = _max_stream_bytes
+    if max_events is None:
+        max_events = _max_stream_events
+
+    result = {
+        "chunks": [],
+        "events": 0,
+        "bytes": 0,
+        "done": False,
+        "truncated": None,
+        "error": None,
+        "text": None,
+        "first_event_ms": None,
+        "max_gap_ms": None,
+        "total_ms": None,
+    }
+    # Raw lines are only kept until the first event proves the body is
+    # a real stream, so that a mislabelled body can still be reported
+    raw_lines = []
+
+    def raw_chunks():
+        for chunk in _iter_body(response):
+            chunk = chunk[: max_bytes - result["bytes"]]
+            result["bytes"] += len(chunk)
+            yield chunk
+            if result["bytes"] >= max_bytes:
+                # Abort instead of returning, so that a partial last line
+                # is not mistaken for a complete event
+                raise _StreamCapReached
+
+    def recorded_lines():
+        for line in _iter_lines(raw_chunks()):
+            if not result["events"]:
+                raw_lines.append(line)
+            yield line
+
+    if stream_format(response.headers.get("Content-Type")) == "sse":
+        data_items = iter_sse_data(recorded_lines())
+    else:
+        data_items = iter_ndjson_data(recorded_lines())
+
+    last_event = None
+    try:
+        for data in data_items:
+            now = time.perf_counter()
+            if last_event is None:
+                result["first_event_ms"] = (now - started) * 1000
+            else:
+                gap = (now - last_event) * 1000
+                result["max_gap_ms"] = max(result["max_gap_ms"] or 0, gap)
+            last_event = now
+
+            chunk = _parse_chunk(data)
+            result["chunks"].append(chunk)
+            result["events"] += 1
+            raw_lines.clear()
+            if chunk == DONE_SENTINEL:
+                result["done"] = True
+                break
+            if on_chunk is not None:
+                error = on_chunk(chunk, result["events"] - 1)
+                if error:
+                    result["error"] = error
+                    break
+            if result["events"] >= max_events:
+                result["truncated"] = "max_events"
+                break
+    except _StreamCapReached:
+        result["truncated"] = "max_bytes"
+    finally:
+        # Stop the transfer if we left the stream early
+        response.close()
+
+    if not result["events"]:
+        result["text"] = "\n".join(raw_lines)
+    result["total_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def stream_item_schema(response_def, content_type):
+    """Return the schema declared for each item of a streaming response.
+
+    The schema is read from the media type object matching the stream
+    format: ``itemSchema`` (OpenAPI 3.2) or the ``x-stream-item-schema``
+    extension.
+
+    Args:
+        response_def: OpenAPI response object for the actual status code
+        content_type: Content-Type header of the response
+
+    Returns:
+        dict or None: The item schema, or None if none is declared
+    """
+    fmt = stream_format(content_type)
+    content = (response_def or {}).get("content", {})
+    for media_type, media_obj in content.items():
+        if stream_format(media_type) != fmt or not isinstance(media_obj, dict):
+            continue
+        for keyword in ITEM_SCHEMA_KEYWORDS:
+            if keyword in media_obj:
+                return media_obj[keyword]
+    return None
+
+
+def make_chunk_validator(item_schema, spec=None):
+    """Build an ``on_chunk`` callback that validates each streamed item.
+
+    OpenAPI 3.2 describes an SSE item as the event itself (``data``,
+    ``event``, ``id``...). Since chunks are the parsed ``data`` payloads,
+    such event schemas are validated through the ``contentSchema`` of
+    their ``data`` property.
+
+    Args:
+        item_schema: Schema from ``stream_item_schema``
+        spec: Full OpenAPI spec dict for $ref resolution
+
+    Returns:
+        callable: ``on_chunk(chunk, index)`` returning an error message
+            or None
+    """
+    schema = resolve_schema(spec, item_schema)
+    data_schema = schema.get("properties", {}).get("data", {})
+    if isinstance(data_schema, dict) and "contentSchema" in data_schema:
+        schema = data_schema["contentSchema"]
+    check = get_validator(schema, spec)
+
+    def on_chunk(chunk, index):
+        valid, error = check(chunk, f"chunk[{index}]")
+        if valid:
+            return None
+        return f"Streamed item does not match its item schema: {error}"
+
+    return on_chunk
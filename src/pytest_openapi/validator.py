@@ -0,0 +1,271 @@
+"""Compiled JSON schema validators for response bodies.
+
+``validate_against_schema`` used to interpret the raw schema dict on every
+call: resolving ``$ref``/``allOf``, reading ``type``, ``required`` and
+``properties``, and rebuilding temporary schemas for multi-type unions, at
+every node of every response. Here each schema is compiled once into a
+tree of small checker closures that only look at the response data.
+
+A checker has the signature ``check(actual, path) -> (valid, error)`` and
+produces exactly the same error messages as the interpreter it replaces.
+Child schemas are compiled lazily on first use, which keeps recursive
+schemas (a ``Node`` whose ``children`` are ``Node`` items) finite.
+"""
+
+import threading
+from collections import OrderedDict
+
+from .schema import resolve_schema
+
+# Maximum number of compiled validators kept before the least recently
+# used one is evicted
+VALIDATOR_CACHE_SIZE = 1024
+
+# key -> (spec, schema, checker); spec and schema are kept so that a
+# recycled id() can never be mistaken for the original object
+_validators = OrderedDict()
+_validators_lock = threading.Lock()
+
+_PRIMITIVE_TYPES = {
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float)),
+    "integer": lambda value: (
+        isinstance(value, int) and not isinstance(value, bool)
+    ),
+    "boolean": lambda value: isinstance(value, bool),
+}
+
+
+def _prefix(path):
+    return f"{path}: " if path else ""
+
+
+def _valid(actual, path):
+    return True, None
+
+
+def _lazy(schema, spec):
+    """Return a checker that compiles *schema* the first time it runs."""
+    compiled = None
+
+    def check(actual, path):
+        nonlocal compiled
+        if compiled is None:
+            compiled = get_validator(schema, spec)
+        return compiled(actual, path)
+
+    return check
+
+
+def _compile_const(const_val):
+    def check(actual, path):
+        if actual != const_val:
+            return (
+                False,
+                f"{_prefix(path)}Expected const value {const_val!r}, "
+                f"got {actual!r}",
+            )
+        return True, None
+
+    return check
+
+
+def _compile_union(branches, keyword):
+    def check(actual, path):
+        for branch in branches:
+            valid, _ = branch(actual, path)
+            if valid:
+                return True, None
+        return (
+            False,
+            f"{_prefix(path)}Value does not match any {keyword} schema",
+        )
+
+    return check
+
+
+def _compile_multi_type(branches, nullable, type_names):
+    def check(actual, path):
+        if nullable and actual is None:
+            return True, None
+        for branch in branches:
+            valid, _ = branch(actual, path)
+            if valid:
+                return True, None
+        return (
+            False,
+            f"{_prefix(path)}Value does not match any of the allowed "
+            f"types: {type_names}",
+        )
+
+    return check
+
+
+def _compile_object(schema, spec):
+    required = list(schema.get("required", []))
+    properties = [
+        (prop, _lazy(prop_schema, spec))
+        for prop, prop_schema in schema.get("properties", {}).items()
+    ]
+
+    def check(actual, path):
+        if not isinstance(actual, dict):
+            return (
+                False,
+                f"{_prefix(path)}Expected object, got {type(actual).__name__}",
+            )
+        for prop in required:
+            if prop not in actual:
+                return (
+                    False,
+                    f"{_prefix(path)}Missing required property '{prop}'",
+                )
+        for prop, prop_check in properties:
+            if prop in actual:
+                child_path = f"{path}.{prop}" if path else prop
+                valid, error = prop_check(actual[prop], child_path)
+                if not valid:
+                    return False, error
+        return True, None
+
+    return check
+
+
+def _compile_array(schema, spec):
+    item_check = _lazy(schema.get("items", {}), spec)
+
+    def check(actual, path):
+        if not isinstance(actual, list):
+            return (
+                False,
+                f"{_prefix(path)}Expected array, got {type(actual).__name__}",
+            )
+        for i, item in enumerate(actual):
+            valid, error = item_check(item, f"{path}[{i}]")
+            if not valid:
+                return False, error
+        return True, None
+
+    return check
+
+
+def _compile_primitive(schema_type):
+    is_type = _PRIMITIVE_TYPES[schema_type]
+
+    def check(actual, path):
+        if not is_type(actual):
+            return (
+                False,
+                f"{_prefix(path)}Expected {schema_type}, "
+                f"got {type(actual).__name__}",
+            )
+        return True, None
+
+    return check
+
+
+def _compile_resolved(schema, spec):
+    """Compile a schema that has already been through
+    ``resolve_schema``."""
+    if "const" in schema:
+        return _compile_const(schema["const"])
+
+    for keyword in ("oneOf", "anyOf"):
+        if keyword in schema:
+            branches = [_lazy(sub, spec) for sub in schema[keyword]]
+            return _compile_union(branches, keyword)
+
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        nullable = "null" in schema_type
+        non_null_types = [t for t in schema_type if t != "null"]
+        if len(non_null_types) > 1:
+            branches = [
+                _compile_resolved({**schema, "type": t}, spec)
+                for t in non_null_types
+            ]
+            return _compile_multi_type(branches, nullable, non_null_types)
+        schema_type = non_null_types[0] if non_null_types else None
+    else:
+        nullable = schema.get("nullable", False)
+
+    if schema_type == "object":
+        type_check = _compile_object(schema, spec)
+    elif schema_type == "array":
+        type_check = _compile_array(schema, spec)
+    elif schema_type in _PRIMITIVE_TYPES:
+        type_check = _compile_primitive(schema_type)
+    else:
+        type_check = _valid
+
+    if not nullable and "enum" not in schema:
+        return type_check
+
+    has_enum = "enum" in schema
+    allowed_values = schema.get("enum")
+
+    def check(actual, path):
+        if nullable and actual is None:
+            return True, None
+        if has_enum and actual not in allowed_values:
+            return (
+                False,
+                f"{_prefix(path)}Value {actual!r} is not one of the "
+                f"allowed enum values: {allowed_values}",
+            )
+        return type_check(actual, path)
+
+    return check
+
+
+def compile_schema(schema, spec=None):
+    """Compile a JSON schema into a checker callable.
+
+    Args:
+        schema: JSON schema object (may contain $ref or allOf)
+        spec: Full OpenAPI spec dict for $ref resolution; None skips
+            resolution
+
+    Returns:
+        callable: ``check(actual, path="")`` returning
+            ``(valid: bool, error_message: str or None)``
+    """
+    return _compile_resolved(resolve_schema(spec, schema), spec)
+
+
+def get_validator(schema, spec=None):
+    """Return the compiled checker for *schema*, compiling it once.
+
+    Checkers are cached on the identity of the schema object, so every
+    response validated against the same operation and status code reuses
+    the same compiled tree.
+
+    Args:
+        schema: JSON schema object (may contain $ref or allOf)
+        spec: Full OpenAPI spec dict for $ref resolution; None skips
+            resolution
+
+    Returns:
+        callable: ``check(actual, path)`` returning
+            ``(valid: bool, error_message: str or None)``
+    """
+    key = (id(spec), id(schema))
+    with _validators_lock:
+        entry = _validators.get(key)
+        if entry is not None and entry[0] is spec and entry[1] is schema:
+            _validators.move_to_end(key)
+            return entry[2]
+
+    checker = compile_schema(schema, spec)
+    with _validators_lock:
+        _validators[key] = (spec, schema, checker)
+        _validators.move_to_end(key)
+        while len(_validators) > VALIDATOR_CACHE_SIZE:
+            _validators.popitem(last=False)
+    return checker
+
+
+def clear_validator_cache():
+    """Forget every compiled validator."""
+    with _validators_lock:
+        _validators.clear()
@@ -3,6 +3,7 @@
 import subprocess
 import time
 import pytest
+import requests
 import sys
 
 
@@ -1769,6 +1770,34 @@ def test_email_format_invalid_address_gets_400():
     ), f"Expected all email format tests to pass (valid→200, invalid→400), got: {output}"
 
 
+@pytest.mark.depends(on=["test_openapi_flag_is_recognized"])
+def test_negative_case_ids_name_rule_and_field():
+    """Test that negative test cases are tagged with the rule and field
+    they break, e.g. ``[generated-12 invalid_format:email]``."""
+    print(
+        "\n🔍 Testing negative case IDs include the rule and field...",
+        flush=True,
+    )
+    time.sleep(0.5)
+
+    result = subprocess.run(
+        [
+            "pytest",
+            "--openapi=http://mock-server-email-format-validation:8000",
+            "--collect-only",
+            "-q",
+        ],
+        capture_output=True,
+        text=True,
+        cwd="/app",
+    )
+
+    output = result.stdout + result.stderr
+    assert (
+        "[generated-12 invalid_format:email]]" in output
+    ), f"Expected the invalid email case to be tagged, got: {output}"
+
+
 @pytest.mark.depends(on=["test_openapi_flag_is_recognized"])
 def test_email_format_spec_validated_successfully():
     """Test that an OpenAPI spec with format: email fields passes structural validation."""
@@ -2239,3 +2268,44 @@ def test_url_port_above_65535_gets_400_with_message():
     assert (
         result.returncode == 0
     ), f"Expected URL port tests to pass (valid ports→200, port>65535→400+message), got: {output}"
+
+
+@pytest.mark.depends(on=["test_openapi_flag_is_recognized"])
+def test_xdist_with_concurrency_sends_each_request_once():
+    """Test that xdist workers running phases concurrently only send the
+    checks scheduled to them.
+
+    Every worker collects all items, so a worker that built its phases
+    from its whole collection would also send the POST, PUT and DELETE
+    requests of the other workers. The server counts the API requests it
+    receives since the reset done at the start of each run: it must see
+    as many under ``-n 2 --openapi-concurrency=4`` as in a serial run.
+    """
+    print(
+        "\n🔍 Testing xdist with --openapi-concurrency sends each request"
+        " once...",
+        flush=True,
+    )
+    time.sleep(0.5)
+
+    base_url = "http://mock-server-request-counter:8000"
+    counts = []
+    for extra_args in ([], ["-n", "2", "--openapi-concurrency=4"]):
+        result = subprocess.run(
+            ["pytest", f"--openapi={base_url}", "-q", *extra_args],
+            capture_output=True,
+            text=True,
+            cwd="/app",
+        )
+        output = result.stdout + result.stderr
+        assert (
+            result.returncode == 0
+        ), f"Expected {extra_args or 'serial'} run to pass, got: {output}"
+        response = requests.get(f"{base_url}/requests", timeout=5)
+        counts.append(response.json()["count"])
+
+    serial, distributed = counts
+    assert serial > 0, "Expected the serial run to send requests"
+    assert (
+        distributed == serial
+    ), f"Expected {serial} requests under xdist, the server received {distributed}"
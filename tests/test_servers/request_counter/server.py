@@ -0,0 +1,249 @@
+"""Mock server that counts the API requests it receives.
+
+Six independent resources share one CRUD shape, so that pytest-xdist has
+several groups to spread over its workers. ``GET /requests`` (left out of
+the spec) returns how many API requests were received since the last
+``POST /reset``, so that tests can check no request is sent twice.
+"""
+
+import threading
+
+from flask import Flask, jsonify, request
+
+app = Flask(__name__)
+
+RESOURCES = ["apples", "pears", "plums", "grapes", "limes", "figs"]
+
+# Requests not counted: the spec, the reset and the counter itself
+UNCOUNTED = {"/openapi.json", "/reset", "/requests"}
+
+lock = threading.Lock()
+request_count = 0
+items_db = {}
+next_id = 3
+
+
+def reset_db():
+    """Reset every resource and the request counter."""
+    global items_db, next_id, request_count
+    items_db = {
+        resource: {
+            1: {"id": 1, "name": "First"},
+            2: {"id": 2, "name": "Second"},
+        }
+        for resource in RESOURCES
+    }
+    next_id = 3
+    request_count = 0
+
+
+reset_db()
+
+
+@app.before_request
+def count_request():
+    """Count every API request."""
+    global request_count
+    if request.path not in UNCOUNTED:
+        with lock:
+            request_count += 1
+
+
+def _item_schema():
+    return {
+        "type": "object",
+        "required": ["id", "name"],
+        "properties": {
+            "id": {"type": "integer", "description": "Item ID"},
+            "name": {"type": "string", "description": "Item name"},
+        },
+    }
+
+
+def _error_response(description):
+    return {
+        "description": description,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "error": {
+                            "type": "string",
+                            "description": "Error message",
+                        }
+                    },
+                },
+                "example": {"error": description},
+            }
+        },
+    }
+
+
+def _resource_paths(resource):
+    id_parameter = {
+        "name": "item_id",
+        "in": "path",
+        "required": True,
+        "schema": {"type": "integer"},
+    }
+    body = {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Item name",
+                        }
+                    },
+                },
+                "example": {"name": "Third"},
+            }
+        },
+    }
+    return {
+        f"/{resource}": {
+            "get": {
+                "summary": f"List {resource}",
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "items": _item_schema(),
+                                },
+                                "example": [
+                                    {"id": 1, "name": "First"},
+                                    {"id": 2, "name": "Second"},
+                                ],
+                            }
+                        },
+                    }
+                },
+            },
+            "post": {
+                "summary": f"Create one of {resource}",
+                "requestBody": body,
+                "responses": {
+                    "201": {
+                        "description": "Item created",
+                        "content": {
+                            "application/json": {
+                                "schema": _item_schema(),
+                                "example": {"id": 3, "name": "Third"},
+                            }
+                        },
+                    },
+                    "422": _error_response("Missing required field"),
+                },
+            },
+        },
+        f"/{resource}/{{item_id}}": {
+            "put": {
+                "summary": f"Update one of {resource}",
+                "parameters": [id_parameter],
+                "requestBody": body,
+                "responses": {
+                    "200": {
+                        "description": "Item updated",
+                        "content": {
+                            "application/json": {
+                                "schema": _item_schema(),
+                                "example": {"id": 1, "name": "Third"},
+                            }
+                        },
+                    },
+                    "404": _error_response("Item not found"),
+                    "422": _error_response("Missing required field"),
+                },
+            },
+            "delete": {
+                "summary": f"Delete one of {resource}",
+                "parameters": [id_parameter],
+                "responses": {
+                    "204": {"description": "Item deleted"},
+                    "404": _error_response("Item not found"),
+                },
+            },
+        },
+    }
+
+
+@app.route("/openapi.json")
+def openapi():
+    """Return the OpenAPI spec of every resource."""
+    paths = {}
+    for resource in RESOURCES:
+        paths.update(_resource_paths(resource))
+    return jsonify(
+        {
+            "openapi": "3.0.0",
+            "info": {"title": "Request Counter API", "version": "1.0.0"},
+            "paths": paths,
+        }
+    )
+
+
+@app.route("/reset", methods=["POST"])
+def reset():
+    """Reset the resources and the request counter."""
+    with lock:
+        reset_db()
+    return jsonify({"status": "reset"}), 200
+
+
+@app.route("/requests", methods=["GET"])
+def requests_received():
+    """Return how many API requests were received since the reset."""
+    return jsonify({"count": request_count})
+
+
+@app.route("/<resource>", methods=["GET"])
+def list_items(resource):
+    """List the items of a resource."""
+    return jsonify(list(items_db[resource].values()))
+
+
+@app.route("/<resource>", methods=["POST"])
+def create_item(resource):
+    """Create an item."""
+    global next_id
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get("name"), str):
+        return jsonify({"error": "Missing required field"}), 422
+    with lock:
+        item = {"id": next_id, "name": data["name"]}
+        items_db[resource][next_id] = item
+        next_id += 1
+    return jsonify(item), 201
+
+
+@app.route("/<resource>/<int:item_id>", methods=["PUT"])
+def update_item(resource, item_id):
+    """Update an item."""
+    if item_id not in items_db[resource]:
+        return jsonify({"error": "Item not found"}), 404
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get("name"), str):
+        return jsonify({"error": "Missing required field"}), 422
+    item = items_db[resource][item_id]
+    item["name"] = data["name"]
+    return jsonify(item)
+
+
+@app.route("/<resource>/<int:item_id>", methods=["DELETE"])
+def delete_item(resource, item_id):
+    """Delete an item."""
+    if items_db[resource].pop(item_id, None) is None:
+        return jsonify({"error": "Item not found"}), 404
+    return "", 204
+
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=8000, threaded=True)
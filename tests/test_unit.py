@@ -704,3 +704,2330 @@ def test_full_object_schema_with_email_format_generates_invalid_email():
         f"Expected at least one generated object with an invalid email, "
         f"but all email values look valid: {[tc.get('email') for tc in test_cases if isinstance(tc, dict)]}"
     )
+
+
+# ---------------------------------------------------------------------------
+# pooled HTTP session tests
+# ---------------------------------------------------------------------------
+
+
+def test_get_session_reuses_one_session_per_base_url():
+    """Requests to the same scheme/host/port share one pooled session."""
+    from pytest_openapi.session import close_sessions, get_session
+
+    try:
+        first = get_session("http://api.test:8000/users")
+        second = get_session("http://api.test:8000/users/1")
+        other = get_session("http://other.test:8000/users")
+
+        assert first is second
+        assert first is not other
+    finally:
+        close_sessions()
+
+
+def test_configure_sessions_applies_pool_size_and_keep_alive():
+    """Pool size is applied to the mounted adapter; keep-alive can be
+    disabled."""
+    from pytest_openapi.session import (
+        DEFAULT_POOL_SIZE,
+        configure_sessions,
+        get_session,
+    )
+
+    try:
+        configure_sessions(pool_size=4, keep_alive=False)
+        session = get_session("http://api.test:8000")
+        adapter = session.get_adapter("http://api.test:8000/users")
+
+        assert adapter._pool_maxsize == 4
+        assert session.headers["Connection"] == "close"
+
+        with pytest.raises(ValueError):
+            configure_sessions(pool_size=0)
+    finally:
+        configure_sessions(pool_size=DEFAULT_POOL_SIZE, keep_alive=True)
+
+
+def test_shared_session_does_not_keep_cookies():
+    """A cookie set by one response is not sent with the next request."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from pytest_openapi.session import close_sessions, get_session
+
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            received.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=abc; Path=/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/login"
+    try:
+        session = get_session(url)
+        session.get(url)
+        session.get(url)
+        assert len(session.cookies) == 0
+    finally:
+        close_sessions()
+        server.shutdown()
+        server.server_close()
+
+    assert received == [None, None]
+
+
+def test_make_request_uses_shared_session():
+    """make_request sends through the shared session, not requests.get."""
+    from pytest_openapi.contract import make_request
+
+    session = MagicMock()
+    with patch(
+        "pytest_openapi.contract.get_session", return_value=session
+    ) as get_session:
+        make_request("POST", "http://api.test/items", json={"a": 1}, timeout=3)
+
+    get_session.assert_called_once_with("http://api.test/items")
+    session.post.assert_called_once_with(
+        "http://api.test/items", json={"a": 1}, timeout=3, stream=True
+    )
+
+
+# ---------------------------------------------------------------------------
+# concurrent execution engine tests
+# ---------------------------------------------------------------------------
+
+
+def test_run_checks_concurrently_bounds_in_flight_checks():
+    """No more than `concurrency` checks run at once, and results keep
+    the order of the input checks."""
+    import threading
+
+    from pytest_openapi.runner import run_checks_concurrently
+
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def make_check(i):
+        def check():
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.02)
+            with lock:
+                state["in_flight"] -= 1
+            return True, f"check-{i}"
+
+        return check
+
+    outcomes = run_checks_concurrently([make_check(i) for i in range(12)], 3)
+
+    assert [result for result, _, _ in outcomes] == [
+        (True, f"check-{i}") for i in range(12)
+    ]
+    assert 1 < state["peak"] <= 3
+
+
+def test_concurrent_checks_capture_records_and_exceptions():
+    """Records logged by a concurrent check are held back until replayed,
+    and exceptions are re-raised by replay_outcome."""
+    from pytest_openapi import contract
+    from pytest_openapi.runner import replay_outcome, run_checks_concurrently
+
+    def passing_check():
+        contract.log_test_result("GET", "/items", None, 200, {}, 200, {}, True)
+        return True, None
+
+    def broken_check():
+        raise ValueError("not JSON")
+
+    before = len(contract.test_reports)
+    ok_outcome, broken_outcome = run_checks_concurrently(
+        [passing_check, broken_check], 2
+    )
+    assert len(contract.test_reports) == before
+
+    replayed = []
+    assert replay_outcome(ok_outcome, replayed) == (True, None)
+    assert [r["path"] for r in replayed] == ["/items"]
+    with pytest.raises(ValueError, match="not JSON"):
+        replay_outcome(broken_outcome, replayed)
+
+
+def test_run_checks_concurrently_keeps_order_within_a_key():
+    """Checks sharing a key (e.g. one path) run sequentially, in order."""
+    import threading
+
+    from pytest_openapi.runner import run_checks_concurrently
+
+    lock = threading.Lock()
+    started = []
+    running = set()
+    overlaps = []
+
+    def make_check(key, i):
+        def check():
+            with lock:
+                if key in running:
+                    overlaps.append(key)
+                running.add(key)
+                started.append((key, i))
+            time.sleep(0.01)
+            with lock:
+                running.discard(key)
+            return True, None
+
+        return check
+
+    keys = ["/a", "/b", "/a", "/b", "/a", "/c"]
+    checks = [make_check(key, i) for i, key in enumerate(keys)]
+    run_checks_concurrently(checks, 4, keys)
+
+    assert overlaps == []
+    assert [i for key, i in started if key == "/a"] == [0, 2, 4]
+    assert [i for key, i in started if key == "/b"] == [1, 3]
+
+
+# ---------------------------------------------------------------------------
+# OpenAPI spec loading tests
+# ---------------------------------------------------------------------------
+
+
+def _make_spec_response(status_code, spec=None, headers=None):
+    """Helper to create a mock /openapi.json response."""
+    mock = MagicMock()
+    mock.status_code = status_code
+    mock.headers = headers or {}
+    mock.content = json.dumps(spec).encode() if spec is not None else b""
+    mock.json.return_value = spec
+    return mock
+
+
+def test_load_openapi_spec_revalidates_cached_spec(tmp_path):
+    """A cached spec is revalidated with If-None-Match and reused on 304."""
+    from pytest_openapi.openapi import load_openapi_spec
+
+    spec = {"openapi": "3.0.0", "paths": {"/items": {}}}
+    session = MagicMock()
+    session.get.return_value = _make_spec_response(
+        200, spec, headers={"ETag": '"v1"'}
+    )
+    with patch("pytest_openapi.openapi.get_session", return_value=session):
+        first = load_openapi_spec("http://api.test", cache_dir=str(tmp_path))
+
+    assert first == spec
+    assert session.get.call_args.kwargs["headers"] == {}
+
+    session.get.return_value = _make_spec_response(304)
+    with patch("pytest_openapi.openapi.get_session", return_value=session):
+        second = load_openapi_spec("http://api.test", cache_dir=str(tmp_path))
+
+    assert second == spec
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_validate_openapi_spec_uses_given_spec_without_fetching():
+    """validate_openapi_spec does not download the spec a second time."""
+    from pytest_openapi.openapi import validate_openapi_spec
+
+    spec = {
+        "openapi": "3.0.0",
+        "paths": {
+            "/items": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {"application/json": {"example": []}},
+                        }
+                    }
+                }
+            }
+        },
+    }
+    with patch("pytest_openapi.openapi.get_session") as get_session:
+        assert validate_openapi_spec("http://api.test", spec=spec) is spec
+
+    get_session.assert_not_called()
+
+
+def test_read_openapi_spec_file_reads_json_and_yaml(tmp_path):
+    """Local spec files are parsed as JSON, or YAML by extension."""
+    from pytest_openapi.openapi import read_openapi_spec_file
+
+    spec = {"openapi": "3.0.0", "paths": {"/items": {}}}
+    json_file = tmp_path / "openapi.json"
+    json_file.write_text(json.dumps(spec))
+    assert read_openapi_spec_file(str(json_file)) == spec
+
+    pytest.importorskip("yaml")
+    yaml_file = tmp_path / "openapi.yaml"
+    yaml_file.write_text("openapi: 3.0.0\npaths:\n  /items: {}\n")
+    assert read_openapi_spec_file(str(yaml_file)) == spec
+
+
+def test_read_openapi_spec_file_reads_stdin(monkeypatch):
+    """A path of '-' reads the spec from stdin."""
+    import io
+
+    from pytest_openapi.openapi import read_openapi_spec_file
+
+    spec = {"openapi": "3.0.0", "paths": {}}
+    stdin = io.TextIOWrapper(io.BytesIO(json.dumps(spec).encode()))
+    monkeypatch.setattr("sys.stdin", stdin)
+    assert read_openapi_spec_file("-") == spec
+
+
+def test_read_openapi_spec_file_exits_on_invalid_document(tmp_path):
+    """An unparseable or non-object spec file exits with status 1."""
+    from pytest_openapi.openapi import read_openapi_spec_file
+
+    bad_file = tmp_path / "openapi.json"
+    bad_file.write_text("[1, 2, 3]")
+    with pytest.raises(SystemExit) as exc_info:
+        read_openapi_spec_file(str(bad_file))
+    assert exc_info.value.code == 1
+
+    with pytest.raises(SystemExit):
+        read_openapi_spec_file(str(tmp_path / "missing.json"))
+
+
+# ---------------------------------------------------------------------------
+# schema resolution cache tests
+# ---------------------------------------------------------------------------
+
+
+def test_resolve_schema_memoizes_ref_and_allof_resolution():
+    """Each composed schema is resolved once and then served from cache."""
+    from pytest_openapi import schema as schema_module
+    from pytest_openapi.schema import clear_resolution_cache, resolve_schema
+
+    spec = {
+        "components": {
+            "schemas": {
+                "Base": {
+                    "type": "object",
+                    "properties": {"id": {"type": "integer"}},
+                    "required": ["id"],
+                },
+                "Book": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Base"},
+                        {"properties": {"title": {"type": "string"}}},
+                    ]
+                },
+            }
+        }
+    }
+    ref = {"$ref": "#/components/schemas/Book"}
+    clear_resolution_cache()
+
+    with patch.object(
+        schema_module, "_resolve", wraps=schema_module._resolve
+    ) as resolve:
+        first = resolve_schema(spec, ref)
+        calls = resolve.call_count
+        second = resolve_schema(spec, ref)
+
+    assert first is second
+    assert resolve.call_count == calls
+    assert set(first["properties"]) == {"id", "title"}
+    assert first["required"] == ["id"]
+
+
+def test_resolve_schema_cache_handles_cycles_and_is_bounded(monkeypatch):
+    """Recursive schemas still terminate and the cache never overflows."""
+    from pytest_openapi import schema as schema_module
+    from pytest_openapi.schema import clear_resolution_cache, resolve_schema
+
+    spec = {
+        "components": {
+            "schemas": {
+                "Node": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Node"},
+                        {"properties": {"value": {"type": "string"}}},
+                    ]
+                }
+            }
+        }
+    }
+    clear_resolution_cache()
+    resolved = resolve_schema(spec, {"$ref": "#/components/schemas/Node"})
+    assert resolved["properties"] == {"value": {"type": "string"}}
+
+    monkeypatch.setattr(schema_module, "RESOLUTION_CACHE_SIZE", 3)
+    for i in range(10):
+        resolve_schema(spec, {"allOf": [{"title": str(i)}]})
+    assert len(schema_module._resolution_cache) == 3
+    clear_resolution_cache()
+    assert not schema_module._resolution_cache
+
+
+# ---------------------------------------------------------------------------
+# compiled validator tests
+# ---------------------------------------------------------------------------
+
+
+def test_get_validator_compiles_each_schema_once():
+    """The same schema object is compiled once and the checker reused."""
+    from pytest_openapi import validator as validator_module
+    from pytest_openapi.validator import clear_validator_cache, get_validator
+
+    schema = {"type": "array", "items": {"type": "integer"}}
+    clear_validator_cache()
+    with patch.object(
+        validator_module,
+        "compile_schema",
+        wraps=validator_module.compile_schema,
+    ) as compile_schema:
+        first = get_validator(schema)
+        second = get_validator(schema)
+
+    assert first is second
+    compile_schema.assert_called_once()
+    assert first([1, 2], "") == (True, None)
+    assert first([1, "x"], "items") == (
+        False,
+        "items[1]: Expected integer, got str",
+    )
+
+
+def test_compiled_validator_handles_recursive_schemas():
+    """Recursive $ref schemas compile lazily and validate nested data."""
+    from pytest_openapi.contract import validate_against_schema
+
+    spec = {
+        "components": {
+            "schemas": {
+                "Node": {
+                    "type": "object",
+                    "required": ["value"],
+                    "properties": {
+                        "value": {"type": "integer"},
+                        "children": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Node"},
+                        },
+                    },
+                }
+            }
+        }
+    }
+    schema = {"$ref": "#/components/schemas/Node"}
+    tree = {"value": 1, "children": [{"value": 2, "children": []}]}
+    assert validate_against_schema(schema, tree, spec=spec) == (True, None)
+
+    broken = {"value": 1, "children": [{"children": []}]}
+    assert validate_against_schema(schema, broken, spec=spec) == (
+        False,
+        "children[0]: Missing required property 'value'",
+    )
+
+
+# ---------------------------------------------------------------------------
+# request body classification tests
+# ---------------------------------------------------------------------------
+
+
+def test_classify_request_body_finds_all_categories_in_one_pass():
+    """Invalid enum and format values are reported with their paths."""
+    from pytest_openapi.contract import classify_request_body
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string", "enum": ["active", "inactive"]},
+            "contacts": {
+                "type": "array",
+                "items": {"type": "string", "format": "email"},
+            },
+        },
+    }
+    body = {
+        "status": "unknown",
+        "contacts": ["a@example.com", "user@@double.com"],
+    }
+
+    assert classify_request_body(schema, body) == {
+        "invalid_enum": ["status"],
+        "invalid_format": ["contacts[1]"],
+    }
+    assert classify_request_body(
+        schema, {"status": "active", "contacts": []}
+    ) == {"invalid_enum": [], "invalid_format": []}
+
+
+def test_is_negative_case_requires_400_for_format_errors():
+    """Format errors only make a negative case when 400 is documented."""
+    from pytest_openapi.contract import is_negative_case
+
+    format_only = {"invalid_enum": [], "invalid_format": ["email"]}
+    assert is_negative_case(format_only, {200, 400})
+    assert not is_negative_case(format_only, {200})
+    assert is_negative_case(
+        {"invalid_enum": ["status"], "invalid_format": []}, {200}
+    )
+
+
+# ---------------------------------------------------------------------------
+# case record tests
+# ---------------------------------------------------------------------------
+
+
+def test_generate_test_case_records_tags_negative_cases():
+    """Records carry the same values as the plain generator plus their
+    intent, with the offending path for negative cases."""
+    from pytest_openapi.case_generator import (
+        generate_test_case_records,
+        generate_test_cases_for_schema,
+    )
+
+    schema = {
+        "type": "object",
+        "required": ["email"],
+        "properties": {
+            "email": {"type": "string", "format": "email"},
+            "tags": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["a", "b"]},
+            },
+        },
+    }
+    records, _ = generate_test_case_records(schema)
+    values, _ = generate_test_cases_for_schema(schema)
+
+    assert [r["value"] for r in records] == values
+    assert all(r["origin"] == "generated" for r in records)
+
+    negatives = [r for r in records if r["expected"] == "reject"]
+    assert {(r["rule"], r["path"]) for r in negatives} == {
+        ("invalid_enum", "tags[2]"),
+        ("invalid_format", "email"),
+    }
+    for record in records:
+        if record["expected"] == "accept":
+            assert record["rule"] is None and record["path"] is None
+
+
+def test_post_endpoint_single_uses_case_record_without_rewalking():
+    """A tagged case decides the negative check; the body is not
+    classified again."""
+    from pytest_openapi.case_generator import make_case_record
+    from pytest_openapi.contract import test_post_endpoint_single
+
+    operation = {
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "email": {"type": "string", "format": "email"}
+                        },
+                    }
+                }
+            }
+        },
+        "responses": {
+            "201": {"content": {"application/json": {"example": {"id": 1}}}},
+            "400": {"description": "Bad request"},
+        },
+    }
+    body = {"email": "user@@double.com"}
+    case = make_case_record(body, rule="invalid_format", path="email")
+    response = _make_mock_response(400, {"detail": "invalid email"})
+
+    with (
+        patch("pytest_openapi.contract.make_request", return_value=response),
+        patch("pytest_openapi.contract.classify_request_body") as classify,
+    ):
+        success, error = test_post_endpoint_single(
+            "http://api.test", "/users", operation, body, "generated", case=case
+        )
+
+    assert success, error
+    classify.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# covering array tests
+# ---------------------------------------------------------------------------
+
+
+def test_covering_array_covers_every_pair_with_fewer_rows():
+    """A pairwise array covers all value pairs in far fewer rows than the
+    full product."""
+    from itertools import combinations, product
+
+    from pytest_openapi.case_generator import covering_array
+
+    sizes = [3, 3, 3, 3]
+    rows = covering_array(sizes, strength=2)
+
+    assert rows[0] == (0, 0, 0, 0)
+    assert len(rows) < len(list(product(*(range(n) for n in sizes))))
+    for a, b in combinations(range(len(sizes)), 2):
+        covered = {(row[a], row[b]) for row in rows}
+        assert covered == set(product(range(sizes[a]), range(sizes[b])))
+
+    assert covering_array(sizes, strength=2, budget=4) == rows[:4]
+    assert covering_array([], strength=2) == [()]
+
+
+def test_covering_array_budget_bounds_work_on_wide_objects():
+    """A budget stops the search early instead of enumerating every t-tuple
+    of a wide object up front."""
+    from pytest_openapi.case_generator import covering_array
+
+    rows = covering_array([5] * 60, strength=3, budget=2)
+
+    assert len(rows) == 2
+    assert rows[0] == (0,) * 60
+
+
+def test_object_combinations_follow_configured_strength_and_budget():
+    """configure_combinations controls how many objects are combined."""
+    from pytest_openapi.case_generator import (
+        configure_combinations,
+        generate_object_test_cases,
+    )
+
+    schema = {
+        "type": "object",
+        "properties": {
+            name: {"type": "string", "enum": ["a", "b", "c"]}
+            for name in ("x", "y", "z")
+        },
+    }
+    try:
+        configure_combinations(strength=1, max_combinations=10)
+        objects, _ = generate_object_test_cases(schema)
+        assert len(objects) == 3
+        assert {obj["x"] for obj in objects} == {"a", "b", "c"}
+
+        configure_combinations(strength=2, max_combinations=5)
+        objects, _ = generate_object_test_cases(schema)
+        assert len(objects) == 5
+    finally:
+        configure_combinations()
+
+    with pytest.raises(ValueError):
+        configure_combinations(strength=0)
+
+
+# ---------------------------------------------------------------------------
+# case budget tests
+# ---------------------------------------------------------------------------
+
+
+def _budget_plan():
+    """Helper to build a plan with two POST operations."""
+    from pytest_openapi.case_generator import make_case_record
+    from pytest_openapi.plan import make_plan_entry
+
+    plan = []
+    for path in ("/a", "/b"):
+        operation = {}
+        cases = [
+            make_case_record({"n": 0}, "example"),
+            make_case_record({"n": 1}),
+            make_case_record({"n": 2}),
+            make_case_record({"n": 3}, rule="invalid_enum", path="n"),
+        ]
+        for i, case in enumerate(cases):
+            plan.append(make_plan_entry("post", path, operation, i, case))
+    return plan
+
+
+def test_apply_case_budgets_keeps_examples_then_negatives_per_operation():
+    """A per-operation budget keeps the example, then the negative case."""
+    from pytest_openapi.plan import apply_case_budgets
+
+    kept = apply_case_budgets(_budget_plan(), max_per_operation=2)
+
+    assert [(e["path"], e["index"]) for e in kept] == [
+        ("/a", 0),
+        ("/a", 3),
+        ("/b", 0),
+        ("/b", 3),
+    ]
+
+
+def test_apply_case_budgets_total_budget_and_vendor_extension():
+    """The total budget shares cases across operations by priority, and
+    x-pytest-openapi overrides the per-operation budget."""
+    from pytest_openapi.plan import apply_case_budgets
+
+    plan = _budget_plan()
+    kept = apply_case_budgets(plan, max_total=5)
+    assert [(e["path"], e["index"]) for e in kept] == [
+        ("/a", 0),
+        ("/a", 1),
+        ("/a", 3),
+        ("/b", 0),
+        ("/b", 3),
+    ]
+
+    plan[0]["operation"]["x-pytest-openapi"] = {"max-cases": 1}
+    kept = apply_case_budgets(plan, max_per_operation=3)
+    assert [(e["path"], e["index"]) for e in kept] == [
+        ("/a", 0),
+        ("/b", 0),
+        ("/b", 1),
+        ("/b", 3),
+    ]
+
+
+def test_apply_case_budgets_keeps_boundary_cases_with_negatives():
+    """Values on a declared edge are tagged as boundaries and outrank the
+    other generated cases."""
+    from pytest_openapi.case_generator import generate_test_case_records
+    from pytest_openapi.plan import (
+        apply_case_budgets,
+        collect_request_cases,
+        make_plan_entry,
+    )
+
+    records, _ = generate_test_case_records(
+        {"type": "integer", "minimum": 1, "maximum": 5}
+    )
+    assert [(r["value"], r["intent"]) for r in records] == [
+        (1, "boundary"),
+        (3, None),
+        (5, "boundary"),
+    ]
+
+    operation = {
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "maxItems": 2,
+                    },
+                    "example": ["tag"],
+                }
+            }
+        }
+    }
+    cases = collect_request_cases(operation)
+    plan = [
+        make_plan_entry("post", "/tags", operation, i, case)
+        for i, case in enumerate(cases)
+    ]
+
+    kept = apply_case_budgets(plan, max_per_operation=2)
+
+    assert [e["case"]["origin"] for e in kept] == ["example", "generated"]
+    assert kept[1]["case"]["intent"] == "boundary"
+    assert len(kept[1]["case"]["value"]) == 2
+
+
+# ---------------------------------------------------------------------------
+# time budget tests
+# ---------------------------------------------------------------------------
+
+
+def test_prioritize_items_runs_failed_and_examples_first_within_phase():
+    """Items are reordered by value without crossing method phases."""
+    from types import SimpleNamespace
+
+    from pytest_openapi.case_generator import make_case_record
+    from pytest_openapi.plugin import _prioritize_items
+
+    def item(nodeid, method, case):
+        return SimpleNamespace(
+            nodeid=nodeid, _openapi_method=method, _openapi_case=case
+        )
+
+    items = [
+        item("get", "get", None),
+        item("gen", "post", make_case_record({})),
+        item("failed", "post", make_case_record({})),
+        item("neg", "post", make_case_record({}, rule="invalid_enum", path="")),
+        item("example", "post", make_case_record({}, "example")),
+        item("delete", "delete", None),
+    ]
+    ordered = _prioritize_items(items, {"failed": True})
+
+    assert [i.nodeid for i in ordered] == [
+        "get",
+        "failed",
+        "example",
+        "neg",
+        "gen",
+        "delete",
+    ]
+
+
+def test_run_checks_concurrently_does_not_start_checks_after_deadline():
+    """Checks not started before the deadline have no outcome."""
+    from pytest_openapi.runner import run_checks_concurrently
+
+    calls = []
+
+    def check():
+        calls.append(1)
+        return True, None
+
+    outcomes = run_checks_concurrently(
+        [check, check], concurrency=2, deadline=time.monotonic() - 1
+    )
+
+    assert outcomes == [None, None]
+    assert calls == []
+
+
+def test_run_checks_concurrently_stops_sending_after_failures():
+    """With a maxfail-style stop, checks queued after a failure are not
+    sent."""
+    from pytest_openapi.runner import run_checks_concurrently
+
+    calls = []
+
+    def make_check(i):
+        def check():
+            calls.append(i)
+            return i != 1, None if i != 1 else "boom"
+
+        return check
+
+    outcomes = run_checks_concurrently(
+        [make_check(i) for i in range(6)],
+        concurrency=1,
+        should_stop=lambda failures: failures >= 1,
+    )
+
+    assert calls == [0, 1]
+    assert outcomes[1][0] == (False, "boom")
+    assert outcomes[2:] == [None] * 4
+
+
+def test_stop_condition_follows_maxfail():
+    """Failures of the run and of the phase count towards --maxfail."""
+    from types import SimpleNamespace
+
+    from pytest_openapi.plugin import _stop_condition
+
+    def session(maxfail, testsfailed=0, shouldfail=False):
+        return SimpleNamespace(
+            config=SimpleNamespace(getoption=lambda name, default: maxfail),
+            testsfailed=testsfailed,
+            shouldstop=False,
+            shouldfail=shouldfail,
+        )
+
+    assert not _stop_condition(session(None))(5)
+    assert not _stop_condition(session(0))(5)
+    assert not _stop_condition(session(3, testsfailed=1))(1)
+    assert _stop_condition(session(3, testsfailed=1))(2)
+    assert _stop_condition(session(0, shouldfail=True))(0)
+
+
+# ---------------------------------------------------------------------------
+# latency capture tests
+# ---------------------------------------------------------------------------
+
+
+def test_percentile_interpolates_between_ranks():
+    """Percentiles interpolate linearly between the closest ranks."""
+    from pytest_openapi.latency import percentile
+
+    assert percentile([4, 1, 3, 2], 50) == 2.5
+    assert percentile([10], 99) == 10
+    assert percentile(range(1, 101), 95) == pytest.approx(95.05)
+    assert percentile([1, 2], 100) == 2
+
+    with pytest.raises(ValueError):
+        percentile([], 50)
+    with pytest.raises(ValueError):
+        percentile([1], 101)
+
+
+def test_latency_report_lists_percentiles_and_slowest_endpoints():
+    """The Markdown latency section summarises each operation."""
+    from pytest_openapi.contract import make_timing
+    from pytest_openapi.latency import (
+        get_latency_report_markdown,
+        latency_by_operation,
+    )
+
+    def record(method, path, total):
+        return {
+            "method": method,
+            "path": path,
+            "timing": make_timing(0.001, total / 2, total, 100),
+        }
+
+    records = [record("get", "/fast", t) for t in (0.001, 0.002, 0.003)]
+    records += [record("post", "/slow", t) for t in (0.1, 0.3)]
+    records.append({"method": "get", "path": "/none", "timing": None})
+
+    summary = latency_by_operation(records)
+    assert list(summary) == ["GET /fast", "POST /slow"]
+    assert summary["GET /fast"]["count"] == 3
+    assert summary["GET /fast"]["p50"] == pytest.approx(2.0)
+    assert summary["POST /slow"]["max"] == pytest.approx(300.0)
+    assert summary["POST /slow"]["bytes"] == 200
+
+    lines = get_latency_report_markdown(records, slowest=1)
+    assert lines[0] == "## Latency"
+    slowest = lines[lines.index("### Slowest Endpoints") :]
+    assert any("`POST /slow`" in line for line in slowest)
+    assert not any("`GET /fast`" in line for line in slowest)
+    assert get_latency_report_markdown([{"timing": None}]) == []
+
+
+def test_make_request_attaches_timing_to_next_record():
+    """Timing covers the request and connect time drops on reuse."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from pytest_openapi import contract
+    from pytest_openapi.session import close_sessions
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/items"
+    try:
+        with contract.captured_test_results() as records:
+            for _ in range(2):
+                contract.make_request("GET", url)
+                contract.log_test_result(
+                    "GET", "/items", None, 200, None, 200, None, True
+                )
+            contract.log_test_result(
+                "GET", "/items", None, 200, None, None, None, False
+            )
+    finally:
+        close_sessions()
+        server.shutdown()
+        server.server_close()
+
+    first, second, unsent = (record["timing"] for record in records)
+    assert first["size_bytes"] == len(b'{"ok": true}')
+    assert first["connect_ms"] > 0
+    assert first["total_ms"] >= first["ttfb_ms"] >= first["connect_ms"]
+    # The second request reuses the pooled keep-alive connection
+    assert second["connect_ms"] == 0
+    assert unsent is None
+
+
+# ---------------------------------------------------------------------------
+# latency budget tests
+# ---------------------------------------------------------------------------
+
+
+def test_latency_budget_prefers_response_then_operation_then_default():
+    """x-latency-budget-ms on the response wins over the operation."""
+    from pytest_openapi.latency import latency_budget_ms
+
+    operation = {
+        "x-latency-budget-ms": 500,
+        "responses": {"200": {"x-latency-budget-ms": 50}, "404": {}},
+    }
+    assert latency_budget_ms(operation, 200, default=1000) == 50
+    assert latency_budget_ms(operation, 404, default=1000) == 500
+    assert latency_budget_ms({"responses": {}}, 200, default=1000) == 1000
+    assert latency_budget_ms({"x-latency-budget-ms": True}, 200) is None
+
+
+def test_check_latency_budget_uses_median_of_resampled_requests():
+    """A slow outlier is re-measured for GET, but never for POST."""
+    from pytest_openapi import contract
+
+    times = iter([5.0, 40.0])
+    closed = []
+
+    def fake_request(method, url, json=None, timeout=10):
+        contract._context.timing = contract.make_timing(0, 0, 0, 0)
+        contract._context.timing["total_ms"] = next(times)
+        return MagicMock(
+            headers={"Content-Type": "application/json"},
+            close=lambda: closed.append(url),
+        )
+
+    operation = {"x-latency-budget-ms": 100}
+    with patch("pytest_openapi.contract.make_request", fake_request):
+        contract._context.timing = contract.make_timing(0, 0, 0.3, 0)
+        assert (
+            contract.check_latency_budget(
+                "GET",
+                "http://api.test/items",
+                operation,
+                200,
+                latency_samples=3,
+            )
+            is None
+        )
+        # The record keeps the first timing plus every sample
+        assert contract._context.timing["total_ms"] == 300.0
+        assert contract._context.timing["samples_ms"] == [300.0, 5.0, 40.0]
+        assert len(closed) == 2
+
+        contract._context.timing = contract.make_timing(0, 0, 0.3, 0)
+        error = contract.check_latency_budget(
+            "POST",
+            "http://api.test/items",
+            operation,
+            201,
+            latency_samples=3,
+        )
+    contract._context.timing = None
+
+    assert error == (
+        "Response time 300.0 ms exceeds the latency budget of 100 ms"
+        " (1 sample)"
+    )
+
+
+def test_check_latency_budget_resamples_streams_to_their_end():
+    """Re-sent streams are timed to the end of the stream, like the first
+    response, and released once read."""
+    from pytest_openapi import contract
+
+    sent = []
+
+    def fake_request(method, url, json=None, timeout=10):
+        contract._context.timing = contract.make_timing(0, 0, 0, 0)
+        contract._context.request_started = time.perf_counter()
+        response, remaining = _slow_stream(
+            [b"data: 1\n\n", b"data: 2\n\n", b"data: [DONE]\n\n"]
+        )
+        response.close = lambda: sent.append(remaining)
+        return response
+
+    operation = {"x-latency-budget-ms": 100}
+    contract._context.timing = contract.make_timing(0, 0, 0.3, 0)
+    with patch("pytest_openapi.contract.make_request", fake_request):
+        error = contract.check_latency_budget(
+            "GET",
+            "http://api.test/stream",
+            operation,
+            200,
+            latency_samples=3,
+        )
+    samples = contract._context.timing["samples_ms"]
+    contract._context.timing = None
+
+    assert error is None
+    assert samples[0] == 300.0
+    # Each resample covers the slow end of its stream
+    assert all(20 <= s < 100 for s in samples[1:]) and len(samples) == 3
+    # Both resampled streams were read through, then closed
+    assert [len(remaining) for remaining in sent] == [0, 0]
+
+
+def test_get_latency_budget_covers_the_whole_stream():
+    """A GET stream whose headers arrive at once but whose body is slow
+    fails its latency budget."""
+    from datetime import timedelta
+
+    from pytest_openapi import contract
+
+    response, _ = _slow_stream(
+        [b'data: {"n": 1}\n\n', b"data: [DONE]\n\n"], delay=0.06
+    )
+    response.status_code = 200
+    response.elapsed = timedelta(0)
+    session = MagicMock()
+    session.get.return_value = response
+    operation = {
+        "responses": {
+            "200": {
+                "description": "Events",
+                "x-latency-budget-ms": 30,
+                "content": {
+                    "text/event-stream": {"example": [{"n": 1}, "[DONE]"]}
+                },
+            }
+        }
+    }
+
+    records = []
+    with (
+        patch("pytest_openapi.contract.get_session", return_value=session),
+        patch.object(contract, "test_reports", records),
+    ):
+        success, error = contract.test_get_endpoint(
+            "http://api.test", "/events", operation
+        )
+    contract._context.timing = None
+
+    assert not success
+    assert "exceeds the latency budget of 30 ms" in error
+    assert records[0]["actual_body"] == [{"n": 1}, "[DONE]"]
+    assert records[0]["timing"]["total_ms"] >= 60
+
+
+# ---------------------------------------------------------------------------
+# latency baseline tests
+# ---------------------------------------------------------------------------
+
+
+def _timed_records(path, totals_ms):
+    from pytest_openapi.contract import make_timing
+
+    return [
+        {
+            "method": "get",
+            "path": path,
+            "timing": make_timing(0, 0, t / 1000, 0),
+        }
+        for t in totals_ms
+    ]
+
+
+def test_latency_baseline_round_trip_and_regressions(tmp_path):
+    """p95 regressions beyond the ratio and noise floor are reported."""
+    from pytest_openapi.latency import (
+        find_regressions,
+        read_baseline,
+        write_baseline,
+    )
+
+    before = _timed_records("/slow", [100] * 20)
+    before += _timed_records("/fast", [1] * 20)
+    before += _timed_records("/stable", [50] * 20)
+    path = tmp_path / "baseline.json"
+    write_baseline(path, before)
+    baseline = read_baseline(path)
+    assert baseline["operations"]["GET /slow"]["p95"] == 100
+
+    after = _timed_records("/slow", [300] * 20)
+    after += _timed_records("/fast", [3] * 20)  # 3x, but only 2 ms slower
+    after += _timed_records("/stable", [60] * 20)
+    after += _timed_records("/new", [500] * 20)
+
+    regressions = find_regressions(after, baseline, ratio=1.5)
+    assert [r["operation"] for r in regressions] == ["GET /slow"]
+    assert regressions[0]["ratio"] == pytest.approx(3.0)
+
+    path.write_text('{"version": 99}')
+    with pytest.raises(ValueError):
+        read_baseline(path)
+
+
+def test_latency_regressions_fail_the_session(capsys):
+    """A regression turns an otherwise green session red."""
+    from types import SimpleNamespace
+
+    from pytest_openapi import contract
+    from pytest_openapi.latency import make_baseline
+    from pytest_openapi.plugin import _check_latency_regressions
+
+    baseline = make_baseline(_timed_records("/users", [10] * 5))
+    config = SimpleNamespace(
+        _openapi_regression_ratio=1.5,
+        _openapi_baseline_path="baseline.json",
+        _openapi_no_stdout=False,
+    )
+    session = SimpleNamespace(exitstatus=pytest.ExitCode.OK)
+    with patch.object(
+        contract, "test_reports", _timed_records("/users", [40] * 5)
+    ):
+        _check_latency_regressions(session, config, baseline)
+
+    assert session.exitstatus == pytest.ExitCode.TESTS_FAILED
+    output = capsys.readouterr().out
+    assert "GET /users: p95 10.0 ms -> 40.0 ms (4.0x)" in output
+
+
+# ---------------------------------------------------------------------------
+# load test mode tests
+# ---------------------------------------------------------------------------
+
+
+def test_run_load_open_loop_sends_at_target_rate():
+    """The open-loop scheduler sends rps * duration requests."""
+    from pytest_openapi.load import run_load
+
+    calls = []
+
+    def ok():
+        calls.append("ok")
+        return True, None
+
+    def broken():
+        calls.append("broken")
+        return False, "Expected 200, got 500"
+
+    summary = run_load([ok, ok, ok, broken], duration=0.2, rps=100)
+
+    assert summary["requests"] == 20
+    assert calls[:4] == ["ok", "ok", "ok", "broken"]
+    assert summary["errors"] == 5
+    assert summary["error_rate"] == 0.25
+    assert summary["failures"] == [("Expected 200, got 500", 5)]
+    assert summary["p50"] <= summary["p95"] <= summary["max"]
+
+
+def test_run_load_closed_loop_counts_exceptions_as_errors():
+    """Closed-loop workers keep sending until the duration is over."""
+    from pytest_openapi.load import format_load_summary, run_load
+
+    def flaky():
+        raise ValueError("bad JSON")
+
+    summary = run_load([flaky], duration=0.05, concurrency=2)
+
+    assert summary["requests"] > 0
+    assert summary["errors"] == summary["requests"]
+    assert summary["failures"][0][0] == "ValueError: bad JSON"
+    lines = format_load_summary(summary)
+    assert "closed loop with 2 workers" in lines[0]
+
+
+# ---------------------------------------------------------------------------
+# incremental streaming tests
+# ---------------------------------------------------------------------------
+
+
+def _fake_stream(content_type, chunks):
+    """Return a stream=True style response delivering *chunks*."""
+    from types import SimpleNamespace
+
+    remaining = list(chunks)
+    raw = SimpleNamespace(
+        closed=False,
+        read1=lambda amt, decode_content=None: (
+            remaining.pop(0) if remaining else b""
+        ),
+    )
+    response = SimpleNamespace(
+        headers={"Content-Type": content_type},
+        raw=raw,
+        close=lambda: None,
+    )
+    return response, remaining
+
+
+def _slow_stream(chunks, delay=0.03):
+    """Return an SSE response whose last chunk arrives after *delay*."""
+    response, remaining = _fake_stream("text/event-stream", chunks)
+    read1 = response.raw.read1
+
+    def slow_read1(amt, decode_content=None):
+        if len(remaining) == 1:
+            time.sleep(delay)
+        return read1(amt, decode_content)
+
+    response.raw.read1 = slow_read1
+    return response, remaining
+
+
+def test_read_stream_frames_sse_events_and_stops_at_done():
+    """Multi-line data, comments and fields split across reads."""
+    from pytest_openapi.streaming import read_stream
+
+    response, remaining = _fake_stream(
+        "text/event-stream; charset=utf-8",
+        [
+            b': keep-alive\r\nevent: token\r\nid: 1\r\ndata: {"a":',
+            b"\r\ndata: 1}\r\n\r\ndata: plain text\n\n",
+            b"data: [DONE]\n\n",
+            b"data: never read\n\n",
+        ],
+    )
+    result = read_stream(response)
+
+    assert result["chunks"] == [{"a": 1}, "plain text", "[DONE]"]
+    assert result["done"] is True
+    # Reading stopped at [DONE]; the last read was never made
+    assert remaining == [b"data: never read\n\n"]
+    assert result["first_event_ms"] <= result["total_ms"]
+
+
+def test_read_stream_decodes_compressed_streams():
+    """gzip-encoded SSE and NDJSON bodies are framed after decoding."""
+    import gzip
+    import io
+
+    import requests
+    from urllib3.response import HTTPResponse
+
+    from pytest_openapi.streaming import read_stream
+
+    for content_type, body in (
+        ("text/event-stream", b'data: {"a": 1}\n\ndata: [DONE]\n\n'),
+        ("application/x-ndjson", b'{"a": 1}\n{"a": 2}\n'),
+    ):
+        headers = {"Content-Type": content_type, "Content-Encoding": "gzip"}
+        # What requests hands over with stream=True: undecoded raw bytes
+        raw = HTTPResponse(
+            body=io.BytesIO(gzip.compress(body)),
+            headers=headers,
+            status=200,
+            preload_content=False,
+            decode_content=False,
+        )
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = requests.structures.CaseInsensitiveDict(headers)
+        response.raw = raw
+
+        result = read_stream(response)
+
+        assert result["events"] == 2
+        assert result["chunks"][0] == {"a": 1}
+        assert result["bytes"] == len(body)
+
+
+def test_read_stream_applies_caps_and_keeps_text_without_events():
+    """NDJSON is capped by events and bytes; non-events keep raw text."""
+    from pytest_openapi.streaming import read_stream
+
+    lines = [b'{"n": %d}\n' % i for i in range(10)]
+    response, _ = _fake_stream("application/x-ndjson", lines)
+    result = read_stream(response, max_events=3)
+    assert result["chunks"] == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert result["truncated"] == "max_events"
+
+    response, _ = _fake_stream("application/x-ndjson", lines)
+    result = read_stream(response, max_bytes=20)
+    assert result["truncated"] == "max_bytes"
+    assert result["bytes"] == 20
+    assert result["events"] == 2
+
+    response, _ = _fake_stream("text/event-stream", [b"event: ping\n\n"])
+    result = read_stream(response)
+    assert result["events"] == 0
+    assert result["text"] == "event: ping\n"
+
+
+def test_make_request_measures_time_to_first_event():
+    """SSE events are timed as they arrive, not after the stream ends."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from pytest_openapi import contract
+    from pytest_openapi.session import close_sessions
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for i in range(3):
+                self.wfile.write(b"data: %d\n\n" % i)
+                self.wfile.flush()
+                time.sleep(0.1)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        response = contract.make_request(
+            "GET", f"http://127.0.0.1:{server.server_port}/events"
+        )
+        chunks = contract.collect_streaming_response(response)
+        timing = contract._context.timing
+    finally:
+        contract._context.timing = None
+        close_sessions()
+        server.shutdown()
+        server.server_close()
+
+    assert chunks == [0, 1, 2]
+    assert timing["events"] == 3
+    assert timing["first_event_ms"] < 100
+    assert timing["max_gap_ms"] >= 50
+    assert timing["total_ms"] >= 200
+
+
+# ---------------------------------------------------------------------------
+# streamed item validation tests
+# ---------------------------------------------------------------------------
+
+
+def test_stream_item_schema_and_chunk_validator():
+    """itemSchema, x-stream-item-schema and SSE event envelopes."""
+    from pytest_openapi.streaming import (
+        make_chunk_validator,
+        stream_item_schema,
+    )
+
+    token = {
+        "type": "object",
+        "required": ["token"],
+        "properties": {"token": {"type": "string"}},
+    }
+    response_def = {
+        "content": {
+            "application/json": {"schema": {"type": "object"}},
+            "text/event-stream": {
+                "itemSchema": {
+                    "type": "object",
+                    "properties": {
+                        "event": {"type": "string"},
+                        "data": {
+                            "type": "string",
+                            "contentMediaType": "application/json",
+                            "contentSchema": token,
+                        },
+                    },
+                }
+            },
+            "application/x-ndjson": {"x-stream-item-schema": token},
+        }
+    }
+
+    sse_schema = stream_item_schema(response_def, "text/event-stream")
+    assert "properties" in sse_schema
+    assert stream_item_schema(response_def, "application/x-ndjson") is token
+    assert stream_item_schema({"content": {}}, "text/event-stream") is None
+
+    # The SSE envelope is validated through its data contentSchema
+    on_chunk = make_chunk_validator(sse_schema)
+    assert on_chunk({"token": "hi"}, 0) is None
+    assert on_chunk({"token": 1}, 3) == (
+        "Streamed item does not match its item schema:"
+        " chunk[3].token: Expected string, got int"
+    )
+
+
+def test_read_stream_stops_at_first_invalid_item():
+    """The first bad item stops reading; later reads are never made."""
+    from pytest_openapi.streaming import read_stream
+
+    response, remaining = _fake_stream(
+        "application/x-ndjson",
+        [b'{"ok": 1}\n', b'{"ok": "no"}\n', b'{"ok": 3}\n'],
+    )
+    seen = []
+
+    def on_chunk(chunk, index):
+        seen.append(index)
+        if not isinstance(chunk["ok"], int):
+            return f"chunk[{index}] is bad"
+        return None
+
+    result = read_stream(response, on_chunk=on_chunk)
+
+    assert seen == [0, 1]
+    assert result["error"] == "chunk[1] is bad"
+    assert remaining == [b'{"ok": 3}\n']
+
+
+def test_post_endpoint_single_validates_streamed_items():
+    """A streamed item breaking x-stream-item-schema fails the case."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from pytest_openapi import contract
+    from pytest_openapi.session import close_sessions
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for data in (b'{"n": 1}', b'{"n": "two"}', b"[DONE]"):
+                self.wfile.write(b"data: " + data + b"\n\n")
+
+        def log_message(self, *args):
+            pass
+
+    item_schema = {"type": "object", "properties": {"n": {"type": "integer"}}}
+    operation = {
+        "requestBody": {
+            "content": {"application/json": {"example": {"q": "hi"}}}
+        },
+        "responses": {
+            "200": {
+                "content": {
+                    "text/event-stream": {
+                        "x-stream-item-schema": item_schema,
+                        "example": 'data: {"n": 1}\n\n',
+                    }
+                }
+            }
+        },
+    }
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with contract.captured_test_results() as records:
+            success, error = contract.test_post_endpoint_single(
+                f"http://127.0.0.1:{server.server_port}",
+                "/chat",
+                operation,
+                {"q": "hi"},
+                "example",
+            )
+    finally:
+        close_sessions()
+        server.shutdown()
+        server.server_close()
+
+    assert success is False
+    assert error.endswith("chunk[1].n: Expected integer, got str")
+    assert records[0]["actual_body"] == [{"n": 1}, {"n": "two"}]
+
+
+# ---------------------------------------------------------------------------
+# cached response tests
+# ---------------------------------------------------------------------------
+
+
+def _requests_response(body, content_type="application/json"):
+    """Build a real requests.Response holding *body*."""
+    import requests
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response._content = body
+    response.encoding = requests.utils.get_encoding_from_headers(
+        response.headers
+    )
+    return response
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_cached_response_parses_body_once(use_orjson):
+    """text and json() are decoded once and shared by later calls."""
+    from pytest_openapi import response as response_module
+    from pytest_openapi.response import CachedResponse
+
+    orjson = response_module.orjson if use_orjson else None
+    with patch.object(response_module, "orjson", orjson):
+        response = CachedResponse(_requests_response(b'{"items": [1, 2]}'))
+
+        assert response.json() == {"items": [1, 2]}
+        assert response.json() is response.json()
+        assert response.text is response.text
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == "application/json"
+
+
+def test_cached_response_matches_requests_on_edge_cases():
+    """Bodies orjson rejects still parse, and errors are raised again."""
+    import math
+
+    from pytest_openapi.response import CachedResponse
+
+    # NaN and integers wider than 64 bits are not accepted by orjson
+    response = CachedResponse(
+        _requests_response(b'{"x": NaN, "big": 123456789012345678901234567890}')
+    )
+    body = response.json()
+    assert math.isnan(body["x"])
+    assert body["big"] == 123456789012345678901234567890
+
+    response = CachedResponse(_requests_response(b"not json"))
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            response.json()
+    assert response.text == "not json"
+
+
+# ---------------------------------------------------------------------------
+# records file tests
+# ---------------------------------------------------------------------------
+
+
+def test_truncate_body_keeps_size_and_digest():
+    """Only bodies over the limit are truncated, with size and sha256."""
+    import hashlib
+
+    from pytest_openapi.records import truncate_body
+
+    body = {"items": list(range(100))}
+    encoded = json.dumps(body).encode()
+
+    assert truncate_body(body, None) is body
+    assert truncate_body(body, len(encoded)) is body
+    assert truncate_body("", 1) == ""
+
+    truncated = truncate_body(body, 10)
+    assert truncated == (
+        f'{{"items": ... [truncated: {len(encoded)} bytes,'
+        f" sha256:{hashlib.sha256(encoded).hexdigest()}]"
+    )
+    # Multi-byte characters are never cut in half
+    assert truncate_body("é" * 10, 3).startswith("é... [truncated: 20 bytes")
+
+
+def test_records_file_drops_bodies_and_feeds_the_report(tmp_path):
+    """Flushed records lose their bodies in memory; the report reads them
+    back from the records file."""
+    import hashlib
+
+    from pytest_openapi import contract
+    from pytest_openapi.records import (
+        close_records,
+        configure_records,
+        flush_records,
+        iter_records,
+    )
+
+    path = tmp_path / "records.jsonl"
+    records = []
+    configure_records(path=str(path), max_body_bytes=40)
+    try:
+        with patch.object(contract, "test_reports", records):
+            contract.log_test_result(
+                "POST",
+                "/items",
+                {"name": "x"},
+                201,
+                None,
+                201,
+                {"description": "y" * 50},
+                True,
+            )
+            flush_records(records)
+            contract.log_test_result(
+                "GET",
+                "/items",
+                None,
+                200,
+                None,
+                500,
+                "boom",
+                False,
+                "Expected status 200, got 500",
+            )
+            flush_records(records)
+            close_records()
+
+            assert [r["actual_body"] for r in records] == [None, None]
+            assert records[1]["error_message"] == (
+                "Expected status 200, got 500"
+            )
+
+            saved = list(iter_records(str(path)))
+            assert saved[0]["request_body"] == {"name": "x"}
+            digest = hashlib.sha256(
+                json.dumps({"description": "y" * 50}).encode()
+            ).hexdigest()
+            assert saved[0]["actual_body"] == (
+                '{"description": "'
+                + "y" * 23
+                + f"... [truncated: 69 bytes, sha256:{digest}]"
+            )
+            assert saved[1]["actual_body"] == "boom"
+
+            markdown = contract.get_test_report_markdown(
+                iter_records(str(path))
+            )
+    finally:
+        configure_records()
+
+    assert "- **Failed:** ❌ 1" in markdown
+    assert '"name": "x"' in markdown
+    assert "Expected status 200, got 500" in markdown
+
+
+# ---------------------------------------------------------------------------
+# markdown report writer tests
+# ---------------------------------------------------------------------------
+
+
+def _report_record(path, expected_body, actual_body, success=True):
+    return {
+        "method": "GET",
+        "path": path,
+        "request_body": None,
+        "expected_status": 200,
+        "expected_body": expected_body,
+        "actual_status": 200 if success else 500,
+        "actual_body": actual_body,
+        "success": success,
+        "error_message": None if success else "Expected status 200, got 500",
+        "test_case_origin": "example",
+        "documented_statuses": [],
+        "timing": None,
+    }
+
+
+def test_markdown_writer_collapses_omits_and_caps_bodies():
+    """Report options shrink the per-test sections, never the failures."""
+    import io
+
+    from pytest_openapi import contract
+
+    page = {"items": [{"id": n} for n in range(50)]}
+    records = [
+        _report_record("/a", page, page),
+        _report_record("/b", page, page),
+        _report_record("/c", page, {"error": "boom"}, success=False),
+    ]
+
+    with patch.object(contract, "test_reports", records):
+        plain = contract.get_test_report_markdown()
+        out = io.StringIO()
+        contract.write_test_report_markdown(out, collapse_expected=True)
+        collapsed = out.getvalue()
+        out = io.StringIO()
+        contract.write_test_report_markdown(
+            out, omit_passing_bodies=True, max_json_bytes=30
+        )
+        small = out.getvalue()
+
+    assert collapsed.count('"items"') == 3
+    assert collapsed.count("*Same as Test #1*") == 2
+    assert len(collapsed) < len(plain)
+
+    # Passing tests keep their statuses only; the failure keeps bodies,
+    # cut after 30 bytes
+    assert small.count("**Status:** `200`") == 5
+    assert small.count("```json") == 2
+    assert small.count("... (truncated at 30 bytes)") == 1
+    assert '"error": "boom"' in small
+    assert "Expected status 200, got 500" in small
+
+
+def test_format_json_caps_encoded_bytes():
+    """The JSON byte cap counts UTF-8 bytes, not characters."""
+    from pytest_openapi.contract import _format_json
+
+    body = {"name": "€" * 40, "items": ["日本語"] * 10}
+    text = _format_json(body, 25)
+    head, note = text.split("\n... ")
+
+    assert note == "(truncated at 25 bytes)"
+    assert len(head.encode("utf-8")) <= 25
+    assert _format_json(body, 10_000) == _format_json(body)
+
+
+# ---------------------------------------------------------------------------
+# structured output tests
+# ---------------------------------------------------------------------------
+
+
+def test_json_output_streams_compact_case_results(tmp_path):
+    """Each case becomes one NDJSON line without bodies."""
+    from pytest_openapi.outputs import (
+        case_result,
+        configure_outputs,
+        record_case_results,
+        skipped_result,
+    )
+
+    path = tmp_path / "results.ndjson"
+    record = _report_record("/users", {"big": "body"}, {"big": "body"})
+    record["timing"] = {"total_ms": 12.5, "ttfb_ms": 3.0}
+    configure_outputs(json_path=str(path))
+    try:
+        record_case_results(
+            [case_result(record, ".::test_openapi[GET /users]")]
+        )
+        # Written as soon as it is published, not at the end of the run
+        lines = path.read_text().splitlines()
+        assert len(lines) == 1
+        record_case_results(
+            [skipped_result(".::test_openapi[GET /x]", "time budget")]
+        )
+    finally:
+        configure_outputs()
+
+    results = [json.loads(line) for line in path.read_text().splitlines()]
+    assert results[0] == {
+        "test": ".::test_openapi[GET /users]",
+        "operation": "GET /users",
+        "method": "GET",
+        "path": "/users",
+        "origin": "example",
+        "expected_status": 200,
+        "documented_statuses": [],
+        "actual_status": 200,
+        "success": True,
+        "skipped": None,
+        "error": None,
+        "timing": {"total_ms": 12.5, "ttfb_ms": 3.0},
+    }
+    assert results[1]["skipped"] == "time budget"
+
+
+def test_junit_xml_has_timing_and_operation_attributes():
+    """Failures, skips and per-case request times end up in JUnit XML."""
+    from pytest_openapi.outputs import (
+        case_result,
+        make_junit_xml,
+        skipped_result,
+    )
+
+    passed = _report_record("/users", None, [])
+    passed["timing"] = {"total_ms": 250.0, "ttfb_ms": 200.0}
+    failed = _report_record("/items", None, "boom", success=False)
+    failed["error_message"] = "Expected status 200, got 500\nResponse: boom"
+
+    root = make_junit_xml(
+        [
+            case_result(passed, ".::test_openapi[GET /users]"),
+            case_result(failed, ".::test_openapi[GET /items]"),
+            skipped_result(".::test_openapi[GET /x]", "time budget"),
+        ]
+    )
+    suite = root.find("testsuite")
+    assert suite.attrib["tests"] == "3"
+    assert suite.attrib["failures"] == "1"
+    assert suite.attrib["skipped"] == "1"
+    assert suite.attrib["time"] == "0.250"
+
+    first, second, third = suite.findall("testcase")
+    assert first.attrib["name"] == "test_openapi[GET /users]"
+    assert first.attrib["time"] == "0.250"
+    assert first.attrib["operation"] == "GET /users"
+    assert first.attrib["actual_status"] == "200"
+    assert first.find("failure") is None
+    failure = second.find("failure")
+    assert failure.attrib["message"] == "Expected status 200, got 500"
+    assert failure.text.endswith("Response: boom")
+    assert third.find("skipped").attrib["message"] == "time budget"
+
+
+def test_failed_test_without_record_is_published_as_failed():
+    """Tests failing before any record (e.g. on an exception) still count."""
+    from types import SimpleNamespace
+
+    from pytest_openapi import contract
+    from pytest_openapi.outputs import configure_outputs, kept_case_results
+    from pytest_openapi.plugin import _publish_case_results
+
+    config = SimpleNamespace(
+        _openapi_records_published=len(contract.test_reports)
+    )
+    report = SimpleNamespace(
+        nodeid=".::test_openapi[GET /x]",
+        skipped=False,
+        failed=True,
+        longrepr=SimpleNamespace(
+            reprcrash=SimpleNamespace(
+                message="Failed: GET /x: ValueError: not JSON"
+            )
+        ),
+    )
+    configure_outputs(keep=True)
+    try:
+        _publish_case_results(config, report)
+        results = kept_case_results()
+    finally:
+        configure_outputs()
+
+    assert len(results) == 1
+    assert results[0]["test"] == ".::test_openapi[GET /x]"
+    assert results[0]["success"] is False
+    assert results[0]["skipped"] is None
+    assert results[0]["error"] == "GET /x: ValueError: not JSON"
+
+
+# ---------------------------------------------------------------------------
+# xdist tests
+# ---------------------------------------------------------------------------
+
+
+def test_xdist_group_is_the_first_path_segment():
+    """Nested paths of one resource share a group."""
+    from pytest_openapi.plugin import _xdist_group
+
+    assert _xdist_group("/pets") == "/pets"
+    assert _xdist_group("/pets/{petId}/toys") == "/pets"
+    assert _xdist_group("/") == "/"
+
+
+def test_xdist_controller_ships_spec_and_merges_worker_outputs(tmp_path):
+    """Workers get the validated spec, send their case results with each
+    report, and write their records to files of their own, merged in
+    worker order into the controller's records."""
+    from types import SimpleNamespace
+
+    from pytest_openapi import contract, plugin
+    from pytest_openapi.outputs import configure_outputs, kept_case_results
+    from pytest_openapi.records import close_records, configure_records
+
+    spec = {"openapi": "3.0.0", "paths": {}}
+    config = SimpleNamespace(
+        _openapi_spec=spec,
+        _openapi_worker_dir=str(tmp_path),
+        _openapi_concurrency=4,
+        option=SimpleNamespace(dist="loadgroup", tx=["popen"] * 2),
+        _openapi_worker_outputs={},
+        _openapi_budget_ran=0,
+        _openapi_budget_skipped=0,
+    )
+    node = SimpleNamespace(config=config, workerinput={})
+    plugin.pytest_configure_node(node)
+    assert json.loads(node.workerinput["openapi_spec"]) == spec
+    assert node.workerinput["openapi_loadgroup"] is True
+    assert node.workerinput["openapi_worker_dir"] == str(tmp_path)
+    assert node.workerinput["openapi_concurrency"] == 4
+
+    # A worker attaches the case results of each test to its report
+    worker = SimpleNamespace(
+        workerinput={"workerid": "gw1"}, _openapi_records_published=0
+    )
+    item = SimpleNamespace(config=worker)
+    report = SimpleNamespace(
+        nodeid=".::test_openapi[GET /b]", skipped=False, failed=False
+    )
+    hook = plugin.pytest_runtest_makereport(item, SimpleNamespace(when="call"))
+    next(hook)
+    with patch.object(contract, "test_reports", [_report_record("/b", {}, {})]):
+        with pytest.raises(StopIteration):
+            hook.send(SimpleNamespace(get_result=lambda: report))
+    assert [r["operation"] for r in report.openapi_results] == ["GET /b"]
+
+    # ... which the controller publishes as soon as it arrives
+    configure_outputs(keep=True)
+    try:
+        with patch.object(plugin, "_pytest_config", config):
+            plugin.pytest_runtest_logreport(
+                SimpleNamespace(
+                    when="call",
+                    nodeid=report.nodeid,
+                    openapi_results=report.openapi_results,
+                )
+            )
+        results = kept_case_results()
+    finally:
+        configure_outputs()
+    assert [r["test"] for r in results] == [".::test_openapi[GET /b]"]
+
+    def worker_output(worker_id, path):
+        records_path = plugin._worker_records_path(str(tmp_path), worker_id)
+        record = _report_record(path, {"big": "body"}, {"big": "body"})
+        with open(records_path, "w") as f:
+            f.write(json.dumps(record) + "\n")
+        return {"openapi_records": records_path, "openapi_budget": [1, 0]}
+
+    # Workers finish in any order
+    for worker_id, path in (("gw1", "/b"), ("gw0", "/a")):
+        plugin.pytest_testnodedown(
+            SimpleNamespace(
+                config=config,
+                gateway=SimpleNamespace(id=worker_id),
+                workeroutput=worker_output(worker_id, path),
+            ),
+            None,
+        )
+
+    records = []
+    records_file = tmp_path / "records.jsonl"
+    configure_records(path=str(records_file))
+    try:
+        with patch.object(contract, "test_reports", records):
+            plugin._merge_worker_outputs(config)
+    finally:
+        close_records()
+        configure_records()
+
+    assert [r["path"] for r in records] == ["/a", "/b"]
+    assert config._openapi_budget_ran == 2
+    assert config._openapi_worker_outputs == {}
+    # Merged records went to the records file and left memory
+    assert all(r["actual_body"] is None for r in records)
+    lines = records_file.read_text().splitlines()
+    assert [json.loads(line)["actual_body"] for line in lines] == [
+        {"big": "body"},
+        {"big": "body"},
+    ]
+
+
+def test_xdist_controller_keeps_an_explicit_dist(capsys):
+    """Only the load scheduling implied by -n is switched to loadgroup."""
+    import shutil
+    from types import SimpleNamespace
+
+    from pytest_openapi import plugin
+
+    def controller(explicit, dist):
+        config = SimpleNamespace(
+            known_args_namespace=SimpleNamespace(dist=explicit),
+            option=SimpleNamespace(dist=dist),
+            getoption=lambda name: "4",
+        )
+        plugin._configure_xdist_controller(config)
+        shutil.rmtree(config._openapi_worker_dir)
+        return config.option.dist
+
+    assert controller("no", "load") == "loadgroup"
+    assert "Warning" not in capsys.readouterr().out
+
+    assert controller("load", "load") == "load"
+    assert "use --dist loadgroup" in capsys.readouterr().out
+
+    assert controller("loadgroup", "loadgroup") == "loadgroup"
+    assert "Warning" not in capsys.readouterr().out
+
+    assert controller("worksteal", "worksteal") == "worksteal"
+    assert "--openapi-concurrency is ignored" in capsys.readouterr().out
+
+
+def test_worker_phase_only_holds_items_scheduled_to_it():
+    """On an xdist worker, a concurrent phase never includes the items
+    that the controller scheduled to other workers."""
+    import contextlib
+    import threading
+    from collections import deque
+    from types import SimpleNamespace
+
+    from pytest_openapi import plugin
+
+    items = []
+    for index in range(6):
+        items.append(
+            SimpleNamespace(
+                _openapi_check=lambda: (True, None),
+                _openapi_method="post",
+                index=index,
+            )
+        )
+
+    class Queue:
+        def __init__(self, indices):
+            self.items = deque(indices)
+            self.mutex = threading.RLock()
+
+        @contextlib.contextmanager
+        def lock(self):
+            with self.mutex:
+                yield self.items
+
+    shutdown = object()
+    worker = SimpleNamespace(
+        item_index=1, nextitem_index=3, torun=Queue([4, shutdown])
+    )
+    session = SimpleNamespace(
+        items=items,
+        config=SimpleNamespace(
+            _openapi_results={}, _openapi_xdist_worker=worker
+        ),
+    )
+
+    phase = plugin._current_phase(session, items[1]._openapi_check)
+    assert [item.index for item in phase] == [1, 3, 4]
+
+    # Outside xdist, the phase runs over the collected items
+    session.config._openapi_xdist_worker = None
+    phase = plugin._current_phase(session, items[1]._openapi_check)
+    assert [item.index for item in phase] == [1, 2, 3, 4, 5]
+
+
+# ---------------------------------------------------------------------------
+# sharding tests
+# ---------------------------------------------------------------------------
+
+
+def _shard_test_plan():
+    from pytest_openapi.plan import make_plan_entry
+
+    plan = []
+    for method, path, cases in (
+        ("get", "/a", 1),
+        ("get", "/b", 1),
+        ("post", "/a", 6),
+        ("post", "/b", 3),
+        ("delete", "/a", 1),
+    ):
+        for i in range(cases):
+            plan.append(make_plan_entry(method, path, {}, i, None))
+    return plan
+
+
+def test_parse_shard():
+    from pytest_openapi.plan import parse_shard
+
+    assert parse_shard("2/10") == (2, 10)
+    for bad in ("3", "0/2", "3/2", "a/b", "1/0"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_shard_plan_balances_whole_operations():
+    """Shards partition the plan by operation, balanced by cost."""
+    from pytest_openapi.plan import shard_plan
+
+    plan = _shard_test_plan()
+    shards = [shard_plan(plan, i, 2) for i in (1, 2)]
+
+    # Every entry lands on exactly one shard, in collection order
+    assert sorted(map(id, shards[0] + shards[1])) == sorted(map(id, plan))
+    for shard in shards:
+        assert shard == [e for e in plan if e in shard]
+
+    def operations(shard):
+        return {f"{e['method'].upper()} {e['path']}" for e in shard}
+
+    # By case count: 6 cases of POST /a vs 3 + 1 + 1 + 1 for the rest
+    assert operations(shards[0]) == {"POST /a"}
+    assert len(shards[1]) == 6
+
+    # With history, a slow GET outweighs the larger POSTs
+    durations = {"GET /b": 1000.0, "POST /a": 10.0, "POST /b": 10.0}
+    slow_first = shard_plan(plan, 1, 2, durations)
+    assert operations(slow_first) == {"GET /b"}
+
+
+def test_shard_durations_only_come_from_the_shared_baseline():
+    """A node's own pytest cache must not change the split."""
+    from types import SimpleNamespace
+
+    from pytest_openapi.plugin import _operation_durations
+
+    cache = MagicMock()
+    cache.get.return_value = {"GET /b": 1000.0}
+    config = SimpleNamespace(_openapi_baseline=None, cache=cache)
+    assert _operation_durations(config) == {}
+
+    config._openapi_baseline = {
+        "operations": {"DELETE /a/{id}": {"p50": 12.5, "count": 1}}
+    }
+    assert _operation_durations(config) == {"DELETE /a/{id}": 12.5}
+
+
+def test_latency_keys_use_the_operation_path_template():
+    """DELETE/PUT records send a resolved path but are keyed by template."""
+    from pytest_openapi.contract import captured_test_results, log_test_result
+    from pytest_openapi.latency import latency_by_operation
+
+    with captured_test_results() as records:
+        log_test_result(
+            "DELETE",
+            "/a/42",
+            None,
+            204,
+            None,
+            204,
+            None,
+            True,
+            operation_path="/a/{id}",
+        )
+    records[0]["timing"] = {
+        "total_ms": 5.0,
+        "ttfb_ms": 4.0,
+        "connect_ms": 0.0,
+        "size_bytes": 0,
+    }
+
+    assert records[0]["path"] == "/a/42"
+    assert list(latency_by_operation(records)) == ["DELETE /a/{id}"]
+
+
+# ---------------------------------------------------------------------------
+# changed-since tests
+# ---------------------------------------------------------------------------
+
+
+def _changed_since_spec():
+    return {
+        "openapi": "3.0.0",
+        "paths": {
+            "/books": {
+                "get": {
+                    "summary": "List books",
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "array",
+                                        "items": {
+                                            "$ref": "#/components/schemas/Book"
+                                        },
+                                    }
+                                }
+                            },
+                        }
+                    },
+                },
+                "post": {
+                    "requestBody": {
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "$ref": "#/components/schemas/NewBook"
+                                },
+                                "example": {"title": "Dune"},
+                            }
+                        }
+                    },
+                    "responses": {"201": {"description": "Created"}},
+                },
+            },
+            "/authors/{id}": {
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "integer"},
+                    }
+                ],
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "$ref": "#/components/schemas/Author"
+                                    }
+                                }
+                            },
+                        }
+                    }
+                },
+            },
+        },
+        "components": {
+            "schemas": {
+                "Book": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string"},
+                        "author": {"$ref": "#/components/schemas/Author"},
+                    },
+                },
+                "NewBook": {
+                    "type": "object",
+                    "properties": {"title": {"type": "string"}},
+                },
+                # Recursive: an author lists their books
+                "Author": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "books": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Book"},
+                        },
+                    },
+                },
+            }
+        },
+    }
+
+
+def test_changed_operations_ignores_documentation():
+    from pytest_openapi.specdiff import changed_operations
+
+    previous = _changed_since_spec()
+    current = _changed_since_spec()
+    current["paths"]["/books"]["get"]["summary"] = "All the books"
+    current["paths"]["/books"]["get"]["tags"] = ["books"]
+
+    assert changed_operations(previous, current) == set()
+
+
+def test_changed_operations_follows_refs_through_cycles():
+    """A change deep in a shared schema reaches every operation using it."""
+    from pytest_openapi.specdiff import changed_operations
+
+    previous = _changed_since_spec()
+    current = _changed_since_spec()
+    current["components"]["schemas"]["Author"]["properties"]["name"][
+        "type"
+    ] = "integer"
+
+    assert changed_operations(previous, current) == {
+        "GET /books",
+        "GET /authors/{id}",
+    }
+
+    current = _changed_since_spec()
+    current["paths"]["/authors/{id}"]["parameters"][0]["schema"] = {
+        "type": "string"
+    }
+    current["paths"]["/books"]["post"]["requestBody"]["content"][
+        "application/json"
+    ]["example"] = {"title": "Emma"}
+    current["paths"]["/reviews"] = {"get": {"responses": {}}}
+
+    assert changed_operations(previous, current) == {
+        "GET /authors/{id}",
+        "POST /books",
+        "GET /reviews",
+    }
+
+
+def test_select_changed_keeps_smoke_operations():
+    from pytest_openapi.plan import make_plan_entry, select_changed
+
+    def plan(smoke_path=None):
+        entries = []
+        for method, path in (
+            ("get", "/books"),
+            ("get", "/books/{id}"),
+            ("post", "/books"),
+            ("delete", "/books/{id}"),
+        ):
+            operation = {}
+            if path == smoke_path and method == "delete":
+                operation["x-pytest-openapi"] = {"smoke": True}
+            entries.append(make_plan_entry(method, path, operation))
+        return entries
+
+    def operations(entries):
+        return [f"{e['method'].upper()} {e['path']}" for e in entries]
+
+    # Default smoke subset: GET operations without path parameters
+    assert operations(select_changed(plan(), {"POST /books"})) == [
+        "GET /books",
+        "POST /books",
+    ]
+
+    # Flagged operations replace the default subset
+    assert operations(
+        select_changed(plan("/books/{id}"), {"GET /books/{id}"})
+    ) == ["GET /books/{id}", "DELETE /books/{id}"]
+
+
+# ---------------------------------------------------------------------------
+# option parsing tests
+# ---------------------------------------------------------------------------
+
+
+def test_int_option_validates_minimum():
+    """Unset options are None; invalid or too small values exit with 2."""
+    from types import SimpleNamespace
+
+    from pytest_openapi.plugin import _float_option, _int_option
+
+    options = {"--n": "3", "--unset": None, "--zero": "0", "--bad": "x"}
+    config = SimpleNamespace(getoption=options.get)
+
+    assert _int_option(config, "--n", 1) == 3
+    assert _int_option(config, "--unset", 1) is None
+    assert _int_option(config, "--zero", 0) == 0
+    for name in ("--zero", "--bad"):
+        with pytest.raises(pytest.exit.Exception) as exc_info:
+            _int_option(config, name, 1)
+        assert exc_info.value.returncode == 2
+        assert name in str(exc_info.value)
+
+    assert _float_option(config, "--zero", 0) == 0.0
+    with pytest.raises(pytest.exit.Exception):
+        _float_option(config, "--zero", 0, exclusive=True)